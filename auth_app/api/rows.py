@@ -0,0 +1,58 @@
+"""
+Read-only fast path producing the same output as UserNestedSerializer.
+
+Rows come from QuerySet.values() and are turned into plain dicts without
+instantiating models or serializer fields.
+"""
+
+USER_COLUMNS = ['id', 'email', 'first_name', 'last_name']
+
+
+def user_columns(prefix):
+    """
+    Name the value columns needed to build a nested user from a relation.
+
+    Args:
+        prefix (str): Relation name, e.g. 'assignee'.
+
+    Returns:
+        list[str]: Column lookups such as 'assignee__email'.
+    """
+    return [f'{prefix}__{column}' for column in USER_COLUMNS]
+
+
+def fullname(first_name, last_name, email):
+    """
+    Compute the display name exactly like UserNestedSerializer.get_fullname.
+
+    Args:
+        first_name (str): User first name.
+        last_name (str): User last name.
+        email (str): Fallback if both names are empty.
+
+    Returns:
+        str: "First Last", or the email address.
+    """
+    return f'{first_name} {last_name}'.strip() or email
+
+
+def user_row(row, prefix=''):
+    """
+    Build the nested user dict from a values() row.
+
+    Args:
+        row (dict): Row containing the USER_COLUMNS, optionally prefixed.
+        prefix (str): Column prefix including the separator, e.g. 'assignee__'.
+
+    Returns:
+        dict | None: {'id', 'email', 'fullname'}, or None if the relation is empty.
+    """
+    user_id = row[f'{prefix}id']
+    if user_id is None:
+        return None
+    email = row[f'{prefix}email']
+    return {
+        'id': user_id,
+        'email': email,
+        'fullname': fullname(row[f'{prefix}first_name'], row[f'{prefix}last_name'], email),
+    }
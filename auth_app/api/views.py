@@ -21,10 +21,12 @@ class RegistrationView(generics.CreateAPIView):
 
     Attributes:
         permission_classes (list): Permissions for this view (AllowAny).
+        throttle_scope (str): Rate limit group (see core.throttling).
         serializer_class (Serializer): Serializer for input validation.
         queryset (QuerySet): Base queryset required by CreateAPIView.
     """
     permission_classes = [AllowAny]
+    throttle_scope = 'auth'
     serializer_class = RegistrationSerializer
     queryset = User.objects.all()
 
@@ -144,9 +146,11 @@ class CustomLoginView(generics.GenericAPIView):
 
     Attributes:
         permission_classes (list): Permissions for this view (AllowAny).
+        throttle_scope (str): Rate limit group (see core.throttling).
         serializer_class (Serializer): Serializer for input validation.
     """
     permission_classes = [AllowAny]
+    throttle_scope = 'auth'
     serializer_class = CustomLoginSerializer
 
     def post(self, request, *args, **kwargs):
@@ -229,9 +233,11 @@ class EmailCheckView(generics.GenericAPIView):
 
     Attributes:
         permission_classes (list): Permissions for this view (IsAuthenticated).
+        throttle_scope (str): Rate limit group (see core.throttling).
         serializer_class (Serializer): Serializer for query parameter validation.
     """
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'auth'
     serializer_class = EmailQuerySerializer
 
     def get(self, request, *args, **kwargs):
@@ -0,0 +1,34 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class BatchOperationSerializer(serializers.Serializer):
+    """
+    Serializer for one operation of a batch.
+
+    Fields:
+        method (str): HTTP method of the sub-request.
+        path (str): Absolute API path, optionally with a query string,
+            e.g. '/api/tasks/5/comments/'.
+        body (any): JSON request body, omitted for GET and DELETE.
+        headers (dict): Extra request headers, e.g. If-Match.
+    """
+    method = serializers.ChoiceField(choices=['GET', 'POST', 'PUT', 'PATCH', 'DELETE'])
+    path = serializers.CharField(max_length=2000)
+    body = serializers.JSONField(required=False, allow_null=True)
+    headers = serializers.DictField(child=serializers.CharField(max_length=1000), required=False)
+
+
+class BatchSerializer(serializers.Serializer):
+    """
+    Serializer for a batch request.
+
+    Fields:
+        operations (list): Operations run in order, at most
+            settings.BATCH_MAX_OPERATIONS.
+        atomic (bool): Run all operations in one transaction, default False.
+    """
+    operations = serializers.ListField(
+        child=BatchOperationSerializer(), allow_empty=False, max_length=settings.BATCH_MAX_OPERATIONS,
+    )
+    atomic = serializers.BooleanField(required=False, default=False)
@@ -0,0 +1,49 @@
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from core.decorators import handle_exceptions
+from .serializers import BatchSerializer
+
+
+class BatchView(generics.GenericAPIView):
+    """
+    API endpoint that runs several API calls in one round trip.
+
+    POST:
+      - Accepts {"operations": [{method, path, body, headers}, ...], "atomic": bool}.
+      - Authenticates once and runs every operation in-process against the
+        routes of core/api_urls.py as the requesting user.
+      - Returns one {status, headers, body} entry per operation, in order.
+
+    Attributes:
+        permission_classes (list): Requires authentication.
+        serializer_class (Serializer): Serializer for the batch payload.
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = BatchSerializer
+
+    @handle_exceptions(action='running batch')
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST request to run a batch.
+
+        Operations run sequentially. Failing operations are reported in their
+        own entry and do not stop a non-atomic batch. An atomic batch stops at
+        the first operation with status >= 400, rolls back the operations
+        before it, and reports the rest with status 424.
+
+        Args:
+            request (Request): DRF request with the batch payload.
+
+        Returns:
+            Response: HTTP 200 with the list of results; for an aborted atomic
+                batch the status of the failing operation with the same list;
+                HTTP 400 if the payload is invalid.
+        """
+        from batch_app.executor import run_batch
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results, failed = run_batch(request, **serializer.validated_data)
+        return Response(results, status=failed['status'] if failed else status.HTTP_200_OK)
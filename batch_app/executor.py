@@ -0,0 +1,217 @@
+"""
+In-process execution of batched API sub-requests.
+
+Each operation is turned into a plain HttpRequest, resolved against
+core.api_urls and handed straight to the view, bypassing the middleware
+stack. The user and token the batch request was authenticated with are
+forced onto every sub-request, so authentication runs once per batch.
+JSON response bodies are embedded as PreEncoded fragments and are not
+decoded again.
+
+Because the middleware is bypassed, sub-requests get no rate limit headers
+and are not compressed on their own, and execute() records their request
+count and latency in core.metrics under the operation's route itself. Their
+database queries are counted under the batch route. Views that stream their
+response (the NDJSON export) are rejected, since their body would have to be
+buffered into the batch response.
+"""
+import io
+import json
+import time
+
+from django.db import transaction
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+
+from core import metrics
+from core.middleware import route_name
+from core.renderers import PreEncoded
+
+API_PREFIX = '/api/'
+API_URLCONF = 'core.api_urls'
+
+# Request headers a sub-request never inherits from the batch request.
+# Idempotency-Key and Prefer describe a single operation, so they are only
+# honoured when given in that operation's own headers.
+DROPPED_META = {
+    'CONTENT_LENGTH', 'CONTENT_TYPE', 'QUERY_STRING', 'PATH_INFO', 'REQUEST_METHOD',
+    'HTTP_AUTHORIZATION', 'HTTP_COOKIE', 'HTTP_ACCEPT', 'HTTP_ACCEPT_ENCODING',
+    'HTTP_IF_MATCH', 'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_IF_UNMODIFIED_SINCE',
+    'HTTP_IDEMPOTENCY_KEY', 'HTTP_PREFER',
+}
+
+# Per-operation headers that may not be overridden.
+FORBIDDEN_HEADERS = {'authorization', 'cookie', 'content-type', 'content-length', 'host'}
+
+# Response headers left out of the per-operation results.
+HIDDEN_RESPONSE_HEADERS = {'content-type', 'content-length', 'vary', 'allow', 'x-frame-options'}
+
+SKIPPED = {'status': 424, 'headers': {}, 'body': {'detail': 'Not executed because an earlier operation failed.'}}
+
+
+class BatchError(Exception):
+    """
+    An operation that cannot be dispatched, reported as its own response.
+
+    Attributes:
+        status (int): HTTP status reported for the operation.
+        detail (str): Error message.
+    """
+    def __init__(self, status, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def resolve_operation(path):
+    """
+    Resolve a batched path against the API routes.
+
+    Args:
+        path (str): Absolute path below /api/, without query string.
+
+    Raises:
+        BatchError: If the path is outside the API, unknown, or the batch endpoint itself.
+
+    Returns:
+        ResolverMatch: The matched view and its arguments.
+    """
+    if not path.startswith(API_PREFIX):
+        raise BatchError(400, f'Path must start with {API_PREFIX}.')
+    try:
+        match = resolve(path[len(API_PREFIX) - 1:], urlconf=API_URLCONF)
+    except Resolver404:
+        raise BatchError(404, 'Not found.')
+    if match.url_name == 'batch':
+        raise BatchError(400, 'Batch requests cannot be nested.')
+    return match
+
+
+def build_request(request, operation, match):
+    """
+    Build the HttpRequest for one operation.
+
+    Args:
+        request (Request): The authenticated batch request.
+        operation (dict): Validated operation (method, path, body, headers).
+        match (ResolverMatch): Resolved view of the operation.
+
+    Returns:
+        HttpRequest: Sub-request carrying the batch request's authentication.
+    """
+    path, _, query = operation['path'].partition('?')
+    raw = b'' if operation.get('body') is None else json.dumps(operation['body']).encode()
+
+    sub = HttpRequest()
+    sub.method = operation['method']
+    sub.path = sub.path_info = path
+    sub.resolver_match = match
+    sub.META = {key: value for key, value in request.META.items() if key not in DROPPED_META}
+    sub.META.update({
+        'REQUEST_METHOD': sub.method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'HTTP_ACCEPT': 'application/json',
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(raw)),
+    })
+    for name, value in operation.get('headers', {}).items():
+        if name.lower() not in FORBIDDEN_HEADERS:
+            sub.META['HTTP_' + name.upper().replace('-', '_')] = value
+    sub.GET = QueryDict(query)
+    sub.content_type = 'application/json'
+    sub._stream = io.BytesIO(raw)
+    sub._read_started = False
+    sub.user = request.user
+    sub._force_auth_user = request.user
+    sub._force_auth_token = request.auth
+    return sub
+
+
+def response_entry(response):
+    """
+    Convert a view response into a batch result.
+
+    Args:
+        response (HttpResponseBase): Response returned by the view.
+
+    Returns:
+        dict: {'status', 'headers', 'body'}; JSON bodies are embedded as
+            PreEncoded, other bodies as text, empty bodies as None.
+    """
+    if hasattr(response, 'render') and not response.is_rendered:
+        response.render()
+    content = response.content
+    content_type = response.get('Content-Type', '')
+    if not content:
+        body = None
+    elif content_type.startswith('application/json'):
+        body = PreEncoded(content)
+    else:
+        body = content.decode(response.charset, errors='replace')
+    headers = {name: value for name, value in response.items() if name.lower() not in HIDDEN_RESPONSE_HEADERS}
+    return {'status': response.status_code, 'headers': headers, 'body': body}
+
+
+def execute(request, operation):
+    """
+    Run one operation and return its result.
+
+    Args:
+        request (Request): The authenticated batch request.
+        operation (dict): Validated operation.
+
+    Returns:
+        dict: Result as built by response_entry().
+    """
+    started = time.perf_counter()
+    try:
+        match = resolve_operation(operation['path'].partition('?')[0])
+    except BatchError as error:
+        return {'status': error.status, 'headers': {}, 'body': {'detail': error.detail}}
+    sub = build_request(request, operation, match)
+    response = match.func(sub, *match.args, **match.kwargs)
+    if response.streaming:
+        response.close()
+        result = {'status': 400, 'headers': {}, 'body': {'detail': 'Streaming responses cannot be batched.'}}
+    else:
+        result = response_entry(response)
+    route = route_name(sub)
+    metrics.http_requests.inc(route=route, method=sub.method, status=result['status'])
+    metrics.http_request_duration.observe(time.perf_counter() - started, route=route)
+    return result
+
+
+def run_batch(request, operations, atomic=False):
+    """
+    Run the operations of a batch in order.
+
+    Without `atomic`, every operation runs and commits independently. With
+    `atomic`, all operations share one transaction; the first operation with
+    a status of 400 or higher rolls it back, and the remaining operations are
+    reported with status 424 without being executed.
+
+    Args:
+        request (Request): The authenticated batch request.
+        operations (list[dict]): Validated operations.
+        atomic (bool): Run all operations in a single transaction.
+
+    Returns:
+        tuple[list[dict], dict | None]: Results in operation order, and the
+            result of the operation that aborted an atomic batch, if any.
+    """
+    if not atomic:
+        return [execute(request, operation) for operation in operations], None
+
+    results, failed = [], None
+    with transaction.atomic():
+        for operation in operations:
+            if failed is not None:
+                results.append(SKIPPED)
+                continue
+            result = execute(request, operation)
+            results.append(result)
+            if result['status'] >= 400:
+                failed = result
+                transaction.set_rollback(True)
+    return results, failed
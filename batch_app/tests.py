@@ -0,0 +1,108 @@
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board
+from core import metrics
+from ticket_app.models import Ticket
+
+
+class BatchTests(APITestCase):
+    """
+    Tests for running several API calls through /api/batch/.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.ticket = Ticket.objects.create(board=self.board, title='t', status='to-do', priority='low', rank='m')
+        self.client.force_authenticate(self.user)
+
+    def batch(self, operations, **extra):
+        return self.client.post('/api/batch/', {'operations': operations, **extra}, format='json')
+
+    def test_ticket_modal_calls_in_one_request(self):
+        response = self.batch([
+            {'method': 'PATCH', 'path': f'/api/tasks/{self.ticket.id}/', 'body': {'title': 'renamed'}},
+            {'method': 'GET', 'path': f'/api/tasks/{self.ticket.id}/comments/'},
+            {'method': 'GET', 'path': '/api/email-check/?email=user@example.com'},
+            {'method': 'DELETE', 'path': '/api/tasks/0/'},
+        ])
+        self.assertEqual(response.status_code, 200)
+        results = response.json()
+        self.assertEqual([result['status'] for result in results], [200, 200, 200, 404])
+        self.assertEqual(results[0]['body']['title'], 'renamed')
+        self.assertEqual(results[1]['body'], [])
+        self.assertEqual(results[2]['body']['id'], self.user.id)
+
+    def test_atomic_batch_rolls_back_on_failure(self):
+        response = self.batch([
+            {'method': 'PATCH', 'path': f'/api/tasks/{self.ticket.id}/', 'body': {'title': 'renamed'}},
+            {'method': 'PATCH', 'path': f'/api/tasks/{self.ticket.id}/', 'body': {'priority': 'bogus'}},
+            {'method': 'DELETE', 'path': f'/api/tasks/{self.ticket.id}/'},
+        ], atomic=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result['status'] for result in response.json()], [200, 400, 424])
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.title, 't')
+
+    def test_rejects_paths_outside_the_api_and_nesting(self):
+        results = self.batch([
+            {'method': 'GET', 'path': '/admin/'},
+            {'method': 'POST', 'path': '/api/batch/', 'body': {'operations': []}},
+        ]).json()
+        self.assertEqual([result['status'] for result in results], [400, 400])
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(None)
+        response = self.batch([{'method': 'GET', 'path': '/api/dashboard/'}])
+        self.assertEqual(response.status_code, 401)
+
+    def test_idempotency_key_and_prefer_are_not_inherited(self):
+        payload = {'board': self.board.id, 'title': 'n', 'status': 'to-do', 'priority': 'low'}
+        results = self.client.post('/api/batch/', {'operations': [
+            {'method': 'POST', 'path': '/api/tasks/', 'body': payload},
+            {'method': 'POST', 'path': '/api/tasks/', 'body': {**payload, 'title': 'm'}},
+        ]}, format='json', HTTP_IDEMPOTENCY_KEY='outer').json()
+        self.assertEqual([result['status'] for result in results], [201, 201])
+        self.assertEqual(Ticket.objects.count(), 3)
+
+        other = Board.objects.create(title='Other', owner=self.user)
+        results = self.client.post('/api/batch/', {'operations': [
+            {'method': 'DELETE', 'path': f'/api/boards/{self.board.id}/'},
+            {'method': 'DELETE', 'path': f'/api/boards/{other.id}/', 'headers': {'Prefer': 'respond-async'}},
+        ]}, format='json', HTTP_PREFER='respond-async').json()
+        self.assertEqual([result['status'] for result in results], [204, 202])
+        self.assertFalse(Board.objects.filter(pk=self.board.id).exists())
+
+    def test_operation_idempotency_key_is_honoured(self):
+        payload = {'board': self.board.id, 'title': 'n', 'status': 'to-do', 'priority': 'low'}
+        operation = {'method': 'POST', 'path': '/api/tasks/', 'body': payload, 'headers': {'Idempotency-Key': 'op'}}
+        results = self.batch([operation, operation]).json()
+        self.assertEqual([result['status'] for result in results], [201, 201])
+        self.assertEqual(results[1]['headers']['Idempotent-Replayed'], 'true')
+        self.assertEqual(Ticket.objects.count(), 2)
+
+    def test_atomic_rollback_leaves_no_cached_board_detail(self):
+        url = f'/api/boards/{self.board.id}/'
+        self.client.get(url)
+        response = self.batch([
+            {'method': 'PATCH', 'path': url, 'body': {'title': 'GHOST'}},
+            {'method': 'GET', 'path': url},
+            {'method': 'PATCH', 'path': f'/api/tasks/{self.ticket.id}/', 'body': {'priority': 'bogus'}},
+        ], atomic=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()[1]['body']['title'], 'GHOST')
+        self.assertEqual(self.client.get(url).json()['title'], 'Board')
+
+    def test_streaming_views_are_rejected(self):
+        results = self.batch([
+            {'method': 'GET', 'path': f'/api/boards/{self.board.id}/export/'},
+            {'method': 'GET', 'path': '/api/boards/'},
+        ]).json()
+        self.assertEqual([result['status'] for result in results], [400, 200])
+        self.assertEqual(results[0]['body']['detail'], 'Streaming responses cannot be batched.')
+
+    def test_operations_are_recorded_in_metrics(self):
+        key = 'http_requests\troute="board-list",method="GET",status="200"'
+        before = metrics.collect().get(key, 0)
+        self.batch([{'method': 'GET', 'path': '/api/boards/'}, {'method': 'GET', 'path': '/api/boards/'}])
+        self.assertEqual(metrics.collect()[key], before + 2)
@@ -0,0 +1,33 @@
+from rest_framework.exceptions import PermissionDenied, NotFound
+
+from boards_app.models import Board
+
+
+class BoardAccessMixin:
+    """
+    Mixin to enforce that the requesting user has access to a specific board.
+
+    Provides:
+        get_board(): Retrieves the Board instance by primary key from URL kwargs
+                     and enforces that the requesting user is either the board
+                     owner or one of its members.
+    """
+    def get_board(self):
+        """
+        Retrieve the Board object specified in URL kwargs and enforce access control.
+
+        Returns:
+            Board: The retrieved and authorized Board instance.
+
+        Raises:
+            NotFound:         If no Board with the given ID exists.
+            PermissionDenied: If the user is not the board owner or a member.
+        """
+        try:
+            board = Board.objects.select_related('owner').get(pk=self.kwargs.get('pk'))
+        except Board.DoesNotExist:
+            raise NotFound('Board not found.')
+        user = self.request.user
+        if not (board.owner_id == user.id or board.members.filter(id=user.id).exists()):
+            raise PermissionDenied('You do not have permission to view/modify this board.')
+        return board
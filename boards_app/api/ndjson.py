@@ -0,0 +1,366 @@
+"""
+Streaming NDJSON export and import of a board with members, tickets and comments.
+
+Each line is one JSON object with a "type" of 'board', 'member', 'ticket' or
+'comment', in that order. Users are referenced by email so that exports can be
+imported into another environment; ids of tickets are only used to link
+comments to their ticket within the stream.
+"""
+import json
+
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from boards_app.models import Board
+from ticket_app.models import Ticket
+from ticket_app.ranking import rebalance_column
+from comments_app.models import Comment
+from comments_app.counters import rebuild_comments_counts
+
+EXPORT_CHUNK_SIZE = 2000
+IMPORT_BATCH_SIZE = 1000
+
+
+def _line(obj):
+    """
+    Encode one record as an NDJSON line.
+
+    Args:
+        obj (dict): Record to encode.
+
+    Returns:
+        bytes: UTF-8 JSON followed by a newline.
+    """
+    return (json.dumps(obj, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n').encode()
+
+
+def export_board(board, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield a board and all related rows as NDJSON lines.
+
+    Rows are read with server-side chunked iteration, so memory use does not
+    depend on board size.
+
+    Args:
+        board (Board): Board to export.
+        chunk_size (int): Rows fetched per database round trip.
+
+    Yields:
+        bytes: One encoded line per record.
+    """
+    yield _line({
+        'type': 'board', 'id': board.id, 'title': board.title,
+        'owner': board.owner.email, 'created_at': board.created_at,
+    })
+    members = board.members.order_by('id').values('id', 'email', 'first_name', 'last_name')
+    for row in members.iterator(chunk_size=chunk_size):
+        yield _line({'type': 'member', **row})
+    tickets = board.tickets.order_by('id').values(
+        'id', 'title', 'description', 'status', 'priority', 'rank', 'due_date',
+        'assignee__email', 'reviewer__email',
+    )
+    for row in tickets.iterator(chunk_size=chunk_size):
+        yield _line({
+            'type': 'ticket',
+            'id': row['id'], 'title': row['title'], 'description': row['description'],
+            'status': row['status'], 'priority': row['priority'], 'rank': row['rank'],
+            'due_date': row['due_date'],
+            'assignee': row['assignee__email'], 'reviewer': row['reviewer__email'],
+        })
+    comments = Comment.objects.filter(task__board=board).order_by('id').values(
+        'id', 'task_id', 'author__email', 'content', 'created_at',
+    )
+    for row in comments.iterator(chunk_size=chunk_size):
+        yield _line({
+            'type': 'comment', 'id': row['id'], 'ticket': row['task_id'],
+            'author': row['author__email'], 'content': row['content'], 'created_at': row['created_at'],
+        })
+
+
+class BoardImporter:
+    """
+    Incrementally import an NDJSON board stream for a user.
+
+    Records are buffered and written with bulk_create in batches. Only the
+    mapping of exported to new ticket ids and of member emails to user ids is
+    kept in memory. Users are matched by email and never created; assignees
+    and reviewers that are not members of the imported board are dropped, and
+    comments by unknown authors are attributed to the importing user. Comment
+    timestamps are set at import time, and the tickets' comment counters are
+    recomputed once all comments are written.
+
+    Attributes:
+        user (User): Importing user, becomes the owner of the new board.
+        batch_size (int): Rows per bulk insert.
+        board (Board): The created board, once the board line was read.
+        counts (dict): Number of imported records per type.
+    """
+    TYPES = ['board', 'member', 'ticket', 'comment']
+
+    def __init__(self, user, batch_size=IMPORT_BATCH_SIZE):
+        self.user = user
+        self.batch_size = batch_size
+        self.board = None
+        self.counts = {'members': 0, 'tasks': 0, 'comments': 0}
+        self.member_ids = {user.email: user.id} if user.email else {}
+        self.ticket_ids = {}
+        self.pending_members, self.pending_tickets, self.pending_comments = [], [], []
+        self.unranked_statuses = set()
+        self.last_type = 0
+
+    def run(self, lines):
+        """
+        Consume all lines and write the board.
+
+        Must be called inside a transaction so that a failing line rolls back
+        the partial import.
+
+        Args:
+            lines (Iterable[bytes]): NDJSON lines.
+
+        Raises:
+            ValidationError: On malformed lines, out-of-order records or invalid values.
+
+        Returns:
+            Board: The imported board.
+        """
+        for number, raw in enumerate(lines, start=1):
+            if not raw.strip():
+                continue
+            self.handle(self.parse(raw, number), number)
+        if self.board is None:
+            raise ValidationError({'detail': 'The stream does not contain a board.'})
+        self.flush_members()
+        self.flush_tickets()
+        self.flush_comments()
+        if self.counts['comments']:
+            rebuild_comments_counts(self.board.tickets.all(), batch_size=self.batch_size)
+        for status in self.unranked_statuses:
+            rebalance_column(self.board.id, status)
+        return self.board
+
+    def parse(self, raw, number):
+        """
+        Decode one line and check its record type and order.
+
+        Args:
+            raw (bytes): Raw line.
+            number (int): Line number for error messages.
+
+        Raises:
+            ValidationError: If the line is not a JSON object of a known type in order.
+
+        Returns:
+            dict: Decoded record.
+        """
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            raise ValidationError({'detail': f'Line {number}: invalid JSON.'})
+        kind = record.get('type') if isinstance(record, dict) else None
+        if kind not in self.TYPES:
+            raise ValidationError({'detail': f'Line {number}: unknown record type {kind!r}.'})
+        order = self.TYPES.index(kind)
+        if order < self.last_type or (kind == 'board') == (self.board is not None):
+            raise ValidationError({'detail': f'Line {number}: unexpected {kind!r} record.'})
+        self.last_type = order
+        return record
+
+    def handle(self, record, number):
+        """
+        Buffer a record and flush buffers that are full.
+
+        Args:
+            record (dict): Decoded record.
+            number (int): Line number for error messages.
+        """
+        kind = record['type']
+        if kind == 'board':
+            title = self.text(record, 'title', number) or 'Imported board'
+            self.board = Board.objects.create(title=title, owner=self.user)
+            Board.members.through.objects.create(board_id=self.board.id, user_id=self.user.id)
+        elif kind == 'member':
+            email = self.text(record, 'email', number)
+            if email:
+                self.pending_members.append(email)
+            if len(self.pending_members) >= self.batch_size:
+                self.flush_members()
+        elif kind == 'ticket':
+            self.flush_members()
+            self.pending_tickets.append(self.build_ticket(record, number))
+            if len(self.pending_tickets) >= self.batch_size:
+                self.flush_tickets()
+        else:
+            self.flush_tickets()
+            self.pending_comments.append(self.build_comment(record, number))
+            if len(self.pending_comments) >= self.batch_size:
+                self.flush_comments()
+
+    def build_ticket(self, record, number):
+        """
+        Build an unsaved Ticket from a record.
+
+        Args:
+            record (dict): Decoded ticket record.
+            number (int): Line number for error messages.
+
+        Raises:
+            ValidationError: If required fields are missing or invalid.
+
+        Returns:
+            tuple: (exported ticket id, unsaved Ticket).
+        """
+        statuses = {key for key, _ in Ticket.STATUS_CHOICES}
+        priorities = {key for key, _ in Ticket.PRIORITY_CHOICES}
+        status = self.text(record, 'status', number)
+        priority = self.text(record, 'priority', number)
+        if status not in statuses or priority not in priorities:
+            raise ValidationError({'detail': f'Line {number}: invalid ticket status or priority.'})
+        title = self.text(record, 'title', number)
+        if not title:
+            raise ValidationError({'detail': f'Line {number}: ticket title is required.'})
+        exported_id = record.get('id')
+        if exported_id is not None and not isinstance(exported_id, int):
+            raise ValidationError({'detail': f'Line {number}: ticket id must be an integer.'})
+        rank = self.text(record, 'rank', number)
+        if not rank:
+            self.unranked_statuses.add(status)
+        ticket = Ticket(
+            board=self.board, title=title, description=self.text(record, 'description', number),
+            status=status, priority=priority, rank=rank,
+            due_date=self.date(record, 'due_date', number),
+            assignee_id=self.member_ids.get(self.text(record, 'assignee', number)),
+            reviewer_id=self.member_ids.get(self.text(record, 'reviewer', number)),
+        )
+        return exported_id, ticket
+
+    def build_comment(self, record, number):
+        """
+        Build an unsaved Comment from a record.
+
+        Args:
+            record (dict): Decoded comment record.
+            number (int): Line number for error messages.
+
+        Raises:
+            ValidationError: If the comment references an unknown ticket or has no content.
+
+        Returns:
+            Comment: Unsaved comment.
+        """
+        ticket = record.get('ticket')
+        task_id = self.ticket_ids.get(ticket) if isinstance(ticket, int) else None
+        if task_id is None:
+            raise ValidationError({'detail': f'Line {number}: comment references an unknown ticket.'})
+        content = self.text(record, 'content', number)
+        if not content:
+            raise ValidationError({'detail': f'Line {number}: comment content is required.'})
+        author = self.text(record, 'author', number)
+        author_id = self.member_ids.get(author)
+        if author_id is None:
+            author_id = self.lookup_user(author) or self.user.id
+        return Comment(task_id=task_id, author_id=author_id, content=content)
+
+    def text(self, record, field, number):
+        """
+        Read an optional string field of a record.
+
+        Args:
+            record (dict): Decoded record.
+            field (str): Field name.
+            number (int): Line number for error messages.
+
+        Raises:
+            ValidationError: If the field holds something other than a string or null.
+
+        Returns:
+            str: The value, empty if missing or null.
+        """
+        value = record.get(field)
+        if value is None:
+            return ''
+        if not isinstance(value, str):
+            raise ValidationError({'detail': f'Line {number}: {field} must be a string.'})
+        return value
+
+    def date(self, record, field, number):
+        """
+        Read an optional ISO date field of a record.
+
+        Args:
+            record (dict): Decoded record.
+            field (str): Field name.
+            number (int): Line number for error messages.
+
+        Raises:
+            ValidationError: If the field is not a valid YYYY-MM-DD date.
+
+        Returns:
+            date | None: The parsed date, None if missing or empty.
+        """
+        value = self.text(record, field, number)
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({'detail': f'Line {number}: {field} must be a valid YYYY-MM-DD date.'})
+        return parsed
+
+    def lookup_user(self, email):
+        """
+        Resolve a non-member email to a user id, caching the result.
+
+        Args:
+            email (str): Email address.
+
+        Returns:
+            int | None: User id, or None if no such user exists.
+        """
+        if not email:
+            return None
+        if email not in self.member_ids:
+            self.member_ids[email] = User.objects.filter(email=email).values_list('id', flat=True).first()
+        return self.member_ids[email]
+
+    def flush_members(self):
+        """
+        Resolve buffered member emails and insert the membership rows.
+        """
+        if not self.pending_members:
+            return
+        users = dict(User.objects.filter(email__in=self.pending_members).values_list('email', 'id'))
+        Membership = Board.members.through
+        Membership.objects.bulk_create(
+            [Membership(board_id=self.board.id, user_id=user_id) for user_id in set(users.values())],
+            batch_size=self.batch_size, ignore_conflicts=True,
+        )
+        self.member_ids.update(users)
+        self.counts['members'] += len(set(users.values()) - {self.user.id})
+        self.pending_members = []
+
+    def flush_tickets(self):
+        """
+        Insert buffered tickets and remember their new ids.
+        """
+        if not self.pending_tickets:
+            return
+        created = Ticket.objects.bulk_create([ticket for _, ticket in self.pending_tickets])
+        for (old_id, _), ticket in zip(self.pending_tickets, created):
+            self.ticket_ids[old_id] = ticket.id
+        self.counts['tasks'] += len(created)
+        self.pending_tickets = []
+
+    def flush_comments(self):
+        """
+        Insert buffered comments.
+        """
+        if not self.pending_comments:
+            return
+        Comment.objects.bulk_create(self.pending_comments)
+        self.counts['comments'] += len(self.pending_comments)
+        self.pending_comments = []
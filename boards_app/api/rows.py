@@ -0,0 +1,267 @@
+"""
+Read-only fast path producing the same output as BoardDetailSerializer, and
+the normalized variant of it.
+
+The parity tests in boards_app/tests.py keep the output identical to the
+DRF serializer.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+
+from auth_app.api.rows import USER_COLUMNS, user_row
+from ticket_app.api.rows import NESTED_TICKET_FIELDS, USER_FIELDS, compile_fields, ticket_rows
+from ticket_app.models import Ticket
+
+DETAIL_INCLUDES = ['members', 'tasks']
+
+
+def encode_cursor(rank, ticket_id):
+    """
+    Build an opaque keyset cursor pointing after a ticket in its column.
+
+    Args:
+        rank (str): Rank key of the ticket.
+        ticket_id (int): Ticket primary key.
+
+    Returns:
+        str: Cursor of the form '<rank>:<id>'.
+    """
+    return f'{rank}:{ticket_id}'
+
+
+def decode_cursor(cursor):
+    """
+    Split a cursor built by encode_cursor().
+
+    Args:
+        cursor (str): Cursor string.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        tuple[str, int]: (rank, ticket id).
+    """
+    rank, separator, ticket_id = cursor.rpartition(':')
+    if not separator:
+        raise ValueError('Malformed cursor.')
+    return rank, int(ticket_id)
+
+
+def member_preview(board, limit=None):
+    """
+    Load the first members of a board and their total number.
+
+    One row more than the limit is read, so the COUNT query only runs when
+    the list is actually truncated.
+
+    Args:
+        board (Board): Board whose members are loaded.
+        limit (int, optional): Maximum number of members, defaults to
+            settings.BOARD_MEMBER_PREVIEW.
+
+    Returns:
+        tuple[list[dict], int]: Members ordered by id as values() rows, and
+            the total member count.
+    """
+    limit = settings.BOARD_MEMBER_PREVIEW if limit is None else limit
+    rows = list(board.members.order_by('id').values(*USER_COLUMNS)[:limit + 1])
+    if len(rows) <= limit:
+        return rows, len(rows)
+    return rows[:limit], board.members.count()
+
+
+def member_page(board, search=None, after=None, limit=50):
+    """
+    Load one page of board members, optionally filtered by a prefix.
+
+    The prefix matches the start of the email, first name or last name,
+    case-insensitively. Pages are keyed by user id.
+
+    Args:
+        board (Board): Board whose members are listed.
+        search (str, optional): Prefix to match.
+        after (int, optional): Return members with a larger id.
+        limit (int): Page size.
+
+    Returns:
+        dict: {'count': int, 'members': list[dict], 'next': id or None}, where
+            count is the number of matching members over all pages.
+    """
+    members = board.members.all()
+    if search:
+        members = members.filter(
+            Q(email__istartswith=search) | Q(first_name__istartswith=search) | Q(last_name__istartswith=search)
+        )
+    page = members.order_by('id')
+    if after is not None:
+        page = page.filter(id__gt=after)
+    rows = list(page.values(*USER_COLUMNS)[:limit + 1])
+    has_next = len(rows) > limit
+    return {
+        'count': members.count(),
+        'members': [user_row(row) for row in rows[:limit]],
+        'next': rows[limit - 1]['id'] if has_next else None,
+    }
+
+
+def column_tasks(board, per_status, user_ids=False):
+    """
+    Load the first tickets of every status column with one window query.
+
+    ROW_NUMBER() and COUNT() over a partition by status number the tickets
+    in rank order and count each column, so the column totals come with the
+    rows and no second query is needed.
+
+    Args:
+        board (Board): Board whose tickets are loaded.
+        per_status (int): Maximum number of tickets per column.
+        user_ids (bool): Render users as ids (see ticket_app.api.rows).
+
+    Returns:
+        tuple[list[dict], dict]: Tickets ordered by rank, and per status
+            {'total': int, 'next': cursor or None}.
+    """
+    columns, getters = compile_fields(NESTED_TICKET_FIELDS, user_ids)
+    column = {'partition_by': [F('status')]}
+    rows = (
+        board.tickets
+        .annotate(
+            position=Window(RowNumber(), order_by=[F('rank').asc(), F('id').asc()], **column),
+            column_total=Window(Count('id'), **column),
+        )
+        .filter(position__lte=per_status)
+        .order_by('rank', 'id')
+        .values(*columns, *[name for name in ('status', 'rank') if name not in columns], 'position', 'column_total')
+    )
+    summary = {key: {'total': 0, 'next': None} for key, _ in Ticket.STATUS_CHOICES}
+    tasks = []
+    for row in rows:
+        tasks.append({key: get(row) for key, get in getters})
+        info = summary[row['status']]
+        info['total'] = row['column_total']
+        if row['position'] == per_status and row['column_total'] > per_status:
+            info['next'] = encode_cursor(row['rank'], row['id'])
+    return tasks, summary
+
+
+def column_page(board, status, after=None, limit=25):
+    """
+    Load the next page of one status column after a cursor.
+
+    Pages are read with a keyset condition on (rank, id), served by the
+    (board, status, rank) index, so deep pages cost the same as the first.
+
+    Args:
+        board (Board): Board whose column is paged.
+        status (str): Status column.
+        after (str, optional): Cursor from a previous page or column summary.
+        limit (int): Page size.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        dict: {'tasks': list[dict], 'next': cursor or None}.
+    """
+    tickets = board.tickets.filter(status=status)
+    if after:
+        rank, ticket_id = decode_cursor(after)
+        tickets = tickets.filter(Q(rank__gt=rank) | Q(rank=rank, id__gt=ticket_id))
+    columns, getters = compile_fields(NESTED_TICKET_FIELDS)
+    rows = list(tickets.order_by('rank', 'id').values(*columns, 'rank')[:limit + 1])
+    last = rows[limit - 1] if len(rows) > limit else None
+    return {
+        'tasks': [{key: get(row) for key, get in getters} for row in rows[:limit]],
+        'next': encode_cursor(last['rank'], last['id']) if last else None,
+    }
+
+
+def board_detail_row(board, include=DETAIL_INCLUDES, per_status=None):
+    """
+    Serialize a board with its members and tickets into a plain dict.
+
+    Members are ordered by id and capped (see member_preview()); tickets are
+    ordered by rank. Each is loaded with one values() query.
+
+    Args:
+        board (Board): Board to serialize.
+        include (Iterable[str]): Which of 'members' and 'tasks' to include.
+        per_status (int, optional): Only include the first tickets of each
+            status column and add a 'task_columns' summary.
+
+    Returns:
+        dict: {'id', 'title', 'owner_id', 'members', 'member_count', 'tasks'},
+            restricted to the included parts.
+    """
+    data = {'id': board.id, 'title': board.title, 'owner_id': board.owner_id}
+    if 'members' in include:
+        members, member_count = member_preview(board)
+        data['members'] = [user_row(row) for row in members]
+        data['member_count'] = member_count
+    if 'tasks' in include and per_status:
+        data['tasks'], data['task_columns'] = column_tasks(board, per_status)
+    elif 'tasks' in include:
+        data['tasks'] = ticket_rows(board.tickets.order_by('rank', 'id'), NESTED_TICKET_FIELDS)
+    return data
+
+
+def board_detail_normalized(board, include=DETAIL_INCLUDES, per_status=None):
+    """
+    Serialize a board with users side-loaded once in an id-keyed map.
+
+    Members and tickets reference users by id only. Ticket users are read
+    from the foreign key columns; those who are not loaded as members are
+    fetched with one additional query.
+
+    Args:
+        board (Board): Board to serialize.
+        include (Iterable[str]): Which of 'members' and 'tasks' to include.
+        per_status (int, optional): See board_detail_row().
+
+    Returns:
+        dict: {'id', 'title', 'owner_id', 'members', 'member_count', 'tasks',
+            'users'} where 'members' is a capped list of user ids and 'users'
+            maps ids to {'id', 'email', 'fullname'}.
+    """
+    data = {'id': board.id, 'title': board.title, 'owner_id': board.owner_id}
+    users = {}
+    if 'members' in include:
+        members, member_count = member_preview(board)
+        users = {row['id']: user_row(row) for row in members}
+        data['members'] = list(users)
+        data['member_count'] = member_count
+    if 'tasks' in include and per_status:
+        data['tasks'], data['task_columns'] = column_tasks(board, per_status, user_ids=True)
+    elif 'tasks' in include:
+        data['tasks'] = ticket_rows(board.tickets.order_by('rank', 'id'), NESTED_TICKET_FIELDS, user_ids=True)
+    missing = {task[name] for task in data.get('tasks', []) for name in USER_FIELDS} - set(users) - {None}
+    if missing:
+        for row in User.objects.filter(id__in=missing).order_by('id').values(*USER_COLUMNS):
+            users[row['id']] = user_row(row)
+    data['users'] = users
+    return data
+
+
+def board_update_row(board):
+    """
+    Serialize a board after an update like BoardDetailAfterUpdateSerializer.
+
+    Args:
+        board (Board): The updated board.
+
+    Returns:
+        dict: {'id', 'title', 'owner_data', 'members_data', 'member_count'} with
+            members capped as in member_preview().
+    """
+    owner = User.objects.filter(pk=board.owner_id).values(*USER_COLUMNS).first()
+    members, member_count = member_preview(board)
+    return {
+        'id': board.id,
+        'title': board.title,
+        'owner_data': user_row(owner) if owner else None,
+        'members_data': [user_row(row) for row in members],
+        'member_count': member_count,
+    }
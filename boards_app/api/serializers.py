@@ -1,10 +1,12 @@
 from rest_framework import serializers
+from django.contrib.auth.models import User
 
 from boards_app.models import Board
 from ticket_app.models import Ticket
 from ticket_app.api.serializers import TicketBaseSerializer
 from ticket_app.api.serializer_mixins import TicketReadUsersMixin, CommentCountMixin
 from auth_app.api.serializers import UserNestedSerializer
+from .rows import DETAIL_INCLUDES, decode_cursor
 
 
 class BoardListSerializer(serializers.ModelSerializer):
@@ -17,22 +19,27 @@ class BoardListSerializer(serializers.ModelSerializer):
         owner_id (int): ID of the board owner, read‑only.
         member_count (int): Number of members on the board, read‑only.
         ticket_count (int): Total tickets on the board, read‑only.
-        tasks_to_do_count (int): Count of tickets with status 'todo', read‑only.
+        tasks_to_do_count (int): Count of tickets with status 'to-do', read‑only.
         tasks_high_prio_count (int): Count of tickets with priority 'high', read‑only.
+        status_counts (dict[str, int]): Ticket count per status, read‑only.
+        priority_counts (dict[str, int]): Ticket count per priority, read‑only.
     """
     id = serializers.IntegerField(read_only=True)
     title = serializers.CharField(read_only=True)
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     member_count = serializers.IntegerField(read_only=True)
     ticket_count = serializers.IntegerField(read_only=True)
     tasks_to_do_count = serializers.IntegerField(read_only=True)
     tasks_high_prio_count = serializers.IntegerField(read_only=True)
+    status_counts = serializers.DictField(child=serializers.IntegerField(), read_only=True)
+    priority_counts = serializers.DictField(child=serializers.IntegerField(), read_only=True)
 
     class Meta:
         model = Board
         fields = [
             'id', 'title', 'owner_id',
             'member_count', 'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count',
+            'status_counts', 'priority_counts',
         ]
 
 
@@ -62,11 +69,14 @@ class BoardDetailSerializer(serializers.ModelSerializer):
         id (int): Board primary key.
         title (str): Board title.
         owner_id (int): ID of the board owner, read‑only.
-        members (list[UserNestedSerializer]): List of board members.
+        members (list[UserNestedSerializer]): Board members, capped at
+            settings.BOARD_MEMBER_PREVIEW; the full list is paged by BoardMembersView.
+        member_count (int): Total number of members, read‑only.
         tasks (list[TicketNestedSerializer]): Nested ticket data under 'tasks'.
     """
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     members = UserNestedSerializer(many=True, read_only=True)
+    member_count = serializers.IntegerField(read_only=True)
     tasks = TicketNestedSerializer(many=True, read_only=True, source='tickets')
 
     class Meta:
@@ -76,6 +86,7 @@ class BoardDetailSerializer(serializers.ModelSerializer):
             'title',
             'owner_id',
             'members',
+            'member_count',
             'tasks',
         ]
 
@@ -88,10 +99,13 @@ class BoardDetailAfterUpdateSerializer(serializers.ModelSerializer):
         id (int): Board primary key.
         title (str): Board title.
         owner_data (UserNestedSerializer): Detailed owner info.
-        members_data (list[UserNestedSerializer]): Detailed member info.
+        members_data (list[UserNestedSerializer]): Detailed member info, capped
+            like BoardDetailSerializer.members.
+        member_count (int): Total number of members, read‑only.
     """
     owner_data = UserNestedSerializer(source='owner', read_only=True)
     members_data = UserNestedSerializer(source='members', many=True, read_only=True)
+    member_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -100,6 +114,7 @@ class BoardDetailAfterUpdateSerializer(serializers.ModelSerializer):
             'title',
             'owner_data',
             'members_data',
+            'member_count',
         ]
 
 
@@ -125,13 +140,103 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for updating board title or members.
 
+    `members` replaces the membership; `members_add` and `members_remove`
+    change it incrementally and may be combined with `members`. All referenced
+    user IDs are validated with a single query.
+
     Fields:
         title (str): New title for the board, optional.
         members (list[int]): New list of user IDs, write‑only, optional.
+        members_add (list[int]): User IDs to add, write‑only, optional.
+        members_remove (list[int]): User IDs to remove, write‑only, optional.
     """
     members = serializers.ListField(child=serializers.IntegerField(), write_only=True, required=False)
+    members_add = serializers.ListField(child=serializers.IntegerField(), write_only=True, required=False)
+    members_remove = serializers.ListField(child=serializers.IntegerField(), write_only=True, required=False)
     title = serializers.CharField(required=False)
 
     class Meta:
         model = Board
-        fields = ['title', 'members']
+        fields = ['title', 'members', 'members_add', 'members_remove']
+
+    def validate(self, attrs):
+        """
+        Ensure every user ID to be added as a member exists.
+
+        Args:
+            attrs (dict): Field-validated data.
+
+        Raises:
+            ValidationError: If any referenced user does not exist.
+
+        Returns:
+            dict: The validated data.
+        """
+        ids = set(attrs.get('members', [])) | set(attrs.get('members_add', []))
+        if ids:
+            existing = set(User.objects.filter(id__in=ids).values_list('id', flat=True))
+            missing = ids - existing
+            if missing:
+                raise serializers.ValidationError({'members':
+                    f'The following members do not exist: {sorted(missing)}'})
+        return attrs
+
+
+class BoardDetailQuerySerializer(serializers.Serializer):
+    """
+    Serializer for board detail query parameters.
+
+    Fields:
+        include (str): Comma-separated parts to include, any of 'members' and
+            'tasks' (default both).
+        per_status (int): Only return the first N tickets of each status column
+            plus per-column totals and cursors (1-200), optional.
+    """
+    include = serializers.CharField(required=False)
+    per_status = serializers.IntegerField(required=False, min_value=1, max_value=200)
+
+    def validate_include(self, value):
+        """
+        Validate that every included part is known.
+        """
+        values = [part.strip() for part in value.split(',') if part.strip()]
+        invalid = [v for v in values if v not in DETAIL_INCLUDES]
+        if invalid:
+            raise serializers.ValidationError(f'Cannot include {invalid}. Allowed: {DETAIL_INCLUDES}')
+        return values
+
+
+class BoardColumnQuerySerializer(serializers.Serializer):
+    """
+    Serializer for paging through one status column.
+
+    Fields:
+        after (str): Cursor from a previous page or from `task_columns`, optional.
+        limit (int): Page size (1-200, default 25).
+    """
+    after = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, default=25, min_value=1, max_value=200)
+
+    def validate_after(self, value):
+        """
+        Ensure the cursor can be decoded.
+        """
+        try:
+            decode_cursor(value)
+        except ValueError:
+            raise serializers.ValidationError('Invalid cursor.')
+        return value
+
+
+class BoardMemberQuerySerializer(serializers.Serializer):
+    """
+    Serializer for board member listing query parameters.
+
+    Fields:
+        search (str): Case-insensitive prefix of email, first or last name, optional.
+        after (int): Only return members with a larger user id, optional.
+        limit (int): Page size (1-200, default 50).
+    """
+    search = serializers.CharField(required=False, max_length=150)
+    after = serializers.IntegerField(required=False, min_value=0)
+    limit = serializers.IntegerField(required=False, default=50, min_value=1, max_value=200)
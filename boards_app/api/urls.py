@@ -1,8 +1,12 @@
 from django.urls import path
 
-from .views import BoardListCreateView, BoardDetailPatchDeleteView
+from .views import BoardListCreateView, BoardDetailPatchDeleteView, BoardColumnView, BoardMembersView, BoardExportView, BoardImportView
 
 urlpatterns = [
     path('boards/', BoardListCreateView.as_view(), name='board-list'),
     path('boards/<int:pk>/', BoardDetailPatchDeleteView.as_view(), name='board-detail'),
+    path('boards/<int:pk>/columns/<slug:status>/', BoardColumnView.as_view(), name='board-column'),
+    path('boards/<int:pk>/members/', BoardMembersView.as_view(), name='board-members'),
+    path('boards/<int:pk>/export/', BoardExportView.as_view(), name='board-export'),
+    path('boards/import/', BoardImportView.as_view(), name='board-import'),
 ]
@@ -2,24 +2,41 @@ from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
-from django.db.models import Count, Q
+from rest_framework.settings import api_settings
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.contrib.auth.models import User
 
 from boards_app.models import Board
-from .serializers import BoardListSerializer, BoardCreateSerializer, BoardDetailSerializer, BoardDetailAfterUpdateSerializer, BoardUpdateSerializer
+from ticket_app.models import Ticket
+from .serializers import BoardListSerializer, BoardCreateSerializer, BoardDetailSerializer, BoardUpdateSerializer, BoardDetailQuerySerializer, BoardColumnQuerySerializer, BoardMemberQuerySerializer
+from .mixins import BoardAccessMixin
+from boards_app.members import update_members
+from .rows import DETAIL_INCLUDES, board_detail_row, board_detail_normalized, board_update_row, column_page, member_page
 from core.decorators import handle_exceptions
+from idempotency_app.decorators import idempotent
+from core.renderers import NormalizedJSONRenderer, PreEncoded, pre_encode
+from core.singleflight import cached
+from jobs_app.registry import enqueue, wants_async
+from jobs_app.api.views import job_accepted_response
 
 class BoardListCreateView(generics.ListCreateAPIView):
     """
     API endpoint to list all boards the user can access or create a new board.
 
     GET returns all boards where the user is owner or member.
-    POST allows creating a board with a title and optional members.
+    POST allows creating a board with a title and optional members; retries
+    with the same Idempotency-Key replay the stored response.
 
     Attributes:
         permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
     """
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'boards'
 
     def get_queryset(self):
         """
@@ -28,9 +45,7 @@ class BoardListCreateView(generics.ListCreateAPIView):
         Returns:
             QuerySet: Boards owned by or shared with the user.
         """
-        user = self.request.user
-        allowed_ids = Board.objects.filter(Q(owner=user) | Q(members=user)).values_list('id', flat=True)
-        return Board.objects.filter(id__in=allowed_ids).distinct()
+        return Board.objects.accessible_to(self.request.user)
 
     def get_serializer_class(self):
         """
@@ -49,18 +64,19 @@ class BoardListCreateView(generics.ListCreateAPIView):
         Handle GET request to list boards.
 
         Returns:
-            Response: HTTP 200 with serialized board list.
+            Response: HTTP 200 with the board list, shaped like BoardListSerializer.
         """
-        qs = self.annotated_queryset(self.get_queryset())
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(self.board_rows(self.get_queryset()), status=status.HTTP_200_OK)
 
+    @idempotent(scope='boards.create')
     @handle_exceptions(action='creating board')
     def create(self, request, *args, **kwargs):
         """
         Handle POST request to create a board.
 
         Validates members list and assigns the requesting user as owner *and* as member.
+        The board and all membership rows are written in one transaction with two
+        inserts, and the response counts are computed without re-querying.
 
         Returns:
             Response: HTTP 201 with serialized board data, or 400 on validation error.
@@ -68,14 +84,28 @@ class BoardListCreateView(generics.ListCreateAPIView):
         serializer = self.get_serializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        self.validate_members(request.data.get('members', []))
-        board = serializer.save(owner=request.user)
-        if request.user not in board.members.all():
-            board.members.add(request.user)
-        qs = self.annotated_queryset(Board.objects.filter(pk=board.pk)).first()
-        output_serializer = BoardListSerializer(qs, context={'request': request})
+        member_ids = serializer.validated_data.pop('members', [])
+        self.validate_members(member_ids)
+        member_ids = set(member_ids) | {request.user.id}
+        with transaction.atomic():
+            board = serializer.save(owner=request.user)
+            Membership = Board.members.through
+            Membership.objects.bulk_create([Membership(board_id=board.id, user_id=user_id) for user_id in member_ids])
+        self.annotate_new_board(board, len(member_ids))
+        output_serializer = BoardListSerializer(board, context={'request': request})
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
+    def annotate_new_board(self, board, member_count):
+        """
+        Set the summary counts of a just-created board without querying.
+
+        Args:
+            board (Board): The new board.
+            member_count (int): Number of members including the owner.
+        """
+        board.member_count = member_count
+        self.set_ticket_counts(board, self.empty_histograms())
+
     def validate_members(self, member_ids):
         """
         Ensure provided member IDs form a valid list of existing users, excluding self.
@@ -88,40 +118,149 @@ class BoardListCreateView(generics.ListCreateAPIView):
         """
         if not isinstance(member_ids, list):
             raise ValidationError({'members': 'Must be a list of user IDs.'})
+        if not member_ids:
+            return
         existing = set(User.objects.filter(id__in=member_ids).values_list('id', flat=True))
         missing = set(member_ids) - existing
         if missing:
             raise ValidationError({'members':
                 f'The following members do not exist: {sorted(missing)}'})
 
+    def board_rows(self, qs):
+        """
+        Fetch boards with member counts and ticket histograms in two queries.
+
+        Rows are read with values() and returned as plain dicts with the same
+        shape as BoardListSerializer output, without building model instances.
+
+        Args:
+            qs (QuerySet): Base Board queryset.
+
+        Returns:
+            list[dict]: One summary dict per board.
+        """
+        rows = self.annotated_queryset(qs).values('id', 'title', 'owner_id', 'member_count')
+        histograms = self.ticket_histograms(qs.values('id'))
+        return [
+            {**row, **self.ticket_counts(histograms.get(row['id']) or self.empty_histograms())}
+            for row in rows
+        ]
+
     def annotated_queryset(self, qs):
         """
-        Annotate boards with counts for members and tickets.
+        Annotate boards with their member count.
+
+        The count is a correlated subquery on the indexed membership table, so
+        it does not multiply with other joins.
 
         Args:
             qs (QuerySet): Base Board queryset.
 
         Returns:
-            QuerySet: Annotated with member_count, ticket_count, tasks_to_do_count, tasks_high_prio_count.
+            QuerySet: Annotated with member_count.
+        """
+        memberships = Board.members.through.objects.filter(board_id=OuterRef('pk'))
+        return qs.annotate(member_count=self.count_subquery(memberships, 'board_id'))
+
+    def ticket_histograms(self, board_ids):
+        """
+        Count tickets per board, status and priority in one grouped query.
+
+        The grouping is answered from the (board, status, priority) index.
+
+        Args:
+            board_ids (QuerySet): Subquery of board ids.
+
+        Returns:
+            dict: Board id -> (status counts, priority counts).
+        """
+        rows = (
+            Ticket.objects.filter(board_id__in=board_ids)
+            .values_list('board_id', 'status', 'priority')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        histograms = {}
+        for board_id, ticket_status, priority, count in rows:
+            by_status, by_priority = histograms.setdefault(board_id, self.empty_histograms())
+            by_status[ticket_status] = by_status.get(ticket_status, 0) + count
+            by_priority[priority] = by_priority.get(priority, 0) + count
+        return histograms
+
+    def empty_histograms(self):
+        """
+        Build zeroed status and priority histograms covering all model choices.
+
+        Returns:
+            tuple[dict, dict]: (status counts, priority counts).
         """
-        return qs.annotate(
-            member_count=Count('members', distinct=True),
-            ticket_count=Count('tickets', distinct=True),
-            tasks_to_do_count=Count('tickets', filter=Q(tickets__status='todo')),
-            tasks_high_prio_count=Count('tickets', filter=Q(tickets__priority='high')),
+        return (
+            {key: 0 for key, _ in Ticket.STATUS_CHOICES},
+            {key: 0 for key, _ in Ticket.PRIORITY_CHOICES},
         )
 
+    def ticket_counts(self, histograms):
+        """
+        Derive the ticket summary fields of a board from its histograms.
+
+        Args:
+            histograms (tuple[dict, dict]): (status counts, priority counts).
+
+        Returns:
+            dict: ticket_count, tasks_to_do_count, tasks_high_prio_count,
+                status_counts and priority_counts.
+        """
+        by_status, by_priority = histograms
+        return {
+            'ticket_count': sum(by_status.values()),
+            'tasks_to_do_count': by_status['to-do'],
+            'tasks_high_prio_count': by_priority['high'],
+            'status_counts': by_status,
+            'priority_counts': by_priority,
+        }
+
+    def set_ticket_counts(self, board, histograms):
+        """
+        Set the ticket summary attributes of a board from its histograms.
+
+        Args:
+            board (Board): Board to annotate.
+            histograms (tuple[dict, dict]): (status counts, priority counts).
+        """
+        for name, value in self.ticket_counts(histograms).items():
+            setattr(board, name, value)
+
+    def count_subquery(self, qs, group_field):
+        """
+        Wrap a correlated queryset into a scalar COUNT subquery.
+
+        Args:
+            qs (QuerySet): Queryset filtered on OuterRef('pk').
+            group_field (str): Field the queryset is correlated on.
+
+        Returns:
+            Coalesce: Expression evaluating to the row count (0 if none).
+        """
+        counted = qs.order_by().values(group_field).annotate(count=Count('*')).values('count')
+        return Coalesce(Subquery(counted), 0)
+
 
 class BoardDetailPatchDeleteView(generics.RetrieveUpdateDestroyAPIView):
     """
     API endpoint to retrieve, update or delete a single board.
 
     GET returns board details; PUT/PATCH updates title or members; DELETE removes the board if owned.
+    GET with `?format=normalized` returns the detail with side-loaded users;
+    `include` and `per_status` limit the payload (see BoardDetailQuerySerializer).
 
     Attributes:
         permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+        renderer_classes (list): Default renderers plus NormalizedJSONRenderer.
     """
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'boards'
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NormalizedJSONRenderer]
 
     def get_object(self):
         """
@@ -160,10 +299,41 @@ class BoardDetailPatchDeleteView(generics.RetrieveUpdateDestroyAPIView):
         """
         Handle GET request to retrieve board details.
 
+        Members and tickets (with their users, ordered by rank) are read with
+        one values() query each and rendered by the read-only fast path in
+        boards_app.api.rows, which matches BoardDetailSerializer output.
+
+        With `?format=normalized`, users are sent once in an id-keyed `users`
+        map and `members`, `assignee` and `reviewer` hold user ids only, so
+        repeated users are neither built nor encoded per ticket.
+
+        `include` selects members and/or tasks. With `per_status=N` only the
+        first N tickets of each status column are returned, together with a
+        `task_columns` map of per-column totals and cursors for
+        BoardColumnView.
+
+        The encoded payload is cached per board version (read with the board
+        row itself) and response variant. Concurrent identical requests share
+        one computation (see core.singleflight), so bursts of viewers cost one
+        build per board.
+
         Returns:
             Response: HTTP 200 with serialized board detail.
         """
-        return super().retrieve(request, *args, **kwargs)
+        params = BoardDetailQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        include = params.validated_data.get('include') or DETAIL_INCLUDES
+        per_status = params.validated_data.get('per_status')
+        board = self.get_object()
+        variant = request.accepted_renderer.format
+        key = f'board-detail:{board.id}:{board.version}:{variant}:{",".join(include)}:{per_status or ""}'
+
+        def build():
+            build_detail = board_detail_normalized if variant == NormalizedJSONRenderer.format else board_detail_row
+            return pre_encode(build_detail(board, include=include, per_status=per_status)).json
+
+        body = cached(key, build, settings.BOARD_DETAIL_CACHE_TTL)
+        return Response(PreEncoded(body), status=status.HTTP_200_OK)
 
     @handle_exceptions(action='updating board')
     def update(self, request, *args, **kwargs):
@@ -171,12 +341,17 @@ class BoardDetailPatchDeleteView(generics.RetrieveUpdateDestroyAPIView):
         Handle PUT/PATCH request to update a board.
 
         Validates and applies partial updates, then returns updated detail.
+        With a `Prefer: respond-async` header, membership changes are handed
+        to the job queue after validation; other fields are saved immediately.
 
         Returns:
-            Response: HTTP 200 with serialized updated board data.
+            Response: HTTP 200 with serialized updated board data, or HTTP 202
+                with the job to poll when members are updated asynchronously.
         """
         board = self.get_object()
-        updated = self.perform_update(board, request.data)
+        updated, job = self.perform_update(board, request.data, defer_members=wants_async(request))
+        if job is not None:
+            return job_accepted_response(request, job)
         return Response(self.serialize_detail(updated), status=status.HTTP_200_OK)
 
     @handle_exceptions(action='deleting board')
@@ -184,27 +359,37 @@ class BoardDetailPatchDeleteView(generics.RetrieveUpdateDestroyAPIView):
         """
         Handle DELETE request to remove a board.
 
-        Ensures only the owner can delete.
+        Ensures only the owner can delete. With a `Prefer: respond-async` header
+        the deletion is handed to the job queue.
 
         Returns:
-            Response: HTTP 204 on successful deletion.
+            Response: HTTP 204 on successful deletion, or HTTP 202 with the job
+                to poll when processed asynchronously.
         """
         board = self.get_object()
         self.check_delete_permission(board)
+        if wants_async(request):
+            job = enqueue(
+                'boards.delete', {'board_id': board.id},
+                user=request.user, idempotency_key=f'boards.delete:{board.id}',
+            )
+            return job_accepted_response(request, job)
         board.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-    def perform_update(self, board, data):
+    def perform_update(self, board, data, defer_members=False):
         """
         Validate and apply updates to a board instance,
-        then ensure the owner is also in the members list.
+        then apply membership changes as a diff that always keeps the owner.
 
         Args:
             board (Board): The board to update.
             data (dict): Partial data containing updated fields.
+            defer_members (bool): Enqueue membership changes instead of applying them.
 
         Returns:
-            Board: The updated board instance.
+            tuple[Board, Job | None]: The updated board instance and the job
+                applying membership changes, if they were deferred.
 
         Raises:
             ValidationError: If serializer validation fails.
@@ -212,23 +397,35 @@ class BoardDetailPatchDeleteView(generics.RetrieveUpdateDestroyAPIView):
         serializer = self.get_serializer(board, data=data, partial=True)
         if not serializer.is_valid():
             raise ValidationError(serializer.errors)
-        updadet_board = serializer.save()
-        owner = board.owner.id
-        if owner not in updadet_board.members.all():
-            updadet_board.members.add(owner)
-        return updadet_board
+        members = serializer.validated_data.pop('members', None)
+        to_add = set(serializer.validated_data.pop('members_add', []))
+        to_remove = set(serializer.validated_data.pop('members_remove', []))
+        changes_members = members is not None or to_add or to_remove
+        with transaction.atomic():
+            updated_board = serializer.save()
+            if changes_members and defer_members:
+                job = enqueue('boards.update_members', {
+                    'board_id': board.id, 'members': None if members is None else sorted(set(members)),
+                    'members_add': sorted(to_add), 'members_remove': sorted(to_remove),
+                }, user=self.request.user)
+                return updated_board, job
+            update_members(updated_board.id, updated_board.owner_id, members, to_add, to_remove)
+        return updated_board, None
 
     def serialize_detail(self, board):
         """
         Serialize a board for detailed output after update.
 
+        Uses the read-only fast path matching BoardDetailAfterUpdateSerializer;
+        members are capped, so the cost does not grow with the member count.
+
         Args:
             board (Board): The board instance.
 
         Returns:
             dict: Serialized data as Python dict.
         """
-        return BoardDetailAfterUpdateSerializer(board, context={'request': self.request}).data
+        return board_update_row(board)
 
     def check_delete_permission(self, board):
         """
@@ -242,3 +439,140 @@ class BoardDetailPatchDeleteView(generics.RetrieveUpdateDestroyAPIView):
         """
         if board.owner_id != self.request.user.id:
             raise PermissionDenied('Not authorized to delete this board.')
+
+
+class BoardColumnView(generics.GenericAPIView, BoardAccessMixin):
+    """
+    API endpoint to page through the tickets of one status column.
+
+    GET returns the tickets after the `after` cursor in rank order, so
+    clients can load the rest of a column that the board detail truncated
+    with `per_status`.
+
+    Attributes:
+        serializer_class (Serializer): Serializer for query parameter validation.
+        permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+    """
+    serializer_class = BoardColumnQuerySerializer
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'boards'
+
+    @handle_exceptions(action='retrieving column')
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request for a column page.
+
+        Raises:
+            NotFound: If the board or the status column does not exist.
+
+        Returns:
+            Response: HTTP 200 with {'tasks': [...], 'next': cursor or None}.
+        """
+        column = self.kwargs.get('status')
+        if column not in {key for key, _ in Ticket.STATUS_CHOICES}:
+            raise NotFound('Column not found.')
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        board = self.get_board()
+        page = column_page(board, column, serializer.validated_data.get('after'), serializer.validated_data['limit'])
+        return Response(page, status=status.HTTP_200_OK)
+
+
+class BoardMembersView(generics.GenericAPIView, BoardAccessMixin):
+    """
+    API endpoint to page through the members of a board.
+
+    GET returns members ordered by id, optionally filtered by a name or email
+    prefix, with the total number of matches.
+
+    Attributes:
+        serializer_class (Serializer): Serializer for query parameter validation.
+        permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+    """
+    serializer_class = BoardMemberQuerySerializer
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'boards'
+
+    @handle_exceptions(action='retrieving members')
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request for a member page.
+
+        Returns:
+            Response: HTTP 200 with {'count', 'members', 'next'}; pass `next`
+                as `after` to get the following page.
+        """
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        board = self.get_board()
+        page = member_page(board, params.get('search'), params.get('after'), params['limit'])
+        return Response(page, status=status.HTTP_200_OK)
+
+
+class BoardExportView(generics.GenericAPIView, BoardAccessMixin):
+    """
+    API endpoint to export a board as an NDJSON stream.
+
+    GET streams the board, its members, tickets and comments, one JSON object
+    per line, reading rows in chunks so memory stays constant.
+
+    The export is not offered as a job: rows are read while the body is sent,
+    so the request does no work up front, and a job would need file storage
+    for its result, which this project does not have.
+
+    Attributes:
+        permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'boards'
+
+    @handle_exceptions(action='exporting board')
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request to export a board.
+
+        Returns:
+            StreamingHttpResponse: HTTP 200 with an application/x-ndjson body.
+        """
+        from .ndjson import export_board
+
+        board = self.get_board()
+        response = StreamingHttpResponse(export_board(board), content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="board-{board.id}.ndjson"'
+        return response
+
+
+class BoardImportView(generics.GenericAPIView):
+    """
+    API endpoint to import a board from an NDJSON stream.
+
+    POST reads the request body line by line and creates a new board owned by
+    the requesting user, inserting members, tickets and comments in batches.
+    The import is atomic.
+
+    Attributes:
+        permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'boards'
+
+    @handle_exceptions(action='importing board')
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST request to import a board.
+
+        Returns:
+            Response: HTTP 201 with the new board id and imported record counts;
+                HTTP 400 if the stream is invalid.
+        """
+        from .ndjson import BoardImporter
+
+        importer = BoardImporter(request.user)
+        with transaction.atomic():
+            board = importer.run(request._request)
+        return Response({'id': board.id, 'title': board.title, **importer.counts}, status=status.HTTP_201_CREATED)
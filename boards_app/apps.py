@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_save
 
 
 class BoardsAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'boards_app'
+
+    def ready(self):
+        from django.contrib.auth.models import User
+        from ticket_app.models import Ticket
+        from .models import Board
+        from . import versioning
+
+        post_save.connect(versioning.board_saved, sender=Board)
+        post_save.connect(versioning.ticket_saved, sender=Ticket)
+        post_save.connect(versioning.user_saved, sender=User)
+        m2m_changed.connect(versioning.members_changed, sender=Board.members.through)
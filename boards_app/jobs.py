@@ -0,0 +1,43 @@
+from django.db import transaction
+
+from boards_app.members import update_members
+from boards_app.models import Board
+from jobs_app.registry import register
+
+
+@register('boards.delete')
+def delete_board(payload):
+    """
+    Delete a board with all its tickets and comments.
+
+    Args:
+        payload (dict): {'board_id': int}
+
+    Returns:
+        dict: Number of deleted rows per model.
+    """
+    _, deleted = Board.objects.filter(pk=payload['board_id']).delete()
+    return {'deleted': deleted}
+
+
+@register('boards.update_members')
+def update_board_members(payload):
+    """
+    Apply a membership change requested with `Prefer: respond-async`.
+
+    Args:
+        payload (dict): {'board_id': int, 'members': list[int] | None,
+            'members_add': list[int], 'members_remove': list[int]}
+
+    Returns:
+        dict: Numbers of added and removed members; empty if the board is gone.
+    """
+    owner_id = Board.objects.filter(pk=payload['board_id']).values_list('owner_id', flat=True).first()
+    if owner_id is None:
+        return {}
+    with transaction.atomic():
+        added, removed = update_members(
+            payload['board_id'], owner_id, payload['members'],
+            set(payload['members_add']), set(payload['members_remove']),
+        )
+    return {'added': added, 'removed': removed}
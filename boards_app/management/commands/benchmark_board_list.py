@@ -0,0 +1,92 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from boards_app.api.serializers import BoardListSerializer
+from boards_app.api.views import BoardListCreateView
+from boards_app.models import Board
+from ticket_app.models import Ticket
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the board list query for users with a growing number of boards. '
+        'Fixture data is created inside a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10,100,1000,5000', help='Comma-separated numbers of boards per user.')
+        parser.add_argument('--tickets', type=int, default=5, help='Tickets per board.')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per size; the best run is reported.')
+        parser.add_argument('--explain', action='store_true', help='Print the query plan for the largest size.')
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        self.stdout.write(f'{"boards":>8} {"rows ms":>10} {"drf ms":>10} {"ms/board":>10}')
+        with transaction.atomic():
+            for size in sizes:
+                user = self.create_fixture(size, options['tickets'])
+                rows_ms, drf_ms = self.measure(user, options['repeat'])
+                self.stdout.write(f'{size:>8} {rows_ms:>10.2f} {drf_ms:>10.2f} {rows_ms / size:>10.4f}')
+            if options['explain']:
+                self.explain(user)
+            transaction.set_rollback(True)
+
+    def create_fixture(self, size, tickets_per_board):
+        """
+        Create a user owning half and belonging to the other half of `size` boards,
+        next to an equal number of unrelated boards.
+        """
+        user = User.objects.create(username=f'bench-{size}-{time.monotonic_ns()}')
+        other = User.objects.create(username=f'bench-other-{size}-{time.monotonic_ns()}')
+        boards = Board.objects.bulk_create(
+            [Board(title=f'Board {i}', owner=user if i % 4 == 0 else other) for i in range(size * 2)]
+        )
+        Membership = Board.members.through
+        Membership.objects.bulk_create(
+            [Membership(board_id=board.id, user_id=user.id) for i, board in enumerate(boards) if i % 4 == 1],
+            batch_size=1000,
+        )
+        Ticket.objects.bulk_create(
+            [
+                Ticket(board=board, title='t', status='to-do', priority='high')
+                for board in boards for _ in range(tickets_per_board)
+            ],
+            batch_size=1000,
+        )
+        return user
+
+    def measure(self, user, repeat):
+        """
+        Time the list via the values() fast path and via model instances and
+        BoardListSerializer; return the best runs in ms.
+        """
+        view = BoardListCreateView()
+        best_rows, best_drf = float('inf'), float('inf')
+        for _ in range(repeat):
+            qs = Board.objects.accessible_to(user)
+            start = time.perf_counter()
+            view.board_rows(qs)
+            rows_done = time.perf_counter()
+            boards = list(view.annotated_queryset(qs))
+            histograms = view.ticket_histograms(qs.values('id'))
+            for board in boards:
+                view.set_ticket_counts(board, histograms.get(board.id) or view.empty_histograms())
+            BoardListSerializer(boards, many=True).data
+            drf_done = time.perf_counter()
+            best_rows = min(best_rows, (rows_done - start) * 1000)
+            best_drf = min(best_drf, (drf_done - rows_done) * 1000)
+        return best_rows, best_drf
+
+    def explain(self, user):
+        """
+        Print the database query plan of the board list query.
+        """
+        view = BoardListCreateView()
+        qs = Board.objects.accessible_to(user)
+        self.stdout.write(view.annotated_queryset(qs).explain())
+        self.stdout.write(Ticket.objects.filter(board_id__in=qs.values('id')).values('board_id', 'status', 'priority')
+                          .annotate(count=Count('id')).order_by().explain())
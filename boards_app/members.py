@@ -0,0 +1,44 @@
+"""
+Board membership changes applied as a diff.
+
+Used by the board update endpoint and by the `boards.update_members` job,
+which runs the same change in the background for `Prefer: respond-async`.
+"""
+from boards_app.models import Board
+from boards_app.versioning import bump_board_version
+
+
+def update_members(board_id, owner_id, members, to_add, to_remove):
+    """
+    Apply membership changes with one batched insert and one batched delete.
+
+    Only a full `members` list requires reading the current membership;
+    incremental changes are written directly. The owner always stays a member.
+
+    Args:
+        board_id (int): Board primary key.
+        owner_id (int): User ID of the board owner.
+        members (list[int] | None): Full new member list, or None to keep the current one.
+        to_add (set[int]): User IDs to add.
+        to_remove (set[int]): User IDs to remove.
+
+    Returns:
+        tuple[int, int]: Numbers of added and removed members.
+    """
+    Membership = Board.members.through
+    memberships = Membership.objects.filter(board_id=board_id)
+    to_remove = set(to_remove) - {owner_id}
+    if members is not None:
+        current = set(memberships.values_list('user_id', flat=True))
+        desired = ((set(members) | set(to_add)) - to_remove) | {owner_id}
+        to_add, to_remove = desired - current, current - desired
+    if to_add:
+        Membership.objects.bulk_create(
+            [Membership(board_id=board_id, user_id=user_id) for user_id in to_add],
+            batch_size=500, ignore_conflicts=True,
+        )
+    if to_remove:
+        memberships.filter(user_id__in=to_remove).delete()
+    if to_add or to_remove:
+        bump_board_version(board_id)
+    return len(to_add), len(to_remove)
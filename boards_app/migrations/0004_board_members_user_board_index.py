@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Covering index for "boards of a user" lookups on the auto-created members
+    table, which cannot declare indexes through model Meta.
+    """
+
+    dependencies = [
+        ('boards_app', '0003_rename_owner_id_board_owner_board_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX boards_member_user_board_idx ON boards_app_board_members (user_id, board_id)',
+            'DROP INDEX boards_member_user_board_idx',
+        ),
+    ]
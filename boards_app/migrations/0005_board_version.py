@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-19 10:26
+
+import boards_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_members_user_board_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='version',
+            field=models.CharField(default=boards_app.models.new_version, max_length=16),
+        ),
+    ]
@@ -1,8 +1,45 @@
+import secrets
+
 from django.db import models
 from django.contrib.auth.models import User
 
 # Create your models here.
 
+def new_version():
+    """
+    Generate a random board version token.
+
+    Returns:
+        str: 16 hex characters.
+    """
+    return secrets.token_hex(8)
+
+
+class BoardQuerySet(models.QuerySet):
+    """
+    QuerySet with membership-scoped lookups for boards.
+    """
+    def accessible_to(self, user):
+        """
+        Restrict to boards the user owns or is a member of.
+
+        Uses `id IN (owned ids UNION member board ids)`: both halves are index
+        searches on owner_id and on the membership user_id, the UNION removes
+        duplicates without a DISTINCT over the outer query, and boards are
+        then fetched by primary key. Cost grows with the user's boards, not
+        with the size of the board table.
+
+        Args:
+            user (User): The user whose boards to return.
+
+        Returns:
+            QuerySet: Boards owned by or shared with the user.
+        """
+        owned = Board.objects.filter(owner_id=user.id).values('id')
+        shared = Board.members.through.objects.filter(user_id=user.id).values('board_id')
+        return self.filter(pk__in=owned.union(shared))
+
+
 class Board(models.Model):
     """
     Represents a Kanban board.
@@ -16,12 +53,17 @@ class Board(models.Model):
         members (QuerySet[User]): Users who have access to the board (many-to-many).
         created_at (datetime): Timestamp when the board was first created.
         updated_at (datetime): Timestamp when the board was last modified.
+        version (str): Random token replaced whenever the board's detail
+            payload changes (see boards_app.versioning).
     """
     title = models.CharField(max_length=255)
     owner = models.ForeignKey(User, related_name='owned_boards', on_delete=models.CASCADE)
     members = models.ManyToManyField(User, blank=True, related_name='boards')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    version = models.CharField(max_length=16, default=new_version)
+
+    objects = BoardQuerySet.as_manager()
 
     def __str__(self):
         """
@@ -1,3 +1,413 @@
-from django.test import TestCase
+import json
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from boards_app.api.rows import board_detail_row, board_detail_normalized, board_update_row
+from boards_app.api.serializers import BoardDetailAfterUpdateSerializer, BoardDetailSerializer, BoardListSerializer
+from boards_app.api.views import BoardListCreateView
+from boards_app.models import Board
+from jobs_app.models import Job
+from jobs_app.worker import claim_next_job, run_job
+from ticket_app.models import Ticket
+
+
+class BoardCreateTests(APITestCase):
+    """
+    Tests for POST /api/boards/.
+    """
+    def setUp(self):
+        self.owner = User.objects.create_user('owner@example.com', 'owner@example.com', 'pw')
+        self.members = [User.objects.create_user(f'm{i}@example.com', f'm{i}@example.com', 'pw') for i in range(3)]
+        self.client.force_authenticate(self.owner)
+
+    def test_create_runs_constant_number_of_queries(self):
+        """
+        Member validation, board insert and membership insert, plus the savepoint pair.
+        """
+        member_ids = [member.id for member in self.members]
+        with self.assertNumQueries(5):
+            response = self.client.post('/api/boards/', {'title': 'Board', 'members': member_ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['member_count'], 4)
+        self.assertEqual(response.data['ticket_count'], 0)
+        board = Board.objects.get(pk=response.data['id'])
+        self.assertEqual(set(board.members.values_list('id', flat=True)), {self.owner.id, *member_ids})
+
+    def test_create_without_members_adds_owner(self):
+        """
+        Without members only the owner is inserted and no validation query runs.
+        """
+        with self.assertNumQueries(4):
+            response = self.client.post('/api/boards/', {'title': 'Solo'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['owner_id'], self.owner.id)
+        self.assertEqual(response.data['member_count'], 1)
+
+    def test_create_rejects_unknown_members(self):
+        """
+        Unknown member IDs are rejected before anything is written.
+        """
+        response = self.client.post('/api/boards/', {'title': 'Board', 'members': [9999]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Board.objects.exists())
+
+
+class BoardListTests(APITestCase):
+    """
+    Tests for GET /api/boards/.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.other = User.objects.create_user('other@example.com', 'other@example.com', 'pw')
+        self.owned = Board.objects.create(title='Owned', owner=self.user)
+        self.shared = Board.objects.create(title='Shared', owner=self.other)
+        self.shared.members.add(self.user, self.other)
+        self.hidden = Board.objects.create(title='Hidden', owner=self.other)
+        for ticket_status, priority in [('to-do', 'high'), ('to-do', 'low'), ('done', 'high')]:
+            Ticket.objects.create(board=self.owned, title='t', status=ticket_status, priority=priority)
+        self.client.force_authenticate(self.user)
+
+    def test_list_counts_match_model_choices(self):
+        """
+        Owned and shared boards are listed with counts from one grouped query.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/boards/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        boards = {board['id']: board for board in response.data}
+        self.assertEqual(set(boards), {self.owned.id, self.shared.id})
+        owned = boards[self.owned.id]
+        self.assertEqual(owned['ticket_count'], 3)
+        self.assertEqual(owned['tasks_to_do_count'], 2)
+        self.assertEqual(owned['tasks_high_prio_count'], 2)
+        self.assertEqual(owned['status_counts'], {'to-do': 2, 'in-progress': 0, 'review': 0, 'done': 1})
+        self.assertEqual(boards[self.shared.id]['member_count'], 2)
+        self.assertEqual(boards[self.shared.id]['ticket_count'], 0)
+
+
+class BoardRowsParityTests(APITestCase):
+    """
+    The values() fast paths must render exactly like the DRF serializers.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw',
+                                             first_name='Ada', last_name='Lovelace')
+        self.other = User.objects.create_user('other@example.com', 'other@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.board.members.add(self.other, self.user)
+        self.empty = Board.objects.create(title='Empty', owner=self.other)
+        self.empty.members.add(self.user)
+        Ticket.objects.create(board=self.board, title='a', status='review', priority='high',
+                              assignee=self.other, reviewer=self.user, rank='b', comments_count=2)
+        Ticket.objects.create(board=self.board, title='b', status='to-do', priority='low', rank='a')
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_board_list_parity(self):
+        view = BoardListCreateView()
+        qs = Board.objects.accessible_to(self.user).order_by('id')
+        boards = list(view.annotated_queryset(qs))
+        histograms = view.ticket_histograms(qs.values('id'))
+        for board in boards:
+            view.set_ticket_counts(board, histograms.get(board.id) or view.empty_histograms())
+        expected = BoardListSerializer(boards, many=True).data
+        self.assertEqual(self.render(view.board_rows(qs)), self.render(expected))
+
+    def capped(self, limit):
+        """
+        Stand in for a board whose members relation holds the first `limit` members.
+        """
+        tickets = Ticket.objects.filter(board=self.board).select_related('assignee', 'reviewer').order_by('rank', 'id')
+        return SimpleNamespace(
+            id=self.board.id, title=self.board.title, owner_id=self.board.owner_id, owner=self.board.owner,
+            members=list(self.board.members.order_by('id')[:limit]), member_count=self.board.members.count(),
+            tickets=list(tickets),
+        )
+
+    def test_board_detail_parity(self):
+        expected = BoardDetailSerializer(self.capped(50)).data
+        self.client.force_authenticate(self.user)
+        response = self.client.get(f'/api/boards/{self.board.id}/')
+        self.assertEqual(response.content, self.render(expected))
+        self.assertEqual(self.render(board_detail_row(self.board)), self.render(expected))
+
+    @override_settings(BOARD_MEMBER_PREVIEW=1)
+    def test_capped_members_parity(self):
+        expected = BoardDetailSerializer(self.capped(1)).data
+        self.assertEqual(expected['member_count'], 2)
+        self.assertEqual(len(expected['members']), 1)
+        self.assertEqual(self.render(board_detail_row(self.board)), self.render(expected))
+        expected = BoardDetailAfterUpdateSerializer(self.capped(1)).data
+        self.assertEqual(self.render(board_update_row(self.board)), self.render(expected))
+
+    def test_normalized_detail_expands_to_nested_detail(self):
+        outsider = User.objects.create_user('outsider@example.com', 'outsider@example.com', 'pw')
+        Ticket.objects.create(board=self.board, title='c', status='done', priority='low', reviewer=outsider, rank='c')
+        self.client.force_authenticate(self.user)
+        nested = self.client.get(f'/api/boards/{self.board.id}/').json()
+        with self.assertNumQueries(4):
+            response = self.client.get(f'/api/boards/{self.board.id}/', {'format': 'normalized'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        normalized = response.json()
+        users = normalized.pop('users')
+        self.assertEqual(set(users), {str(self.user.id), str(self.other.id), str(outsider.id)})
+
+        def expand(user_id):
+            return users[str(user_id)] if user_id is not None else None
+
+        normalized['members'] = [expand(user_id) for user_id in normalized['members']]
+        for task in normalized['tasks']:
+            task['assignee'], task['reviewer'] = expand(task['assignee']), expand(task['reviewer'])
+        self.assertEqual(normalized, nested)
+        self.assertEqual(board_detail_normalized(self.board)['members'], [self.user.id, self.other.id])
+
+
+class BoardColumnTests(APITestCase):
+    """
+    Tests for per-column truncation of the board detail and column paging.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        Ticket.objects.bulk_create([
+            Ticket(board=self.board, title=f't{i}', status='review', priority='low', rank=f'a{i:02d}')
+            for i in range(12)
+        ])
+        Ticket.objects.create(board=self.board, title='done', status='done', priority='low', rank='a')
+        self.client.force_authenticate(self.user)
+
+    def test_per_status_detail_and_load_more(self):
+        url = f'/api/boards/{self.board.id}/'
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'per_status': 5})
+        columns = response.json()['task_columns']
+        self.assertEqual(columns['review']['total'], 12)
+        self.assertEqual(columns['done'], {'total': 1, 'next': None})
+        self.assertEqual(columns['to-do'], {'total': 0, 'next': None})
+        loaded = [task['title'] for task in response.json()['tasks'] if task['status'] == 'review']
+        cursor = columns['review']['next']
+        while cursor:
+            page = self.client.get(f'{url}columns/review/', {'after': cursor, 'limit': 4}).data
+            loaded += [task['title'] for task in page['tasks']]
+            cursor = page['next']
+        self.assertEqual(loaded, [f't{i}' for i in range(12)])
+
+
+class BoardMemberUpdateTests(APITestCase):
+    """
+    Tests for membership changes through PATCH /api/boards/<id>/.
+    """
+    def setUp(self):
+        self.owner = User.objects.create_user('owner@example.com', 'owner@example.com', 'pw')
+        self.users = [User.objects.create_user(f'u{i}@example.com', f'u{i}@example.com', 'pw') for i in range(3)]
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.owner, self.users[0])
+        self.client.force_authenticate(self.owner)
+
+    def patch(self, **data):
+        return self.client.patch(f'/api/boards/{self.board.id}/', data, format='json')
+
+    def member_ids(self):
+        return set(self.board.members.values_list('id', flat=True))
+
+    def test_add_and_remove(self):
+        first, second, third = self.users
+        response = self.patch(members_add=[second.id, third.id], members_remove=[first.id])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.member_ids(), {self.owner.id, second.id, third.id})
+        self.assertEqual({member['id'] for member in response.data['members_data']}, self.member_ids())
+
+    def test_full_list_keeps_unchanged_rows(self):
+        Membership = Board.members.through
+        kept = Membership.objects.get(board=self.board, user=self.users[0]).id
+        self.patch(members=[self.users[0].id, self.users[1].id])
+        self.assertEqual(self.member_ids(), {self.owner.id, self.users[0].id, self.users[1].id})
+        self.assertTrue(Membership.objects.filter(pk=kept).exists())
+
+    def test_owner_cannot_be_removed(self):
+        self.assertEqual(self.patch(members_remove=[self.owner.id]).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.patch(members=[]).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.member_ids(), {self.owner.id})
+
+    def test_unknown_ids_are_rejected(self):
+        for field in ('members', 'members_add'):
+            with self.subTest(field=field):
+                response = self.patch(**{field: [self.users[1].id, 9999]})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('9999', str(response.data['members']))
+        self.assertEqual(self.member_ids(), {self.owner.id, self.users[0].id})
+
+    def test_member_change_bumps_board_version(self):
+        version = self.board.version
+        self.patch(members_add=[self.users[1].id])
+        self.board.refresh_from_db()
+        self.assertNotEqual(self.board.version, version)
+        self.assertIn(self.users[1].id,
+                      [member['id'] for member in self.client.get(f'/api/boards/{self.board.id}/').json()['members']])
+
+    def test_async_member_change_is_queued(self):
+        first, second, _ = self.users
+        response = self.client.patch(f'/api/boards/{self.board.id}/', {
+            'title': 'Renamed', 'members_add': [second.id], 'members_remove': [first.id, self.owner.id],
+        }, format='json', HTTP_PREFER='respond-async')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.title, 'Renamed')
+        self.assertEqual(self.member_ids(), {self.owner.id, first.id})
+        job = claim_next_job('test')
+        self.assertEqual(job.pk, response.data['id'])
+        run_job(job)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result), ('succeeded', {'added': 1, 'removed': 1}))
+        self.assertEqual(self.member_ids(), {self.owner.id, second.id})
+
+    def test_async_update_without_member_changes_runs_inline(self):
+        response = self.client.patch(f'/api/boards/{self.board.id}/', {'title': 'Renamed'},
+                                     format='json', HTTP_PREFER='respond-async')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Job.objects.exists())
+        response = self.client.patch(f'/api/boards/{self.board.id}/', {'members_add': [9999]},
+                                     format='json', HTTP_PREFER='respond-async')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Job.objects.exists())
+
+
+class BoardMembersTests(APITestCase):
+    """
+    Tests for GET /api/boards/<id>/members/.
+    """
+    def setUp(self):
+        self.owner = User.objects.create_user('owner@example.com', 'owner@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.owner)
+        for i in range(5):
+            self.board.members.add(User.objects.create_user(f'anna{i}@example.com', f'anna{i}@example.com', 'pw'))
+        self.board.members.add(User.objects.create_user('x@example.com', 'x@example.com', 'pw', last_name='Annan'))
+        User.objects.create_user('annabel@example.com', 'annabel@example.com', 'pw')
+        self.client.force_authenticate(self.owner)
+
+    def test_prefix_search_pages_through_matches(self):
+        url = f'/api/boards/{self.board.id}/members/'
+        seen, after = [], None
+        while True:
+            params = {'search': 'ANN', 'limit': 4, **({'after': after} if after else {})}
+            page = self.client.get(url, params).data
+            self.assertEqual(page['count'], 6)
+            seen += [member['email'] for member in page['members']]
+            after = page['next']
+            if after is None:
+                break
+        self.assertEqual(seen, [f'anna{i}@example.com' for i in range(5)] + ['x@example.com'])
+
+
+class BoardDetailCacheTests(APITestCase):
+    """
+    Tests for the versioned board detail cache.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.ticket = Ticket.objects.create(board=self.board, title='t', status='to-do', priority='low', rank='m')
+        self.client.force_authenticate(self.user)
+
+    def test_cached_detail_follows_writes_that_bypass_save(self):
+        url = f'/api/boards/{self.board.id}/'
+        first = self.client.get(url).json()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url).json(), first)
+        self.client.patch(f'/api/tasks/{self.ticket.id}/move/', {'status': 'done'}, format='json')
+        self.client.post(f'/api/tasks/{self.ticket.id}/comments/', {'content': 'c'}, format='json')
+        task = self.client.get(url).json()['tasks'][0]
+        self.assertEqual((task['status'], task['comments_count']), ('done', 1))
+
+    def test_rolled_back_write_does_not_leave_cached_detail(self):
+        url = f'/api/boards/{self.board.id}/'
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.ticket.title = 'GHOST'
+            self.ticket.save()
+            self.assertEqual(self.client.get(url).json()['tasks'][0]['title'], 'GHOST')
+            raise RuntimeError
+        self.assertEqual(self.client.get(url).json()['tasks'][0]['title'], 't')
+
+    def test_version_is_replaced_in_the_database(self):
+        versions = {self.board.version}
+        for write in (
+            lambda: Ticket.objects.create(board=self.board, title='u', status='done', priority='low', rank='a'),
+            lambda: self.client.patch(f'/api/tasks/{self.ticket.id}/move/', {'status': 'review'}, format='json'),
+            lambda: self.board.members.add(User.objects.create_user('m@example.com', 'm@example.com', 'pw')),
+        ):
+            write()
+            self.board.refresh_from_db()
+            self.assertNotIn(self.board.version, versions)
+            versions.add(self.board.version)
+
+
+class BoardExportImportTests(APITestCase):
+    """
+    Tests for the NDJSON board export and import.
+    """
+    def setUp(self):
+        self.owner = User.objects.create_user('owner@example.com', 'owner@example.com', 'pw')
+        self.member = User.objects.create_user('member@example.com', 'member@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.owner, self.member)
+        self.ticket = Ticket.objects.create(board=self.board, title='t', status='review', priority='high',
+                                            assignee=self.member, due_date='2024-02-29', rank='m')
+        self.client.force_authenticate(self.owner)
+        self.client.post(f'/api/tasks/{self.ticket.id}/comments/', {'content': 'first'}, format='json')
+
+    def export(self):
+        response = self.client.get(f'/api/boards/{self.board.id}/export/')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        return b''.join(response.streaming_content)
+
+    def upload(self, body):
+        return self.client.post('/api/boards/import/', body, content_type='application/x-ndjson')
+
+    def lines(self, *records):
+        return b''.join(json.dumps(record).encode() + b'\n' for record in records)
+
+    def test_export_then_import_round_trip(self):
+        body = self.export()
+        self.assertEqual([json.loads(line)['type'] for line in body.splitlines()],
+                         ['board', 'member', 'member', 'ticket', 'comment'])
+        self.client.force_authenticate(self.member)
+        response = self.upload(body)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((response.data['members'], response.data['tasks'], response.data['comments']), (1, 1, 1))
+        imported = Board.objects.get(pk=response.data['id'])
+        self.assertEqual((imported.title, imported.owner_id), ('Board', self.member.id))
+        ticket = imported.tickets.get()
+        self.assertEqual((ticket.title, ticket.status, ticket.assignee_id, ticket.comments_count),
+                         ('t', 'review', self.member.id, 1))
+        self.assertEqual(ticket.due_date.isoformat(), '2024-02-29')
+
+    def test_invalid_records_are_rejected_with_line_number(self):
+        board = {'type': 'board', 'title': 'Imported'}
+        ticket = {'type': 'ticket', 'id': 1, 'title': 't', 'status': 'to-do', 'priority': 'low'}
+        cases = [
+            (b'{"type": "board"}\nnot json\n', 'Line 2'),
+            (self.lines(board, {**ticket, 'status': ['to-do']}), 'Line 2'),
+            (self.lines(board, {**ticket, 'priority': {'x': 1}}), 'Line 2'),
+            (self.lines(board, ticket, {**ticket, 'due_date': '2024-13-45'}), 'Line 3'),
+            (self.lines(board, {**ticket, 'due_date': 'tomorrow'}), 'Line 2'),
+            (self.lines(board, {**ticket, 'assignee': ['owner@example.com']}), 'Line 2'),
+            (self.lines(board, ticket, {'type': 'comment', 'ticket': [1], 'content': 'c'}), 'Line 3'),
+            (self.lines(board, {'type': 'member', 'email': 5}), 'Line 2'),
+            (self.lines(ticket), 'Line 1'),
+        ]
+        boards = Board.objects.count()
+        for body, line in cases:
+            with self.subTest(body=body):
+                response = self.upload(body)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertTrue(str(response.data['detail']).startswith(line), response.data)
+        self.assertEqual(Board.objects.count(), boards)
@@ -0,0 +1,79 @@
+"""
+Per-board version tokens used to key cached board payloads.
+
+A board's version changes whenever anything shown in its detail payload
+changes, so cache entries never need explicit deletion: readers simply
+stop asking for keys with an old version. Model saves bump versions through
+signals; writes that bypass save() (update(), bulk operations, deletes)
+call bump_board_version() explicitly.
+
+The version is the Board.version column and is replaced by an UPDATE in the
+writer's transaction. Every worker process therefore sees a new version as
+soon as the write commits, and a rolled-back write also rolls back its
+version, so payloads built from uncommitted data are keyed by a random
+token that is never read again.
+"""
+from boards_app.models import Board, new_version
+
+
+def bump_board_versions(board_ids):
+    """
+    Give boards new version tokens in the current transaction.
+
+    Args:
+        board_ids (Iterable[int]): Board primary keys.
+    """
+    board_ids = list(board_ids)
+    if not board_ids:
+        return
+    Board.objects.filter(pk__in=board_ids).update(version=new_version())
+
+
+def bump_board_version(board_id):
+    """
+    Give a board a new version token in the current transaction.
+
+    Args:
+        board_id (int): Board primary key.
+    """
+    bump_board_versions([board_id])
+
+
+def board_saved(sender, instance, created, **kwargs):
+    """
+    Bump the version of an updated board.
+
+    New boards already get a fresh token from the field default.
+    """
+    if not created:
+        bump_board_version(instance.pk)
+
+
+def ticket_saved(sender, instance, **kwargs):
+    """
+    Bump the version of the board a saved ticket belongs to.
+    """
+    bump_board_version(instance.board_id)
+
+
+def members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Bump board versions after members were added or removed through the relation manager.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        bump_board_version(instance.pk)
+    elif pk_set:
+        bump_board_versions(pk_set)
+
+
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Bump the versions of all boards of a user whose displayed data may have changed.
+
+    Saves that only touch login bookkeeping are ignored.
+    """
+    if created or (update_fields and set(update_fields) <= {'last_login', 'password'}):
+        return
+    bump_board_versions(Board.objects.accessible_to(instance).values_list('id', flat=True))
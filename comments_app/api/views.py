@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -6,7 +7,10 @@ from rest_framework.exceptions import NotFound
 from .serializers import CommentBaseSerializer
 from .mixins import TaskAccessMixin
 from core.decorators import handle_exceptions
+from idempotency_app.decorators import idempotent
 from comments_app.models import Comment
+from comments_app.counters import adjust_comments_count
+from boards_app.versioning import bump_board_version
 
 class CommentListCreateView(generics.ListCreateAPIView, TaskAccessMixin):
     """
@@ -16,13 +20,16 @@ class CommentListCreateView(generics.ListCreateAPIView, TaskAccessMixin):
         - Returns all comments for the specified task, ordered by creation time.
     POST:
         - Creates a new comment on the specified task, setting the request user as author.
+        - Retries with the same Idempotency-Key replay the stored response.
 
     Attributes:
         serializer_class (Serializer): Serializer for comment input/output.
         permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
     """
     serializer_class = CommentBaseSerializer
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'comments'
 
     def get_queryset(self):
         """
@@ -48,14 +55,19 @@ class CommentListCreateView(generics.ListCreateAPIView, TaskAccessMixin):
 
     def perform_create(self, serializer):
         """
-        Save a new comment instance with author and task set.
+        Save a new comment instance with author and task set and increment
+        the ticket's comment counter in the same transaction.
 
         Args:
             serializer (Serializer): Initialized serializer with validated data.
         """
         task = self.get_task()
-        serializer.save(author=self.request.user, task=task)
+        with transaction.atomic():
+            serializer.save(author=self.request.user, task=task)
+            adjust_comments_count(task.id, 1)
+            bump_board_version(task.board_id)
 
+    @idempotent(scope='comments.create')
     @handle_exceptions(action='creating comment')
     def create(self, request, *args, **kwargs):
         """
@@ -78,12 +90,15 @@ class CommentDestroyView(generics.DestroyAPIView, TaskAccessMixin):
     API endpoint to delete a specific comment from a task.
 
     DELETE:
-        - Deletes the comment with the given comment_id under the specified task.
+        - Deletes the comment with the given comment_id under the specified task
+          and decrements the ticket's comment counter.
 
     Attributes:
         permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
     """
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'comments'
 
     @handle_exceptions(action='deleting comment')
     def delete(self, request, *args, **kwargs):
@@ -103,5 +118,8 @@ class CommentDestroyView(generics.DestroyAPIView, TaskAccessMixin):
             comment = Comment.objects.get(pk=comment_id, task=task)
         except Comment.DoesNotExist:
             raise NotFound('Comment not found.')
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
+            adjust_comments_count(task.id, -1)
+            bump_board_version(task.board_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
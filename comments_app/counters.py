@@ -0,0 +1,75 @@
+"""
+Maintenance of the denormalized Ticket.comments_count column.
+
+The comment endpoints adjust the counter in the same transaction as the
+comment write; rebuild_comments_counts() recomputes it from the comment table
+to repair drift, e.g. after raw SQL deletes or bulk imports.
+"""
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from boards_app.versioning import bump_board_versions
+from comments_app.models import Comment
+from ticket_app.models import Ticket
+
+
+def adjust_comments_count(ticket_id, delta):
+    """
+    Atomically add delta to a ticket's comment counter.
+
+    The addition is done by the database with an F() expression, so
+    concurrent comment writes cannot lose updates. The counter never drops
+    below zero.
+
+    Args:
+        ticket_id (int): Ticket primary key.
+        delta (int): Number of comments added (positive) or removed (negative).
+
+    Returns:
+        int: Number of updated tickets (0 or 1).
+    """
+    tickets = Ticket.objects.filter(pk=ticket_id)
+    if delta < 0:
+        tickets = tickets.filter(comments_count__gte=-delta)
+    return tickets.update(comments_count=F('comments_count') + delta)
+
+
+def counted_comments():
+    """
+    Build a correlated subquery counting the comments of the outer ticket.
+
+    Returns:
+        Coalesce: Expression evaluating to the real number of comments.
+    """
+    counted = (Comment.objects.filter(task_id=OuterRef('pk')).order_by()
+               .values('task_id').annotate(count=Count('*')).values('count'))
+    return Coalesce(Subquery(counted), 0)
+
+
+def rebuild_comments_counts(tickets=None, batch_size=1000):
+    """
+    Recompute comment counters that differ from the comment table.
+
+    Tickets are processed in primary-key batches so that no single UPDATE
+    holds locks on the whole table.
+
+    Args:
+        tickets (QuerySet, optional): Tickets to check; all tickets by default.
+        batch_size (int): Tickets checked per statement.
+
+    Returns:
+        int: Number of corrected tickets.
+    """
+    tickets = Ticket.objects.all() if tickets is None else tickets
+    last_id, fixed = 0, 0
+    while True:
+        ids = list(tickets.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return fixed
+        drifted = (Ticket.objects.filter(pk__in=ids)
+                   .annotate(actual=counted_comments())
+                   .exclude(comments_count=F('actual')))
+        board_ids = set(drifted.values_list('board_id', flat=True))
+        fixed += Ticket.objects.filter(pk__in=drifted.values('pk')).update(comments_count=counted_comments())
+        bump_board_versions(board_ids)
+        last_id = ids[-1]
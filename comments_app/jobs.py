@@ -0,0 +1,20 @@
+from comments_app.counters import rebuild_comments_counts
+from jobs_app.registry import register
+from ticket_app.models import Ticket
+
+
+@register('comments.rebuild_counts')
+def rebuild_counts(payload):
+    """
+    Repair drifted comment counters, optionally for a single board.
+
+    Args:
+        payload (dict): {'board_id': int | None}
+
+    Returns:
+        dict: Number of corrected tickets.
+    """
+    tickets = Ticket.objects.all()
+    if payload.get('board_id'):
+        tickets = tickets.filter(board_id=payload['board_id'])
+    return {'fixed': rebuild_comments_counts(tickets)}
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from comments_app.counters import rebuild_comments_counts
+from jobs_app.registry import enqueue
+from ticket_app.models import Ticket
+
+
+class Command(BaseCommand):
+    help = 'Recompute Ticket.comments_count from the comment table and report corrected tickets.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--board', type=int, help='Only check tickets of this board.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Tickets checked per statement.')
+        parser.add_argument('--enqueue', action='store_true', help='Hand the rebuild to the run_jobs worker.')
+
+    def handle(self, *args, **options):
+        if options['enqueue']:
+            job = enqueue('comments.rebuild_counts', {'board_id': options['board']},
+                          dedupe_key=f'comments.rebuild_counts:{options["board"] or "all"}')
+            self.stdout.write(self.style.SUCCESS(f'Queued job {job.id}.'))
+            return
+        tickets = Ticket.objects.all()
+        if options['board']:
+            tickets = tickets.filter(board_id=options['board'])
+        fixed = rebuild_comments_counts(tickets, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Corrected comment counts of {fixed} tickets.'))
@@ -1,3 +1,66 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board
+from comments_app.counters import adjust_comments_count, rebuild_comments_counts
+from comments_app.models import Comment
+from jobs_app.models import Job
+from ticket_app.models import Ticket
+
+
+class CommentCountTests(APITestCase):
+    """
+    Tests for the denormalized Ticket.comments_count column.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.ticket = Ticket.objects.create(board=self.board, title='t', status='to-do', priority='low', rank='a')
+        self.other = Ticket.objects.create(board=self.board, title='o', status='to-do', priority='low', rank='b')
+        self.client.force_authenticate(self.user)
+
+    def count(self, ticket=None):
+        return Ticket.objects.values_list('comments_count', flat=True).get(pk=(ticket or self.ticket).pk)
+
+    def comment(self, content='c'):
+        return self.client.post(f'/api/tasks/{self.ticket.id}/comments/', {'content': content}, format='json')
+
+    def test_create_and_delete_adjust_counter(self):
+        first = self.comment().json()
+        self.comment()
+        self.assertEqual(self.count(), 2)
+        response = self.client.delete(f'/api/tasks/{self.ticket.id}/comments/{first["id"]}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.count(), 1)
+        self.assertEqual(self.count(self.other), 0)
+
+    def test_invalid_comment_leaves_counter(self):
+        self.assertEqual(self.comment('').status_code, 400)
+        self.assertEqual(self.count(), 0)
+
+    def test_counter_never_drops_below_zero(self):
+        self.assertEqual(adjust_comments_count(self.ticket.id, -1), 0)
+        self.assertEqual(self.count(), 0)
+
+    def test_rebuild_fixes_drift(self):
+        Comment.objects.create(author=self.user, task=self.ticket, content='raw')
+        Ticket.objects.filter(pk=self.other.pk).update(comments_count=5)
+        self.assertEqual(rebuild_comments_counts(batch_size=1), 2)
+        self.assertEqual((self.count(), self.count(self.other)), (1, 0))
+        self.assertEqual(rebuild_comments_counts(), 0)
+
+    def test_rebuild_command_fixes_drift(self):
+        Ticket.objects.update(comments_count=3)
+        out = StringIO()
+        call_command('rebuild_comment_counts', '--board', str(self.board.id), stdout=out)
+        self.assertIn('2 tickets', out.getvalue())
+        self.assertEqual((self.count(), self.count(self.other)), (0, 0))
+
+    def test_rebuild_command_can_enqueue(self):
+        call_command('rebuild_comment_counts', '--enqueue', stdout=StringIO())
+        call_command('rebuild_comment_counts', '--enqueue', stdout=StringIO())
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.payload), ('comments.rebuild_counts', {'board_id': None}))
@@ -5,4 +5,7 @@ urlpatterns = [
     path('', include('boards_app.api.urls')),
     path('', include('ticket_app.api.urls')),
     path('', include('comments_app.api.urls')),
+    path('', include('search_app.api.urls')),
+    path('', include('jobs_app.api.urls')),
+    path('', include('batch_app.api.urls')),
 ]
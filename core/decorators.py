@@ -5,6 +5,8 @@ from rest_framework.exceptions import PermissionDenied as DRFPermissionDenied, N
 from rest_framework.response import Response
 from rest_framework import status
 
+from core import metrics
+
 def handle_exceptions(action: str):
     """
     Decorator factory to wrap view methods and handle common exceptions uniformly.
@@ -13,7 +15,8 @@ def handle_exceptions(action: str):
       - NotFound: returns HTTP 404 with the exception's detail.
       - PermissionDenied (Django or DRF): returns HTTP 403 with the exception message.
       - ValidationError: lets DRF handle it (will typically return HTTP 400).
-      - Any other Exception: returns HTTP 500 with a generic message including the action.
+      - Any other Exception: returns HTTP 500 with a generic message including the action,
+        counted per action in core.metrics.
 
     Args:
         action (str): A description of the action being performed (e.g., 'creating board'),
@@ -34,6 +37,7 @@ def handle_exceptions(action: str):
             except ValidationError as e:
                 raise e
             except Exception:
+                metrics.handled_errors.inc(action=action)
                 msg = f'Internal server error when {action}.'
                 return Response({'detail': msg}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         return wrapper
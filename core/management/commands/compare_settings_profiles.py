@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.profiling import run_in_subprocess
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare Django setup time, URL conf loading and per-request middleware overhead '
+        'between settings profiles. Each profile is measured in a fresh interpreter.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', default='core.settings,core.settings_api',
+                            help='Comma-separated settings modules.')
+        parser.add_argument('--path', default='/api/tasks/assigned-to-me/',
+                            help='Path requested for the timings; an anonymous 401 needs no database.')
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per timing.')
+        parser.add_argument('--runs', type=int, default=3, help='Interpreters per profile; the best run is reported.')
+
+    def handle(self, *args, **options):
+        columns = ['apps', 'middleware', 'modules', 'setup_ms', 'urls_ms', 'handler_us', 'view_us', 'middleware_us']
+        self.stdout.write(f'{"profile":<22}' + ''.join(f'{column:>14}' for column in columns))
+        for profile in options['profiles'].split(','):
+            try:
+                runs = [
+                    run_in_subprocess(profile, 'measure_current_profile', path=options['path'], count=options['requests'])
+                    for _ in range(options['runs'])
+                ]
+            except RuntimeError as error:
+                raise CommandError(f'{profile}: {error}')
+            best = {column: min(run[column] for run in runs) for column in columns}
+            self.stdout.write(f'{profile:<22}' + ''.join(f'{best[column]:>14}' for column in columns))
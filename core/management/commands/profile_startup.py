@@ -0,0 +1,64 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.profiling import import_tree, run_in_subprocess
+
+
+class Command(BaseCommand):
+    help = (
+        'Profile a cold start: import-time tree, AppConfig.ready() times, URL conf build time '
+        'and first-request latency, with and without core.warmup. Runs in fresh interpreters.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--settings-module', default=os.environ.get('DJANGO_SETTINGS_MODULE'),
+                            help='Settings module to profile, defaults to the current one.')
+        parser.add_argument('--path', default='/api/tasks/assigned-to-me/', help='Path of the timed requests.')
+        parser.add_argument('--token', help='Send the requests with this API token.')
+        parser.add_argument('--requests', type=int, default=200, help='Requests timed after the first one.')
+        parser.add_argument('--min-ms', type=float, default=5.0, help='Hide imports cheaper than this (cumulative).')
+        parser.add_argument('--depth', type=int, default=4, help='Maximum depth of the import tree.')
+
+    def handle(self, *args, **options):
+        module = options['settings_module']
+        headers = {'Authorization': f'Token {options["token"]}'} if options['token'] else None
+        try:
+            tree = import_tree(module)
+            runs = {
+                warm: run_in_subprocess(module, 'measure_startup', path=options['path'],
+                                        count=options['requests'], warm=warm, headers=headers)
+                for warm in (False, True)
+            }
+        except RuntimeError as error:
+            raise CommandError(str(error))
+
+        total = sum(node['cumulative_us'] for node in tree) / 1000
+        self.stdout.write(f'Imports ({total:.1f} ms total, cumulative >= {options["min_ms"]} ms):')
+        self.write_tree(tree, options['min_ms'] * 1000, options['depth'])
+
+        self.stdout.write('\nAppConfig.ready():')
+        for label, ms in sorted(runs[False]['ready_ms'].items(), key=lambda item: -item[1]):
+            self.stdout.write(f'  {ms:>8.2f} ms  {label}')
+
+        self.stdout.write('\nWarm-up steps:')
+        for step, ms in runs[True]['warmup_ms'].items():
+            self.stdout.write(f'  {ms:>8.1f} ms  {step}')
+
+        self.stdout.write(f'\n{"":<20}{"cold":>12}{"warmed":>12}')
+        for key in ('setup_ms', 'handler_ms', 'urls_ms', 'first_request_ms', 'steady_request_ms'):
+            self.stdout.write(f'{key:<20}{runs[False][key]:>12}{runs[True][key]:>12}')
+
+    def write_tree(self, nodes, min_us, depth, level=0):
+        """
+        Print import nodes above the threshold, most expensive first.
+        """
+        for node in sorted(nodes, key=lambda node: -node['cumulative_us']):
+            if node['cumulative_us'] < min_us:
+                break
+            self.stdout.write(
+                f'  {node["cumulative_us"] / 1000:>8.1f} ms {node["self_us"] / 1000:>7.1f} self  '
+                f'{"  " * level}{node["name"]}'
+            )
+            if level + 1 < depth:
+                self.write_tree(node['children'], min_us, depth, level + 1)
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.prefork import PreforkServer
+
+
+class Command(BaseCommand):
+    help = (
+        'Serve settings.WSGI_APPLICATION from a pool of workers forked from a master that has '
+        'already loaded and warmed up the application. SIGHUP reloads gracefully, SIGUSR1 '
+        'prints per-process memory usage.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bind', default='127.0.0.1:8000', help='host:port to listen on.')
+        parser.add_argument('--workers', type=int, default=2, help='Number of worker processes.')
+        parser.add_argument('--max-requests', type=int, default=0,
+                            help='Replace a worker after this many requests; 0 disables recycling.')
+        parser.add_argument('--max-requests-jitter', type=int, default=0,
+                            help='Random extra requests per worker, so workers do not recycle together.')
+        parser.add_argument('--no-gc-freeze', action='store_true',
+                            help='Do not call gc.freeze() before forking (for memory comparisons).')
+        parser.add_argument('--stats-interval', type=float, default=0,
+                            help='Seconds between memory reports; 0 reports on SIGUSR1 only.')
+        parser.add_argument('--timeout', type=float, default=30,
+                            help='Seconds a worker waits for a silent client before dropping the connection.')
+        parser.add_argument('--graceful-timeout', type=float, default=30,
+                            help='Seconds workers get to finish on shutdown or reload before they are killed.')
+
+    def handle(self, *args, **options):
+        host, _, port = options['bind'].rpartition(':')
+        if not port.isdigit() or options['workers'] < 1:
+            raise CommandError('Expected --bind host:port and at least one worker.')
+        server = PreforkServer(
+            (host or '127.0.0.1', int(port)),
+            workers=options['workers'],
+            max_requests=options['max_requests'],
+            max_requests_jitter=options['max_requests_jitter'],
+            freeze=not options['no_gc_freeze'],
+            stats_interval=options['stats_interval'],
+            request_timeout=options['timeout'],
+            graceful_timeout=options['graceful_timeout'],
+            log=lambda line: (self.stdout.write(line), self.stdout.flush()),
+        )
+        server.run()
@@ -0,0 +1,472 @@
+"""
+In-process metrics exposed in the Prometheus text format at /metrics.
+
+Counters and histograms add to a per-process value store. Without
+settings.METRICS_DIR the store is a dict and /metrics reports the serving
+process only. With METRICS_DIR set (preferably on tmpfs), every process
+writes its values into its own memory-mapped file in that directory and
+/metrics sums the files of all processes. Updates are plain memory writes
+under an uncontended per-process lock; no I/O happens per request.
+
+Files of processes that have exited are folded into one archive file and
+deleted (by the prefork master when it reaps a worker, and by every process
+when it opens its store), so totals survive worker recycling without the
+directory growing with every recycled worker. A process whose pid was used
+before continues the existing file instead of resetting it.
+
+Histogram buckets are stored non-cumulatively (one update per observation)
+and made cumulative when rendered.
+"""
+import bisect
+import glob
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+ARCHIVE_NAME = 'metrics-archive.db'
+
+_families = {}
+
+
+def escape_label(value):
+    """
+    Escape a label value for the text format.
+
+    Args:
+        value: Label value, converted to str.
+
+    Returns:
+        str: Escaped value.
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labelnames, labels):
+    """
+    Render labels in declaration order.
+
+    Args:
+        labelnames (tuple[str]): Declared label names.
+        labels (dict): Label values by name.
+
+    Returns:
+        str: 'a="1",b="2"', empty without labels.
+    """
+    return ','.join(f'{name}="{escape_label(labels[name])}"' for name in labelnames)
+
+
+def format_value(value):
+    """
+    Format a sample value without losing precision.
+
+    Args:
+        value (float): Sample value.
+
+    Returns:
+        str: Integral values without a fraction, others as repr().
+    """
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class DictStore:
+    """
+    Metric values of the current process kept in a dict.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def add(self, key, amount):
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def items(self):
+        with self.lock:
+            return list(self.values.items())
+
+
+class MmapStore:
+    """
+    Metric values of the current process kept in a memory-mapped file.
+
+    Layout: an 8-byte header holding the number of used bytes, followed by
+    entries of (uint32 key length, UTF-8 key padded to 8 bytes, float64
+    value). Entries are only appended, and the header is updated after an
+    entry is complete, so readers in other processes never see partial
+    entries. An existing file is continued, not reset.
+    """
+    header = struct.Struct('<Q')
+    length = struct.Struct('<I')
+    value = struct.Struct('<d')
+    initial_size = 1 << 16
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.positions = {}
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        size = os.fstat(self.fd).st_size
+        if size < self.initial_size:
+            size = self.initial_size
+            os.ftruncate(self.fd, size)
+        self.map = mmap.mmap(self.fd, size)
+        self.used, = self.header.unpack_from(self.map, 0)
+        if not self.header.size <= self.used <= size:
+            self.used = self.header.size
+            self.header.pack_into(self.map, 0, self.used)
+        for key, position in iter_entries(self.map, self.used):
+            self.positions[key] = position
+
+    def add(self, key, amount):
+        with self.lock:
+            position = self.positions.get(key)
+            if position is None:
+                position = self.append(key)
+            current, = self.value.unpack_from(self.map, position)
+            self.value.pack_into(self.map, position, current + amount)
+
+    def append(self, key):
+        """
+        Append a zero-valued entry; called with the lock held.
+
+        Returns:
+            int: Offset of the entry's value.
+        """
+        encoded = key.encode()
+        padded = (self.length.size + len(encoded) + 7) // 8 * 8
+        needed = self.used + padded + self.value.size
+        if needed > len(self.map):
+            size = len(self.map)
+            while size < needed:
+                size *= 2
+            os.ftruncate(self.fd, size)
+            self.map.close()
+            self.map = mmap.mmap(self.fd, size)
+        self.length.pack_into(self.map, self.used, len(encoded))
+        self.map[self.used + self.length.size:self.used + self.length.size + len(encoded)] = encoded
+        position = self.used + padded
+        self.value.pack_into(self.map, position, 0.0)
+        self.used = needed
+        self.header.pack_into(self.map, 0, self.used)
+        self.positions[key] = position
+        return position
+
+    def items(self):
+        return read_file(self.path)
+
+    def close(self):
+        self.map.close()
+        os.close(self.fd)
+
+
+def iter_entries(data, used):
+    """
+    Iterate over the entries of MmapStore data.
+
+    Args:
+        data (bytes | mmap.mmap): File contents.
+        used (int): Number of used bytes from the header.
+
+    Yields:
+        tuple[str, int]: Key and offset of its value.
+    """
+    offset = MmapStore.header.size
+    while offset < used:
+        size, = MmapStore.length.unpack_from(data, offset)
+        key = bytes(data[offset + MmapStore.length.size:offset + MmapStore.length.size + size]).decode()
+        offset += (MmapStore.length.size + size + 7) // 8 * 8
+        yield key, offset
+        offset += MmapStore.value.size
+
+
+def read_file(path):
+    """
+    Read the entries of a metrics file written by MmapStore.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        list[tuple[str, float]]: (key, value) pairs.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if len(data) < MmapStore.header.size:
+        return []
+    used, = MmapStore.header.unpack_from(data, 0)
+    return [(key, MmapStore.value.unpack_from(data, offset)[0]) for key, offset in iter_entries(data, used)]
+
+
+@contextmanager
+def locked(directory, exclusive):
+    """
+    Hold the lock of a metrics directory.
+
+    Archiving takes it exclusively and collecting shared, so a scrape never
+    sees a file both in the archive and on its own.
+
+    Args:
+        directory (str): METRICS_DIR.
+        exclusive (bool): Take an exclusive instead of a shared lock.
+    """
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(os.path.join(directory, 'metrics.lock'), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        os.close(fd)
+
+
+def process_exists(pid):
+    """
+    Check whether a process is still running (or not yet reaped).
+
+    Args:
+        pid (int): Process id.
+
+    Returns:
+        bool: False if no such process exists.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def archive_exited():
+    """
+    Fold the metric files of exited processes into the archive file and delete them.
+
+    Does nothing without settings.METRICS_DIR.
+
+    Returns:
+        int: Number of files archived.
+    """
+    directory = getattr(settings, 'METRICS_DIR', None)
+    if not directory or not os.path.isdir(directory):
+        return 0
+    with locked(directory, exclusive=True):
+        exited = []
+        for path in glob.glob(os.path.join(directory, 'metrics-*.db')):
+            pid = os.path.basename(path)[len('metrics-'):-len('.db')]
+            if pid.isdigit() and int(pid) != os.getpid() and not process_exists(int(pid)):
+                exited.append(path)
+        if not exited:
+            return 0
+        archive = MmapStore(os.path.join(directory, ARCHIVE_NAME))
+        try:
+            for path in exited:
+                try:
+                    entries = read_file(path)
+                except (OSError, struct.error, UnicodeDecodeError):
+                    entries = []
+                for key, value in entries:
+                    archive.add(key, value)
+        finally:
+            archive.close()
+        for path in exited:
+            os.unlink(path)
+    return len(exited)
+
+
+_store = None
+_store_pid = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """
+    Return the value store of the current process, creating it after a fork.
+
+    Returns:
+        DictStore | MmapStore: The store.
+    """
+    global _store, _store_pid
+    pid = os.getpid()
+    if _store_pid != pid:
+        with _store_lock:
+            if _store_pid != pid:
+                directory = getattr(settings, 'METRICS_DIR', None)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                    archive_exited()
+                    _store = MmapStore(os.path.join(directory, f'metrics-{pid}.db'))
+                else:
+                    _store = DictStore()
+                _store_pid = pid
+    return _store
+
+
+def collect():
+    """
+    Sum the values of all processes (or of this process without METRICS_DIR).
+
+    Returns:
+        dict[str, float]: Value per key.
+    """
+    directory = getattr(settings, 'METRICS_DIR', None)
+    if not directory:
+        return dict(get_store().items())
+    totals = {}
+    os.makedirs(directory, exist_ok=True)
+    with locked(directory, exclusive=False):
+        for path in glob.glob(os.path.join(directory, 'metrics-*.db')):
+            try:
+                entries = read_file(path)
+            except (OSError, struct.error, UnicodeDecodeError):
+                continue
+            for key, value in entries:
+                totals[key] = totals.get(key, 0.0) + value
+    return totals
+
+
+class Counter:
+    """
+    Monotonically increasing value per label set.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        labelnames (tuple[str]): Label names.
+    """
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _families[name] = self
+
+    def inc(self, amount=1.0, **labels):
+        """
+        Add to the counter.
+
+        Args:
+            amount (float): Non-negative increment.
+            **labels: Value for every label name.
+        """
+        get_store().add(f'{self.name}\t{format_labels(self.labelnames, labels)}', amount)
+
+    def samples(self, values):
+        """
+        Render the counter's samples.
+
+        Args:
+            values (dict[str, float]): Collected values of all metrics.
+
+        Returns:
+            list[str]: Sample lines.
+        """
+        lines = []
+        for key, value in sorted(values.items()):
+            name, labels = key.split('\t', 1)
+            if name == self.name:
+                lines.append(f'{self.name}_total{{{labels}}} {format_value(value)}' if labels else f'{self.name}_total {format_value(value)}')
+        return lines
+
+
+class Histogram:
+    """
+    Distribution of observed values per label set.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        labelnames (tuple[str]): Label names.
+        buckets (tuple[float]): Upper bounds, +Inf is added.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        _families[name] = self
+
+    def observe(self, value, **labels):
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value.
+            **labels: Value for every label name.
+        """
+        store = get_store()
+        labels = format_labels(self.labelnames, labels)
+        index = bisect.bisect_left(self.buckets, value)
+        store.add(f'{self.name}:bucket\t{labels}\t{index}', 1.0)
+        store.add(f'{self.name}:sum\t{labels}', value)
+
+    def samples(self, values):
+        """
+        Render cumulative buckets, sum and count per label set.
+
+        Args:
+            values (dict[str, float]): Collected values of all metrics.
+
+        Returns:
+            list[str]: Sample lines.
+        """
+        counts, sums = {}, {}
+        for key, value in values.items():
+            parts = key.split('\t')
+            if parts[0] == f'{self.name}:bucket':
+                counts.setdefault(parts[1], [0.0] * (len(self.buckets) + 1))[int(parts[2])] += value
+            elif parts[0] == f'{self.name}:sum':
+                sums[parts[1]] = value
+        lines = []
+        for labels in sorted(counts):
+            prefix = f'{labels},' if labels else ''
+            total = 0.0
+            for bound, count in zip((*self.buckets, '+Inf'), counts[labels]):
+                total += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {format_value(total)}')
+            suffix = f'{{{labels}}}' if labels else ''
+            lines.append(f'{self.name}_sum{suffix} {format_value(sums.get(labels, 0.0))}')
+            lines.append(f'{self.name}_count{suffix} {format_value(total)}')
+        return lines
+
+
+def render():
+    """
+    Render all metrics in the Prometheus text exposition format.
+
+    Returns:
+        str: Exposition text.
+    """
+    values = collect()
+    lines = []
+    for name, family in sorted(_families.items()):
+        exposed = f'{name}_total' if family.kind == 'counter' else name
+        lines.append(f'# HELP {exposed} {family.documentation}')
+        lines.append(f'# TYPE {exposed} {family.kind}')
+        lines.extend(family.samples(values))
+    return '\n'.join(lines) + '\n'
+
+
+http_requests = Counter('http_requests', 'HTTP requests by route, method and status.', ('route', 'method', 'status'))
+http_request_duration = Histogram('http_request_duration_seconds', 'Request latency by route.', ('route',))
+db_queries = Counter('db_queries', 'Database queries by route.', ('route',))
+db_query_seconds = Counter('db_query_seconds', 'Time spent in database queries by route.', ('route',))
+cache_requests = Counter('cache_requests', 'Cache lookups by cache and result (hit, stale, miss).', ('cache', 'result'))
+handled_errors = Counter('handled_errors', 'HTTP 500 responses produced by handle_exceptions, by action.', ('action',))
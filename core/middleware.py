@@ -0,0 +1,362 @@
+"""
+HTTP middleware shared by all apps.
+"""
+import time
+import zlib
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_string
+
+from core import metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/x-ndjson', 'application/javascript', 'application/xml')
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+
+
+class GzipStream:
+    """
+    Incremental gzip compressor for streaming responses.
+    """
+    name = 'gzip'
+
+    def __init__(self):
+        self.compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk):
+        return self.compressor.compress(chunk)
+
+    def finish(self):
+        return self.compressor.flush()
+
+
+class BrotliStream:
+    """
+    Incremental brotli compressor for streaming responses.
+    """
+    name = 'br'
+
+    def __init__(self):
+        self.compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, chunk):
+        return self.compressor.process(chunk)
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+def accepted_encodings(header):
+    """
+    Parse an Accept-Encoding header into quality values.
+
+    Args:
+        header (str): Raw header value.
+
+    Returns:
+        dict[str, float]: Coding -> q value; '*' is kept as given.
+    """
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses with brotli or gzip, as negotiated by Accept-Encoding.
+
+    Brotli is preferred when the `brotli` package is installed. Responses
+    smaller than `settings.COMPRESSION_MIN_SIZE` bytes, non-text content,
+    already encoded responses and `Cache-Control: no-transform` responses are
+    left alone. Streaming responses (e.g. NDJSON exports) are compressed
+    incrementally while they are sent. Like Django's GZipMiddleware, gzip
+    bodies get random header padding against BREACH-style length attacks, and
+    strong ETags are weakened.
+
+    Must be placed above every middleware that reads or changes the body.
+    """
+    max_random_bytes = 100
+
+    def process_response(self, request, response):
+        """
+        Compress the response body if worthwhile and accepted.
+
+        Args:
+            request (HttpRequest): Incoming request.
+            response (HttpResponse): Outgoing response.
+
+        Returns:
+            HttpResponse: The possibly compressed response.
+        """
+        if response.has_header('Content-Encoding') or not self.is_compressible(response):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        codec = self.negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if codec is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self.compress_async(response.streaming_content, codec())
+            else:
+                response.streaming_content = self.compress_stream(response.streaming_content, codec())
+            del response.headers['Content-Length']
+        else:
+            compressed = self.compress(response.content, codec)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = codec.name
+        return response
+
+    def is_compressible(self, response):
+        """
+        Check the content type and caching directives of a response.
+
+        Args:
+            response (HttpResponse): Outgoing response.
+
+        Returns:
+            bool: True if the body may be compressed.
+        """
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return False
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith(('+json', '+xml'))
+
+    def negotiate(self, header):
+        """
+        Pick the best supported coding the client accepts.
+
+        Args:
+            header (str): Accept-Encoding header.
+
+        Returns:
+            type | None: BrotliStream or GzipStream, or None for identity.
+        """
+        accepted = accepted_encodings(header)
+        codecs = [BrotliStream, GzipStream] if brotli is not None else [GzipStream]
+        best, best_quality = None, 0.0
+        for codec in codecs:
+            quality = accepted.get(codec.name, accepted.get('*', 0.0))
+            if quality > best_quality:
+                best, best_quality = codec, quality
+        return best
+
+    def compress(self, content, codec):
+        """
+        Compress a complete body.
+
+        Args:
+            content (bytes): Response body.
+            codec (type): BrotliStream or GzipStream.
+
+        Returns:
+            bytes: Compressed body.
+        """
+        if codec is GzipStream:
+            return compress_string(content, max_random_bytes=self.max_random_bytes)
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+
+    def compress_stream(self, chunks, compressor):
+        """
+        Compress a synchronous stream, yielding output whenever the compressor emits it.
+
+        Args:
+            chunks (Iterable[bytes]): Original streaming content.
+            compressor (GzipStream | BrotliStream): Fresh compressor.
+
+        Yields:
+            bytes: Compressed chunks.
+        """
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+
+    async def compress_async(self, chunks, compressor):
+        """
+        Compress an asynchronous stream.
+
+        Args:
+            chunks (AsyncIterable[bytes]): Original streaming content.
+            compressor (GzipStream | BrotliStream): Fresh compressor.
+
+        Yields:
+            bytes: Compressed chunks.
+        """
+        async for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+
+
+class RateLimitHeadersMiddleware(MiddlewareMixin):
+    """
+    Report the client's throttle bucket in RateLimit-Limit, RateLimit-Remaining
+    and RateLimit-Reset headers.
+
+    The state is set on the request by core.throttling.ScopedTokenBucketThrottle;
+    responses of views without a throttle scope get no headers. Throttled
+    responses additionally carry DRF's Retry-After header.
+    """
+    def process_response(self, request, response):
+        """
+        Add the rate limit headers if the request was throttled by scope.
+
+        Args:
+            request (HttpRequest): Incoming request.
+            response (HttpResponse): Outgoing response.
+
+        Returns:
+            HttpResponse: The response with rate limit headers.
+        """
+        rate_limit = getattr(request, 'rate_limit', None)
+        if rate_limit is not None:
+            response.headers['RateLimit-Limit'] = str(rate_limit.limit)
+            response.headers['RateLimit-Remaining'] = str(rate_limit.remaining)
+            response.headers['RateLimit-Reset'] = str(rate_limit.reset)
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Record request counts, latency and database queries per named route.
+
+    Routes are identified by URL pattern name (e.g. 'board-list'), so
+    metrics do not grow with ids in paths. Unresolved paths are reported as
+    'unmatched'. Should be the first middleware, so that the measured
+    latency includes the whole stack.
+
+    Synchronous streaming responses (the NDJSON exports) are recorded when
+    their content has been consumed, so the latency and the queries run while
+    streaming are included. Asynchronous streams are recorded when the
+    response is returned and undercount both.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Time the request and count its database queries.
+
+        Args:
+            request (HttpRequest): Incoming request.
+
+        Returns:
+            HttpResponse: The response of the rest of the stack.
+        """
+        started = time.perf_counter()
+        wrapper = QueryMetricsWrapper(request)
+        with self.count_queries(wrapper):
+            response = self.get_response(request)
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.measure_stream(
+                response.streaming_content, wrapper, request, response.status_code, started
+            )
+        else:
+            self.record(request, response.status_code, started)
+        return response
+
+    def count_queries(self, wrapper):
+        """
+        Install a query wrapper on all database connections.
+
+        Args:
+            wrapper (QueryMetricsWrapper): Wrapper of the request.
+
+        Returns:
+            ExitStack: Context manager removing the wrapper again.
+        """
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(wrapper))
+        return stack
+
+    def measure_stream(self, chunks, wrapper, request, status, started):
+        """
+        Pass a streaming body through, counting its queries, and record the request at its end.
+
+        Args:
+            chunks (Iterable[bytes]): Original streaming content.
+            wrapper (QueryMetricsWrapper): Wrapper of the request.
+            request (HttpRequest): Incoming request.
+            status (int): Response status code.
+            started (float): perf_counter() value at the start of the request.
+
+        Yields:
+            bytes: The original chunks.
+        """
+        try:
+            with self.count_queries(wrapper):
+                yield from chunks
+        finally:
+            self.record(request, status, started)
+
+    def record(self, request, status, started):
+        route = route_name(request)
+        metrics.http_requests.inc(route=route, method=request.method, status=status)
+        metrics.http_request_duration.observe(time.perf_counter() - started, route=route)
+
+
+class QueryMetricsWrapper:
+    """
+    Database execute wrapper counting queries and their time for a request's route.
+    """
+    def __init__(self, request):
+        self.request = request
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            route = route_name(self.request)
+            metrics.db_queries.inc(route=route)
+            metrics.db_query_seconds.inc(time.perf_counter() - started, route=route)
+
+
+def route_name(request):
+    """
+    Return the URL pattern name a request was resolved to.
+
+    Args:
+        request (HttpRequest): The request.
+
+    Returns:
+        str: Pattern name, view path for unnamed patterns, or 'unmatched'.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+    return match.url_name or match.view_name or 'unnamed'
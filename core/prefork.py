@@ -0,0 +1,329 @@
+"""
+Preforking WSGI server.
+
+The master process loads and warms up the WSGI application once, freezes
+the garbage collector's view of all objects created so far (gc.freeze()),
+and forks the workers. Workers inherit the loaded application and the
+listening socket, so their copies of Django, the apps and the URL conf stay
+shared copy-on-write pages instead of being imported once per worker.
+Without gc.freeze(), the first collection in a worker would touch the
+reference counts and GC headers of all those objects and unshare the pages.
+
+Signals sent to the master:
+    SIGTERM, SIGINT   Graceful shutdown: workers finish their current request.
+    SIGHUP            Graceful reload: workers finish their current request,
+                      then the master re-executes itself with fresh code and
+                      the same listening socket, so no connection is refused.
+    SIGUSR1           Print the memory usage of the master and every worker.
+
+Workers exit after `max_requests` requests (plus random jitter, so they do
+not all restart together) and are replaced by new forks of the master.
+
+The shared listener is non-blocking: every idle worker wakes up when a
+connection arrives, and the ones that lose the race to accept() it get
+BlockingIOError and go back to waiting instead of blocking in accept(), where
+they would no longer notice SIGTERM. Client sockets get a timeout, and workers
+that have not exited `graceful_timeout` seconds after SIGTERM are killed.
+"""
+import gc
+import os
+import random
+import signal
+import socket
+import sys
+import time
+
+from django.core.servers.basehttp import WSGIRequestHandler, WSGIServer, get_internal_wsgi_application
+from django.db import connections
+
+from core import metrics
+
+LISTEN_FD_ENV = 'PREFORK_LISTEN_FD'
+
+MEMORY_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty')
+
+
+def memory_usage(pid):
+    """
+    Read the memory usage of a process from /proc (Linux only).
+
+    Args:
+        pid (int): Process id.
+
+    Returns:
+        dict[str, int] | None: {'rss', 'pss', 'shared', 'private'} in kB, or
+            None if the information is unavailable.
+    """
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as smaps:
+            values = {}
+            for line in smaps:
+                name, _, rest = line.partition(':')
+                if name in MEMORY_FIELDS:
+                    values[name] = int(rest.split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return {
+        'rss': values.get('Rss', 0),
+        'pss': values.get('Pss', 0),
+        'shared': values.get('Shared_Clean', 0) + values.get('Shared_Dirty', 0),
+        'private': values.get('Private_Clean', 0) + values.get('Private_Dirty', 0),
+    }
+
+
+class WorkerRequestHandler(WSGIRequestHandler):
+    """
+    Django's request handler with the worker's timeout on the client socket.
+    """
+    def setup(self):
+        self.timeout = self.server.request_timeout
+        super().setup()
+
+
+class WorkerServer(WSGIServer):
+    """
+    Django's development WSGI server serving a socket inherited from the master.
+
+    Django closes every connection after one response on non-threaded
+    servers, so a worker never blocks on an idle keep-alive connection.
+    """
+    def __init__(self, listener, request_timeout=30):
+        super().__init__(listener.getsockname()[:2], WorkerRequestHandler, bind_and_activate=False)
+        self.socket.close()
+        self.socket = listener
+        self.server_address = listener.getsockname()
+        host, port = self.server_address[:2]
+        self.server_name = socket.getfqdn(host)
+        self.server_port = port
+        self.setup_environ()
+        self.request_timeout = request_timeout
+        self.requests = 0
+
+    def finish_request(self, request, client_address):
+        super().finish_request(request, client_address)
+        self.requests += 1
+
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], TimeoutError):
+            sys.stderr.write(f'Timed out reading from {client_address[0]}.\n')
+            return
+        super().handle_error(request, client_address)
+
+
+class PreforkServer:
+    """
+    Master process managing a pool of forked WSGI workers.
+
+    Attributes:
+        address (tuple[str, int]): Host and port to listen on.
+        workers (int): Number of worker processes.
+        max_requests (int): Requests after which a worker is replaced, 0 for never.
+        max_requests_jitter (int): Random extra requests per worker.
+        freeze (bool): Call gc.freeze() before forking.
+        stats_interval (float): Seconds between memory reports, 0 for SIGUSR1 only.
+        request_timeout (float): Seconds a worker waits on a silent client socket.
+        graceful_timeout (float): Seconds a worker gets to exit after SIGTERM before it is killed.
+        log (callable): Receives status lines.
+    """
+    def __init__(self, address, workers=2, max_requests=0, max_requests_jitter=0,
+                 freeze=True, stats_interval=0, request_timeout=30, graceful_timeout=30, log=print):
+        self.address = address
+        self.workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.freeze = freeze
+        self.stats_interval = stats_interval
+        self.request_timeout = request_timeout
+        self.graceful_timeout = graceful_timeout
+        self.log = log
+        self.children = {}
+        self.signalled = {}
+        self.stopping = False
+        self.reloading = False
+        self.report_due = False
+        self.listener = None
+        self.application = None
+
+    def listen(self):
+        """
+        Open the listening socket, or adopt the one handed over by a reload.
+
+        Returns:
+            socket.socket: Non-blocking listening socket.
+        """
+        fd = os.environ.pop(LISTEN_FD_ENV, None)
+        if fd is not None:
+            listener = socket.socket(fileno=int(fd))
+        else:
+            listener = socket.create_server(self.address, backlog=128)
+        listener.setblocking(False)
+        return listener
+
+    def load(self):
+        """
+        Load and warm up the application and prepare the heap for forking.
+        """
+        from django.conf import settings
+        from core.warmup import warm_up
+
+        self.application = get_internal_wsgi_application()
+        if not settings.WARMUP_ON_STARTUP:
+            # Loading core.wsgi warms up only if enabled; forked workers always
+            # benefit, since the warmed state is shared by all of them.
+            warm_up()
+        connections.close_all()
+        if self.freeze:
+            gc.collect()
+            gc.freeze()
+
+    def run(self):
+        """
+        Start the workers and supervise them until shutdown or reload.
+        """
+        self.listener = self.listen()
+        self.load()
+        self.log(f'Master {os.getpid()} listening on {self.listener.getsockname()[:2]} '
+                 f'with {self.workers} workers (gc.freeze: {self.freeze}, frozen objects: {gc.get_freeze_count()}).')
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        signal.signal(signal.SIGHUP, self.request_reload)
+        signal.signal(signal.SIGUSR1, self.request_report)
+
+        next_report = time.monotonic() + self.stats_interval if self.stats_interval else None
+        while True:
+            self.reap()
+            if self.stopping or self.reloading:
+                self.stop_workers()
+                if not self.children:
+                    break
+            else:
+                while len(self.children) < self.workers:
+                    self.spawn()
+            if next_report is not None and time.monotonic() >= next_report:
+                self.report_due = True
+                next_report += self.stats_interval
+            if self.report_due:
+                self.report_due = False
+                self.report()
+            time.sleep(0.2)
+
+        if self.reloading:
+            self.reexec()
+        self.listener.close()
+        self.log(f'Master {os.getpid()} stopped.')
+
+    def spawn(self):
+        """
+        Fork one worker.
+        """
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+        code = 0
+        try:
+            self.serve()
+        except BaseException:
+            code = 1
+            import traceback
+            traceback.print_exc()
+        finally:
+            os._exit(code)
+
+    def serve(self):
+        """
+        Worker main loop: handle requests until told to stop or recycled.
+        """
+        stop = []
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.append(signum))
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+        random.seed()
+
+        server = WorkerServer(self.listener, self.request_timeout)
+        server.set_app(self.application)
+        server.timeout = 0.5
+        limit = self.max_requests + random.randint(0, self.max_requests_jitter) if self.max_requests else None
+        while not stop and (limit is None or server.requests < limit):
+            server.handle_request()
+        connections.close_all()
+
+    def reap(self):
+        """
+        Collect exited workers and archive their metric files.
+        """
+        reaped = False
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                break
+            if not pid:
+                break
+            reaped = True
+            self.children.pop(pid, None)
+            self.signalled.pop(pid, None)
+            if not (self.stopping or self.reloading) and os.waitstatus_to_exitcode(status) != 0:
+                self.log(f'Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}.')
+        if reaped:
+            metrics.archive_exited()
+
+    def stop_workers(self):
+        """
+        Ask all workers to finish their current request and exit.
+
+        Workers still running `graceful_timeout` seconds after SIGTERM are killed.
+        """
+        now = time.monotonic()
+        for pid in list(self.children):
+            if pid not in self.signalled:
+                self.signalled[pid] = now
+                sig = signal.SIGTERM
+            elif now - self.signalled[pid] >= self.graceful_timeout:
+                self.log(f'Worker {pid} did not exit within {self.graceful_timeout}s, killing it.')
+                self.signalled[pid] = float('inf')
+                sig = signal.SIGKILL
+            else:
+                continue
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                self.children.pop(pid, None)
+
+    def reexec(self):
+        """
+        Replace the master by a fresh interpreter that keeps the listening socket.
+        """
+        self.listener.set_inheritable(True)
+        os.environ[LISTEN_FD_ENV] = str(self.listener.fileno())
+        self.log(f'Master {os.getpid()} reloading.')
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable, *sys.argv])
+
+    def report(self):
+        """
+        Log the memory usage of the master and every worker.
+        """
+        self.log(f'{"process":>14} {"rss kB":>10} {"pss kB":>10} {"shared kB":>10} {"private kB":>10}')
+        total = {'rss': 0, 'pss': 0}
+        for name, pid in [('master', os.getpid()), *(('worker', pid) for pid in sorted(self.children))]:
+            usage = memory_usage(pid)
+            if usage is None:
+                self.log(f'{name} {pid:>7} {"n/a":>10}')
+                continue
+            total['rss'] += usage['rss']
+            total['pss'] += usage['pss']
+            self.log(f'{name} {pid:>7} {usage["rss"]:>10} {usage["pss"]:>10} {usage["shared"]:>10} {usage["private"]:>10}')
+        self.log(f'{"total":>14} {total["rss"]:>10} {total["pss"]:>10}')
+
+    def request_stop(self, signum, frame):
+        self.stopping = True
+
+    def request_reload(self, signum, frame):
+        self.reloading = True
+
+    def request_report(self, signum, frame):
+        self.report_due = True
@@ -0,0 +1,325 @@
+"""
+Measurements of Django startup and per-request overhead.
+
+Startup can only be measured once per interpreter, so every measurement
+runs in a fresh Python subprocess with the settings module under test; the
+child prints its results as JSON on stdout.
+"""
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+
+
+def wsgi_environ(path, method='GET', headers=None):
+    """
+    Build a minimal WSGI environ for a request without body.
+
+    Args:
+        path (str): Request path, optionally with a query string.
+        method (str): HTTP method.
+        headers (dict, optional): Extra request headers by name.
+
+    Returns:
+        dict: WSGI environ.
+    """
+    path, _, query = path.partition('?')
+    extra = {'HTTP_' + name.upper().replace('-', '_'): value for name, value in (headers or {}).items()}
+    return {
+        **extra,
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SCRIPT_NAME': '',
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': 'localhost',
+        'HTTP_ACCEPT': 'application/json',
+        'REMOTE_ADDR': '127.0.0.1',
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.url_scheme': 'http',
+        'wsgi.version': (1, 0),
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+
+
+def time_calls(func, count):
+    """
+    Call a function repeatedly and return the median duration.
+
+    Args:
+        func (callable): Zero-argument function.
+        count (int): Number of calls.
+
+    Returns:
+        float: Median duration in microseconds.
+    """
+    durations = []
+    for _ in range(count):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations) * 1e6
+
+
+def measure_requests(path, count):
+    """
+    Time requests through the full WSGI handler and through the view alone.
+
+    The difference is the per-request cost of the middleware stack and the
+    handler around the view.
+
+    Args:
+        path (str): Path to request; should not need the database.
+        count (int): Requests per measurement.
+
+    Returns:
+        dict: {'status', 'handler_us', 'view_us', 'middleware_us'} with median durations.
+    """
+    from django.core.handlers.wsgi import WSGIHandler, WSGIRequest
+    from django.urls import resolve
+
+    handler = WSGIHandler()
+    statuses = []
+
+    def through_handler():
+        result = handler(wsgi_environ(path), lambda status, headers, exc_info=None: statuses.append(status))
+        b''.join(result)
+        result.close()
+
+    match = resolve(path.partition('?')[0])
+
+    def view_only():
+        response = match.func(WSGIRequest(wsgi_environ(path)), *match.args, **match.kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+
+    through_handler()
+    handler_us = time_calls(through_handler, count)
+    view_us = time_calls(view_only, count)
+    return {
+        'status': statuses[0],
+        'handler_us': round(handler_us, 1),
+        'view_us': round(view_us, 1),
+        'middleware_us': round(handler_us - view_us, 1),
+    }
+
+
+def measure_current_profile(path, count):
+    """
+    Measure django.setup(), URL conf loading and request overhead in this process.
+
+    Must run in a fresh interpreter before Django is set up.
+
+    Args:
+        path (str): Path used for request timings.
+        count (int): Requests per measurement.
+
+    Returns:
+        dict: Setup and request timings plus the size of the profile.
+    """
+    import django
+
+    modules_before = len(sys.modules)
+    started = time.perf_counter()
+    django.setup()
+    setup_ms = (time.perf_counter() - started) * 1000
+
+    from django.urls import get_resolver
+
+    started = time.perf_counter()
+    resolver = get_resolver()
+    resolver.url_patterns
+    resolver.reverse_dict
+    urls_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        'settings': os.environ['DJANGO_SETTINGS_MODULE'],
+        'apps': len(settings.INSTALLED_APPS),
+        'middleware': len(settings.MIDDLEWARE),
+        'modules': len(sys.modules) - modules_before,
+        'setup_ms': round(setup_ms, 1),
+        'urls_ms': round(urls_ms, 1),
+        **measure_requests(path, count),
+    }
+
+
+def run_in_subprocess(settings_module, function, **kwargs):
+    """
+    Run a measurement function of this module in a fresh interpreter.
+
+    Args:
+        settings_module (str): DJANGO_SETTINGS_MODULE for the child.
+        function (str): Name of a function in this module returning JSON-serializable data.
+        **kwargs: Keyword arguments for the function.
+
+    Raises:
+        RuntimeError: If the child process fails.
+
+    Returns:
+        The function's result.
+    """
+    code = (
+        'import json, sys; from core import profiling; '
+        f'print(json.dumps(profiling.{function}(**json.loads(sys.argv[1]))))'
+    )
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module}
+    completed = subprocess.run(
+        [sys.executable, '-c', code, json.dumps(kwargs)],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'failed')
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def time_app_ready():
+    """
+    Record how long each AppConfig.ready() takes during the next django.setup().
+
+    Returns:
+        dict[str, float]: Filled with app label -> milliseconds as apps become ready.
+    """
+    from django.apps import AppConfig
+
+    timings = {}
+    create = AppConfig.create.__func__
+
+    def timed_create(cls, entry):
+        config = create(cls, entry)
+        ready = config.ready
+
+        def timed_ready():
+            started = time.perf_counter()
+            ready()
+            timings[config.label] = round((time.perf_counter() - started) * 1000, 2)
+
+        config.ready = timed_ready
+        return config
+
+    AppConfig.create = classmethod(timed_create)
+    return timings
+
+
+def measure_startup(path, count, warm, headers=None):
+    """
+    Measure a cold start in this process: setup, app readiness, URL conf,
+    optional warm-up, and the latency of the first and later requests.
+
+    Must run in a fresh interpreter before Django is set up.
+
+    Args:
+        path (str): Path requested.
+        count (int): Requests timed after the first one.
+        warm (bool): Run core.warmup.warm_up() before the first request.
+        headers (dict, optional): Request headers, e.g. Authorization.
+
+    Returns:
+        dict: Timings in milliseconds, per-app ready() times and warm-up steps.
+    """
+    import django
+
+    ready_ms = time_app_ready()
+    started = time.perf_counter()
+    django.setup()
+    setup_ms = (time.perf_counter() - started) * 1000
+
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.urls import get_resolver
+
+    started = time.perf_counter()
+    handler = WSGIHandler()
+    handler_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    get_resolver().url_patterns
+    urls_ms = (time.perf_counter() - started) * 1000
+
+    warmup_ms = {}
+    if warm:
+        from core.warmup import warm_up
+
+        warmup_ms = warm_up()
+
+    def request():
+        result = handler(wsgi_environ(path, headers=headers), lambda status, response_headers, exc_info=None: None)
+        b''.join(result)
+        result.close()
+
+    started = time.perf_counter()
+    request()
+    first_ms = (time.perf_counter() - started) * 1000
+    steady_ms = time_calls(request, count) / 1000
+
+    return {
+        'setup_ms': round(setup_ms, 1),
+        'ready_ms': ready_ms,
+        'handler_ms': round(handler_ms, 1),
+        'urls_ms': round(urls_ms, 1),
+        'warmup_ms': warmup_ms,
+        'first_request_ms': round(first_ms, 2),
+        'steady_request_ms': round(steady_ms, 3),
+    }
+
+
+def import_tree(settings_module):
+    """
+    Record the import-time tree of a cold start (setup and URL conf) with `python -X importtime`.
+
+    Args:
+        settings_module (str): DJANGO_SETTINGS_MODULE for the child.
+
+    Raises:
+        RuntimeError: If the child process fails.
+
+    Returns:
+        list[dict]: Root imports as {'name', 'self_us', 'cumulative_us', 'children'}.
+    """
+    code = 'import django; django.setup(); from django.urls import get_resolver; get_resolver().url_patterns'
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module}
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return parse_import_times(completed.stderr)
+
+
+def parse_import_times(output):
+    """
+    Turn `-X importtime` output into a tree.
+
+    The output lists every module after its own imports, indented by two
+    spaces per nesting level, so children are collected until their parent's
+    line appears.
+
+    Args:
+        output (str): stderr of the child interpreter.
+
+    Returns:
+        list[dict]: Root imports in import order.
+    """
+    pending = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        node = {
+            'name': name.strip(),
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            'children': pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
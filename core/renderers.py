@@ -0,0 +1,188 @@
+"""
+Fast JSON rendering for API responses.
+
+FastJSONRenderer encodes with orjson when it is installed and falls back to
+the standard library otherwise; both produce the same bytes as DRF's
+JSONRenderer. Values wrapped in PreEncoded are spliced into the output
+verbatim, so cached JSON fragments (e.g. one blob per ticket) can be embedded
+into larger responses without being decoded and re-encoded.
+"""
+import json
+import re
+import secrets
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+class PreEncoded:
+    """
+    A JSON value that has already been encoded.
+
+    Attributes:
+        json (bytes): The encoded JSON value, inserted into responses as-is.
+    """
+    __slots__ = ('json',)
+
+    def __init__(self, encoded):
+        self.json = encoded.encode() if isinstance(encoded, str) else bytes(encoded)
+
+    def __repr__(self):
+        return f'PreEncoded({self.json!r})'
+
+
+def pre_encode(data):
+    """
+    Encode a value once so that it can be cached and embedded later.
+
+    Args:
+        data: JSON-serializable value.
+
+    Returns:
+        PreEncoded: The encoded value.
+    """
+    return PreEncoded(FastJSONRenderer().render(data))
+
+
+class FragmentCollector:
+    """
+    Replace PreEncoded values by unique placeholder strings during encoding
+    and splice the fragments back in afterwards.
+
+    Placeholders contain a random per-render token, so they cannot collide
+    with strings in the payload.
+    """
+    def __init__(self):
+        self.token = secrets.token_hex(8)
+        self.fragments = []
+
+    def placeholder(self, fragment):
+        """
+        Remember a fragment and return the string encoded in its place.
+
+        Args:
+            fragment (PreEncoded): Fragment to splice in later.
+
+        Returns:
+            str: Placeholder string.
+        """
+        self.fragments.append(fragment.json)
+        return f'__pre_encoded_{self.token}_{len(self.fragments) - 1}__'
+
+    def splice(self, encoded):
+        """
+        Substitute the quoted placeholders in the encoded output.
+
+        Args:
+            encoded (bytes): Output containing placeholders.
+
+        Returns:
+            bytes: Output with the fragments in place.
+        """
+        if not self.fragments:
+            return encoded
+        pattern = re.compile(rb'"__pre_encoded_' + self.token.encode() + rb'_(\d+)__"')
+        return pattern.sub(lambda match: self.fragments[int(match.group(1))], encoded)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer backed by orjson.
+
+    Types orjson cannot encode natively (lazy strings, datetimes, decimals,
+    querysets, ...) are converted by DRF's JSONEncoder, so the output matches
+    the default renderer byte for byte. Indented output (browsable API,
+    `Accept: application/json; indent=4`) always uses the standard library.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+
+        Args:
+            data: Response data, may contain PreEncoded values.
+            accepted_media_type (str, optional): Negotiated media type.
+            renderer_context (dict, optional): View, request and response.
+
+        Returns:
+            bytes: Encoded JSON, empty for None.
+        """
+        if data is None:
+            return b''
+        collector = FragmentCollector()
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is not None and indent is None and self.compact and not self.ensure_ascii:
+            encoded = self.encode_orjson(data, collector)
+        else:
+            encoded = self.encode_stdlib(data, collector, indent)
+        for raw, escaped in LINE_SEPARATORS:
+            if raw in encoded:
+                encoded = encoded.replace(raw, escaped)
+        return collector.splice(encoded)
+
+    def encode_orjson(self, data, collector):
+        """
+        Encode with orjson, delegating unsupported types to DRF's encoder.
+
+        Args:
+            data: Value to encode.
+            collector (FragmentCollector): Receives PreEncoded values.
+
+        Returns:
+            bytes: Compact UTF-8 JSON.
+        """
+        fallback = self.encoder_class()
+
+        def default(obj):
+            if isinstance(obj, PreEncoded):
+                return collector.placeholder(obj)
+            return fallback.default(obj)
+
+        return orjson.dumps(data, default=default, option=ORJSON_OPTIONS)
+
+    def encode_stdlib(self, data, collector, indent):
+        """
+        Encode with the json module using DRF's encoder and separators.
+
+        Args:
+            data: Value to encode.
+            collector (FragmentCollector): Receives PreEncoded values.
+            indent (int | None): Indentation, None for single-line output.
+
+        Returns:
+            bytes: UTF-8 JSON.
+        """
+        base = self.encoder_class
+
+        class Encoder(base):
+            def default(self, obj):
+                if isinstance(obj, PreEncoded):
+                    return collector.placeholder(obj)
+                return super().default(obj)
+
+        if indent is None:
+            separators = (',', ':') if self.compact else (', ', ': ')
+        else:
+            separators = (',', ': ')
+        return json.dumps(
+            data, cls=Encoder, indent=indent, ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict, separators=separators,
+        ).encode()
+
+
+class NormalizedJSONRenderer(FastJSONRenderer):
+    """
+    JSON renderer selected by `?format=normalized`.
+
+    Encodes exactly like FastJSONRenderer; views that list it check
+    `request.accepted_renderer.format` to build a normalized payload with
+    side-loaded related objects instead of nested ones.
+    """
+    format = 'normalized'
@@ -39,16 +39,24 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework.authtoken',
+    'core',
     'auth_app',
     'boards_app',
     'ticket_app',
     'comments_app',
+    'search_app',
+    'jobs_app',
+    'batch_app',
+    'idempotency_app',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'core.middleware.RateLimitHeadersMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -133,5 +141,88 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.TokenAuthentication',
-    ]
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'core.throttling.ScopedTokenBucketThrottle',
+    ],
+    # Token buckets per client and view throttle_scope: '<burst>/<period>',
+    # refilled at that average rate (see core.throttling).
+    'DEFAULT_THROTTLE_RATES': {
+        'auth': '30/min',
+        'boards': '300/min',
+        'tasks': '600/min',
+        'comments': '300/min',
+        'search': '120/min',
+    },
 }
+
+# False turns core.throttling.ScopedTokenBucketThrottle off. The test runner
+# (core.test_runner) does so, because all test clients share one anonymous
+# bucket per scope; ThrottleTests turn it back on.
+
+THROTTLE_ENABLED = True
+
+TEST_RUNNER = 'core.test_runner.TestRunner'
+
+# Cache alias holding the throttle buckets so that all workers share them,
+# e.g. a DatabaseCache or FileBasedCache entry in CACHES. None keeps the
+# buckets in each process.
+
+THROTTLE_CACHE = None
+
+# Seconds a user's dashboard (/api/dashboard/) is cached before being recomputed.
+
+DASHBOARD_CACHE_TTL = 30
+
+# Responses smaller than this many bytes are sent uncompressed by
+# core.middleware.CompressionMiddleware.
+
+COMPRESSION_MIN_SIZE = 1024
+
+# Maximum number of members embedded in board detail and update responses;
+# the full list is paged by /api/boards/<id>/members/.
+
+BOARD_MEMBER_PREVIEW = 50
+
+# Seconds an encoded board detail payload is cached in each worker. Entries are
+# keyed by the Board.version column, which every write replaces in its own
+# transaction, so committed changes are visible in all workers regardless of
+# this value.
+
+BOARD_DETAIL_CACHE_TTL = 300
+
+# Maximum number of operations accepted by one /api/batch/ request.
+
+BATCH_MAX_OPERATIONS = 20
+
+# Seconds an Idempotency-Key is remembered; retries after that run again.
+# Expired records are removed by the purge_idempotency_keys command.
+
+IDEMPOTENCY_KEY_TTL = 60 * 60 * 24
+
+# Seconds a request holds its Idempotency-Key before completing. Retries after
+# that run again, so a key is not blocked when its worker dies mid-request.
+# Keep it above the longest request time.
+
+IDEMPOTENCY_PENDING_LEASE = 60
+
+# Run core.warmup.warm_up() when the WSGI/ASGI application is loaded, so new
+# workers compile URL patterns and build serializer fields before their
+# first request.
+
+WARMUP_ON_STARTUP = True
+
+# Directory for per-process metric files (core.metrics). When set, /metrics
+# sums the counters of all worker processes; use a tmpfs path and empty it on
+# deploy. None keeps metrics in memory and reports the serving process only.
+
+METRICS_DIR = None
+
+# Bearer token required to read /metrics. Without a token the endpoint is
+# only served while DEBUG is on.
+
+METRICS_TOKEN = None
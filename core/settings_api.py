@@ -0,0 +1,57 @@
+"""
+API-only settings profile.
+
+Serves only /api/ with token authentication: the admin, sessions, messages,
+static files and templates are not installed, and the session, CSRF, auth,
+messages and clickjacking middleware are not run. DRF views authenticate
+with TokenAuthentication and are exempt from CSRF anyway, so API responses
+are unchanged apart from the browsable API and the X-Frame-Options header.
+
+Run API workers with DJANGO_SETTINGS_MODULE=core.settings_api (see
+core/wsgi_api.py) and route /admin/ to workers running core.settings.
+`python manage.py compare_settings_profiles` reports the difference.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import REST_FRAMEWORK
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'rest_framework',
+    'rest_framework.authtoken',
+    'core',
+    'auth_app',
+    'boards_app',
+    'ticket_app',
+    'comments_app',
+    'search_app',
+    'jobs_app',
+    'batch_app',
+    'idempotency_app',
+]
+
+MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'core.middleware.CompressionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'core.middleware.RateLimitHeadersMiddleware',
+]
+
+ROOT_URLCONF = 'core.urls_api'
+
+TEMPLATES = []
+
+WSGI_APPLICATION = 'core.wsgi_api.application'
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+    ],
+}
+
+# Sessions are not used by the API. Signed cookies need no sessions app or
+# table should anything (e.g. the test client) still touch request.session.
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
@@ -0,0 +1,145 @@
+"""
+Request coalescing for expensive, cacheable computations.
+
+SingleFlight lets concurrent callers with the same key share one execution of
+a function within a process. cached() combines it with the Django cache and
+probabilistic early expiration, so that a popular entry is recomputed by one
+caller shortly before it expires instead of by every caller right after.
+"""
+import math
+import random
+import threading
+import time
+
+from django.core.cache import cache
+
+from core import metrics
+
+
+class _Call:
+    """
+    One in-flight execution and its outcome.
+    """
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs block until it finishes and receive the same result or exception.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key (Hashable): Identity of the computation.
+            fn (callable): Zero-argument function to run.
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller.
+
+        Returns:
+            The result of fn.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = fn()
+            except BaseException as error:
+                call.error = error
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def in_flight(self, key):
+        """
+        Check whether a call for the key is currently running.
+
+        Args:
+            key (Hashable): Identity of the computation.
+
+        Returns:
+            bool: True while a leader is computing the key.
+        """
+        with self._lock:
+            return key in self._calls
+
+
+flights = SingleFlight()
+
+
+def _expires_early(entry, beta):
+    """
+    Decide whether to refresh an entry before it expires (XFetch).
+
+    The probability rises as expiry approaches and with the time the value
+    took to compute.
+
+    Args:
+        entry (tuple): (value, compute seconds, expiry timestamp).
+        beta (float): Eagerness; 0 disables early refresh.
+
+    Returns:
+        bool: True if this caller should recompute.
+    """
+    _, delta, expiry = entry
+    return time.time() - delta * beta * math.log(1.0 - random.random()) >= expiry
+
+
+def cached(key, compute, ttl, beta=1.0):
+    """
+    Return a cached value, computing it once per process on a miss.
+
+    Concurrent misses for the same key wait for a single computation. When an
+    entry is refreshed early, callers that find the refresh already running
+    are served the still-valid old value instead of waiting.
+
+    Args:
+        key (str): Cache key; should contain everything the value depends on.
+            The part before the first ':' names the cache in core.metrics.
+        compute (callable): Zero-argument function producing a picklable value.
+        ttl (int): Seconds the value is kept.
+        beta (float): Early refresh eagerness, see _expires_early().
+
+    Returns:
+        The cached or freshly computed value.
+    """
+    name = key.partition(':')[0]
+    entry = cache.get(key)
+    if entry is not None and not _expires_early(entry, beta):
+        metrics.cache_requests.inc(cache=name, result='hit')
+        return entry[0]
+    if entry is not None and flights.in_flight(key):
+        metrics.cache_requests.inc(cache=name, result='stale')
+        return entry[0]
+    metrics.cache_requests.inc(cache=name, result='miss')
+
+    def load():
+        started = time.monotonic()
+        value = compute()
+        cache.set(key, (value, time.monotonic() - started, time.time() + ttl), ttl)
+        return value
+
+    return flights.do(key, load)
@@ -0,0 +1,19 @@
+"""
+Test runner for the project.
+"""
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Django's test runner with API throttling turned off.
+
+    Throttle buckets live for the whole run and every anonymous test client
+    shares the 127.0.0.1 bucket, so throttled scopes would start answering
+    429 depending on how many tests ran before. Tests of the throttle enable
+    it with override_settings(THROTTLE_ENABLED=True).
+    """
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.THROTTLE_ENABLED = False
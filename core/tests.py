@@ -0,0 +1,292 @@
+import datetime
+import glob
+import gzip
+import json
+import multiprocessing
+import os
+import tempfile
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board
+from core import metrics, middleware, renderers
+from core.middleware import CompressionMiddleware
+from core.throttling import local_buckets, parse_rate
+from core.renderers import FastJSONRenderer, PreEncoded, pre_encode
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """
+    Tests for FastJSONRenderer and the splicing of PreEncoded fragments.
+    """
+    def payload(self):
+        return {
+            'id': 1,
+            'title': 'Ünïcode „text“   line',
+            'due_date': datetime.date(2024, 2, 29),
+            'amount': Decimal('1.50'),
+            'tags': ['a', None, True],
+            'nested': {'title': '__pre_encoded_deadbeef_0__', 'items': [{'id': 2}, {'id': 3, 'x': []}]},
+        }
+
+    def encoders(self):
+        yield 'orjson', mock.patch.object(renderers, 'orjson', renderers.orjson)
+        yield 'stdlib', mock.patch.object(renderers, 'orjson', None)
+
+    def test_spliced_output_equals_plain_render(self):
+        plain = {**self.payload(), 'list': [self.payload()['nested'], 1]}
+        spliced = self.payload()
+        spliced['nested']['items'] = [pre_encode(item) for item in spliced['nested']['items']]
+        spliced = {**spliced, 'nested': pre_encode(spliced['nested']), 'list': [pre_encode(plain['list'][0]), 1]}
+        for name, patch in self.encoders():
+            with self.subTest(encoder=name), patch:
+                rendered = FastJSONRenderer().render(spliced)
+                expected = FastJSONRenderer().render(plain)
+                self.assertEqual(json.loads(rendered), json.loads(expected))
+                self.assertEqual(rendered, expected)
+
+    def test_matches_drf_renderer(self):
+        for name, patch in self.encoders():
+            with self.subTest(encoder=name), patch:
+                self.assertEqual(FastJSONRenderer().render(self.payload()), JSONRenderer().render(self.payload()))
+
+    def test_indented_output_splices_fragments(self):
+        fragment = pre_encode({'id': 2})
+        rendered = FastJSONRenderer().render({'item': fragment}, 'application/json; indent=2')
+        self.assertEqual(json.loads(rendered), {'item': {'id': 2}})
+
+    def test_top_level_fragment_and_none(self):
+        self.assertEqual(FastJSONRenderer().render(PreEncoded(b'[1,2]')), b'[1,2]')
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200)
+class CompressionMiddlewareTests(SimpleTestCase):
+    """
+    Tests for Accept-Encoding negotiation and response compression.
+    """
+    body = json.dumps([{'id': number, 'title': 'ticket'} for number in range(50)]).encode()
+
+    def setUp(self):
+        patcher = mock.patch.object(middleware, 'brotli', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def process(self, response, accept='gzip'):
+        request = RequestFactory().get('/api/boards/', HTTP_ACCEPT_ENCODING=accept)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def json_response(self, body=None, **headers):
+        response = HttpResponse(self.body if body is None else body, content_type='application/json')
+        for name, value in headers.items():
+            response.headers[name] = value
+        return response
+
+    def test_gzip_is_negotiated(self):
+        response = self.process(self.json_response(ETag='"abc"'), 'deflate, gzip;q=0.8')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+    def test_weak_etag_is_kept(self):
+        response = self.process(self.json_response(ETag='W/"abc"'))
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+    def test_zero_quality_disables_coding(self):
+        for accept in ('gzip;q=0', 'identity', '', '*;q=0', 'gzip;q=0, *;q=1'):
+            with self.subTest(accept=accept):
+                response = self.process(self.json_response(), accept)
+                self.assertFalse(response.has_header('Content-Encoding'))
+                self.assertEqual(response.content, self.body)
+        self.assertEqual(self.process(self.json_response(), '*')['Content-Encoding'], 'gzip')
+
+    def test_small_bodies_are_not_compressed(self):
+        response = self.process(self.json_response(b'{"id": 1}'))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertFalse(response.has_header('Vary'))
+
+    def test_no_transform_and_binary_bodies_are_left_alone(self):
+        responses = [
+            self.json_response(**{'Cache-Control': 'private, no-transform'}),
+            HttpResponse(self.body, content_type='image/png'),
+            self.json_response(**{'Content-Encoding': 'br'}),
+        ]
+        for response in responses:
+            with self.subTest(headers=dict(response.headers)):
+                self.assertEqual(self.process(response).content, self.body)
+                self.assertNotEqual(response.get('Content-Encoding'), 'gzip')
+
+    def test_streaming_ndjson_is_compressed_incrementally(self):
+        lines = [json.dumps({'type': 'ticket', 'id': number}).encode() + b'\n' for number in range(20)]
+        consumed = []
+
+        def stream():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        response = StreamingHttpResponse(stream(), content_type='application/x-ndjson')
+        response = self.process(response)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(consumed, [])
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), b''.join(lines))
+
+
+@override_settings(THROTTLE_ENABLED=True)
+class ThrottleTests(APITestCase):
+    """
+    Tests for the scoped token bucket throttle.
+    """
+    def setUp(self):
+        local_buckets.clear()
+        self.addCleanup(local_buckets.clear)
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.client.force_authenticate(self.user)
+
+    def rates(self, **rates):
+        merged = {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], **rates}
+        return override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': merged})
+
+    def test_parse_rate_accepts_drf_units(self):
+        cases = {
+            '5/s': (5, 5.0), '5/second': (5, 5.0), '100/min': (100, 100 / 60), '100/minute': (100, 100 / 60),
+            '1000/hour': (1000, 1000 / 3600), '10/day': (10, 10 / 86400), '100/5m': (100, 100 / 300),
+        }
+        for rate, expected in cases.items():
+            with self.subTest(rate=rate):
+                self.assertEqual(parse_rate(rate), expected)
+        for rate in ('100', '100/', '/min', '100/week', '100/Min'):
+            with self.subTest(rate=rate), self.assertRaises(ValueError):
+                parse_rate(rate)
+
+    def test_bucket_allows_a_burst_then_returns_429(self):
+        with self.rates(tasks='2/minute'):
+            first = self.client.get('/api/tasks/assigned-to-me/')
+            self.assertEqual((first['RateLimit-Limit'], first['RateLimit-Remaining']), ('2', '1'))
+            self.assertEqual(self.client.get('/api/tasks/reviewing/').status_code, 200)
+            throttled = self.client.get('/api/tasks/assigned-to-me/')
+            self.assertEqual(throttled.status_code, 429)
+            self.assertEqual(throttled['RateLimit-Remaining'], '0')
+            self.assertIn(int(throttled['Retry-After']), range(1, 31))
+            self.assertEqual(self.client.get('/api/boards/').status_code, 200)
+
+
+@override_settings(METRICS_TOKEN='scrape-token')
+class MetricsTests(APITestCase):
+    """
+    Tests for the /metrics endpoint and the file-backed metric store.
+    """
+    def sample(self, text, line_prefix):
+        for line in text.splitlines():
+            if line.startswith(line_prefix):
+                return float(line.rsplit(' ', 1)[1])
+        return 0.0
+
+    def scrape(self):
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode()
+
+    def test_counts_requests_and_queries_per_route(self):
+        user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.client.force_authenticate(user)
+        key = 'http_requests_total{route="board-list",method="GET",status="200"}'
+        before = self.sample(self.scrape(), key)
+        self.client.get('/api/boards/')
+        text = self.scrape()
+        self.assertEqual(self.sample(text, key), before + 1)
+        self.assertGreater(self.sample(text, 'db_queries_total{route="board-list"}'), 0)
+        self.assertIn('http_request_duration_seconds_bucket{route="board-list",le="+Inf"}', text)
+
+    def test_streamed_responses_are_recorded_when_consumed(self):
+        user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        board = Board.objects.create(title='Board', owner=user)
+        self.client.force_authenticate(user)
+        requests = 'http_requests_total{route="board-export",method="GET",status="200"}'
+        queries = 'db_queries_total{route="board-export"}'
+        before = self.scrape()
+        response = self.client.get(f'/api/boards/{board.id}/export/')
+        self.assertTrue(response.streaming)
+        self.assertEqual(self.sample(self.scrape(), requests), self.sample(before, requests))
+        queries_before_stream = self.sample(self.scrape(), queries)
+        b''.join(response.streaming_content)
+        text = self.scrape()
+        self.assertEqual(self.sample(text, requests), self.sample(before, requests) + 1)
+        self.assertGreater(self.sample(text, queries), queries_before_stream)
+
+    def test_endpoint_requires_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 401)
+        with override_settings(METRICS_TOKEN=None):
+            self.assertEqual(self.client.get('/metrics').status_code, 404)
+            with override_settings(DEBUG=True):
+                self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+    def test_file_store_sums_processes(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            first = metrics.MmapStore(f'{directory}/metrics-1.db')
+            second = metrics.MmapStore(f'{directory}/metrics-2.db')
+            first.add('handled_errors\taction="x"', 2)
+            second.add('handled_errors\taction="x"', 3)
+            for number in range(5000):
+                second.add(f'handled_errors\taction="grow-{number}"', 1)
+            totals = metrics.collect()
+        self.assertEqual(totals['handled_errors\taction="x"'], 5)
+        self.assertEqual(totals['handled_errors\taction="grow-4999"'], 1)
+
+    def test_reopened_file_keeps_values(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = metrics.MmapStore(f'{directory}/metrics-1.db')
+            for number in range(5000):
+                store.add(f'handled_errors\taction="grow-{number}"', 1)
+            store.close()
+            reopened = metrics.MmapStore(f'{directory}/metrics-1.db')
+            reopened.add('handled_errors\taction="grow-0"', 2)
+            reopened.add('handled_errors\taction="new"', 1)
+            values = dict(reopened.items())
+        self.assertEqual(len(values), 5001)
+        self.assertEqual(values['handled_errors\taction="grow-0"'], 3)
+
+    def test_files_of_exited_processes_are_archived(self):
+        exited_pid = 2 ** 30
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            live = metrics.MmapStore(f'{directory}/metrics-{os.getpid()}.db')
+            live.add('handled_errors\taction="x"', 1)
+            for number in range(2):
+                exited = metrics.MmapStore(f'{directory}/metrics-{exited_pid + number}.db')
+                exited.add('handled_errors\taction="x"', 2)
+                exited.close()
+                self.assertEqual(metrics.archive_exited(), 1)
+            self.assertEqual(metrics.archive_exited(), 0)
+            self.assertEqual(sorted(name for name in os.listdir(directory) if name.endswith('.db')),
+                             sorted([metrics.ARCHIVE_NAME, f'metrics-{os.getpid()}.db']))
+            self.assertEqual(metrics.collect()['handled_errors\taction="x"'], 5)
+
+    def test_metrics_endpoint_sums_worker_processes(self):
+        def child():
+            metrics.handled_errors.inc(action='forked')
+            metrics.handled_errors.inc(3, action='forked')
+            os._exit(0)
+
+        key = 'handled_errors_total{action="forked"}'
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory), \
+                mock.patch.object(metrics, '_store', None), mock.patch.object(metrics, '_store_pid', None):
+            metrics.handled_errors.inc(2, action='forked')
+            process = multiprocessing.get_context('fork').Process(target=child)
+            process.start()
+            process.join(10)
+            self.assertEqual(process.exitcode, 0)
+            self.assertEqual(len(glob.glob(f'{directory}/metrics-*.db')), 2)
+            self.assertEqual(self.sample(self.scrape(), key), 6)
+            self.assertEqual(metrics.archive_exited(), 1)
+            self.assertEqual(self.sample(self.scrape(), key), 6)
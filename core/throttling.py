@@ -0,0 +1,219 @@
+"""
+Token bucket throttling per user and endpoint group.
+
+Views opt in with a `throttle_scope` attribute ('boards', 'tasks',
+'comments', 'auth', ...). Each (scope, client) pair gets a bucket holding up
+to N tokens that refills at N per period, as configured in
+REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] (e.g. '600/min'). A request takes
+one token, so clients may burst up to N requests and are then held to the
+average rate.
+
+Buckets live in process memory by default. Setting settings.THROTTLE_CACHE
+to the alias of a shared cache (e.g. a DatabaseCache or FileBasedCache in
+CACHES) makes all workers draw from the same buckets. Cache updates are
+not atomic, so concurrent workers may let a few extra requests through.
+"""
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+RATE_PATTERN = re.compile(r'^(\d+)/(\d*)([a-z]+)$')
+
+# Seconds per period, keyed by the first letter of the unit as in DRF, so
+# '5/s', '100/min', '100/minute' and '1000/hour' are all accepted.
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Bucket state after a request, reported in RateLimit-* response headers.
+
+    Attributes:
+        limit (int): Bucket capacity.
+        remaining (int): Whole tokens left.
+        reset (int): Seconds until the bucket is full again.
+    """
+    limit: int
+    remaining: int
+    reset: int
+
+
+def parse_rate(rate):
+    """
+    Parse a rate string such as '600/min'.
+
+    Args:
+        rate (str): '<requests>/<period>', the period being a unit whose
+            first letter is s, m, h or d (e.g. 'min', 'minute', 'hour'),
+            optionally with a multiplier ('100/5m').
+
+    Raises:
+        ValueError: If the rate is malformed.
+
+    Returns:
+        tuple[int, float]: (capacity, tokens refilled per second).
+    """
+    match = RATE_PATTERN.match(rate)
+    if match is None or match.group(3)[0] not in PERIODS:
+        raise ValueError(f'Invalid throttle rate: {rate!r}')
+    capacity, multiplier, unit = int(match.group(1)), int(match.group(2) or 1), match.group(3)[0]
+    return capacity, capacity / (multiplier * PERIODS[unit])
+
+
+def refill(tokens, updated, capacity, per_second, now):
+    """
+    Take one token from a bucket after refilling it for the elapsed time.
+
+    Args:
+        tokens (float): Tokens at `updated`.
+        updated (float): Time of the last update.
+        capacity (int): Bucket capacity.
+        per_second (float): Refill rate.
+        now (float): Current time.
+
+    Returns:
+        tuple[bool, float]: Whether a token was taken, and the tokens left.
+    """
+    tokens = min(capacity, tokens + (now - updated) * per_second)
+    if tokens >= 1:
+        return True, tokens - 1
+    return False, tokens
+
+
+class LocalBuckets:
+    """
+    Buckets kept in a dict of the current process.
+
+    Buckets that have refilled completely carry no information and are
+    dropped once the dict grows beyond `max_size`.
+    """
+    max_size = 10000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def consume(self, key, capacity, per_second, now):
+        """
+        Take a token from a bucket.
+
+        Args:
+            key (str): Bucket identity.
+            capacity (int): Bucket capacity.
+            per_second (float): Refill rate.
+            now (float): Current time.
+
+        Returns:
+            tuple[bool, float]: Whether a token was taken, and the tokens left.
+        """
+        with self._lock:
+            tokens, updated, _ = self._buckets.get(key, (capacity, now, now))
+            allowed, tokens = refill(tokens, updated, capacity, per_second, now)
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / per_second)
+            if len(self._buckets) > self.max_size:
+                self._buckets = {key: state for key, state in self._buckets.items() if state[2] > now}
+        return allowed, tokens
+
+    def clear(self):
+        """
+        Forget all buckets.
+        """
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheBuckets:
+    """
+    Buckets kept in a Django cache shared by all workers.
+    """
+    def __init__(self, alias):
+        self.alias = alias
+
+    def consume(self, key, capacity, per_second, now):
+        """
+        Take a token from a bucket; see LocalBuckets.consume().
+        """
+        cache = caches[self.alias]
+        tokens, updated = cache.get(key, (capacity, now))
+        allowed, tokens = refill(tokens, updated, capacity, per_second, now)
+        cache.set(key, (tokens, now), math.ceil(capacity / per_second) + 1)
+        return allowed, tokens
+
+
+local_buckets = LocalBuckets()
+
+
+def get_buckets():
+    """
+    Return the bucket store selected by settings.THROTTLE_CACHE.
+
+    Returns:
+        LocalBuckets | CacheBuckets: In-process buckets, or buckets in the named cache.
+    """
+    alias = getattr(settings, 'THROTTLE_CACHE', None)
+    return CacheBuckets(alias) if alias else local_buckets
+
+
+class ScopedTokenBucketThrottle(BaseThrottle):
+    """
+    Throttle requests per view scope and client with a token bucket.
+
+    Authenticated clients are identified by user id, anonymous ones by IP
+    address. Views without a `throttle_scope`, or with a scope missing from
+    DEFAULT_THROTTLE_RATES, are not throttled, and nothing is throttled while
+    settings.THROTTLE_ENABLED is False. The bucket state is attached
+    to the request as `rate_limit` for RateLimitHeadersMiddleware.
+    """
+    scope_attr = 'throttle_scope'
+
+    def __init__(self):
+        self.retry_after = None
+
+    def allow_request(self, request, view):
+        """
+        Take a token from the client's bucket for the view's scope.
+
+        Args:
+            request (Request): Incoming request.
+            view (APIView): View being dispatched.
+
+        Returns:
+            bool: False if the bucket is empty.
+        """
+        if not getattr(settings, 'THROTTLE_ENABLED', True):
+            return True
+        scope = getattr(view, self.scope_attr, None)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope) if scope else None
+        if not rate:
+            return True
+        capacity, per_second = parse_rate(rate)
+        if request.user and request.user.is_authenticated:
+            ident = f'user:{request.user.pk}'
+        else:
+            ident = f'ip:{self.get_ident(request)}'
+        allowed, tokens = get_buckets().consume(f'throttle:{scope}:{ident}', capacity, per_second, time.time())
+        if not allowed:
+            self.retry_after = (1 - tokens) / per_second
+        request._request.rate_limit = RateLimit(
+            limit=capacity,
+            remaining=int(tokens),
+            reset=math.ceil((capacity - tokens) / per_second),
+        )
+        return allowed
+
+    def wait(self):
+        """
+        Return the seconds until the next token is available.
+
+        Returns:
+            float | None: Seconds to wait, sent as Retry-After.
+        """
+        return self.retry_after
@@ -0,0 +1,11 @@
+"""
+URL configuration of the API-only settings profile (core.settings_api).
+"""
+from django.urls import path, include
+
+from core.views import metrics_view
+
+urlpatterns = [
+    path('metrics', metrics_view, name='metrics'),
+    path('api/', include('core.api_urls')),
+]
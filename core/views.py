@@ -0,0 +1,32 @@
+import secrets
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+
+from core import metrics
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Expose the metrics of all processes in the Prometheus text format.
+
+    The scraper must send settings.METRICS_TOKEN as
+    `Authorization: Bearer <token>`. Without a configured token the
+    endpoint is only open while DEBUG is on.
+
+    Args:
+        request (HttpRequest): Scrape request.
+
+    Returns:
+        HttpResponse: HTTP 200 with the exposition text; HTTP 401 without a
+            valid token; HTTP 404 if no token is configured outside DEBUG.
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            raise Http404
+    elif not secrets.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse(status=401, headers={'WWW-Authenticate': 'Bearer'})
+    return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
@@ -0,0 +1,146 @@
+"""
+Warm-up hooks run once per process before it serves requests.
+
+Django and DRF build a lot of state lazily on first use: URL pattern
+regexes, model field caches, serializer fields, translation catalogs and
+the JSON encoder. Doing that work at startup moves its cost off the first
+requests a new worker handles. The hooks touch no database connection, so
+they are safe to run in a master process before forking workers.
+"""
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.urls import URLResolver, get_resolver
+from django.utils import translation
+
+
+def compile_url_patterns(resolver=None):
+    """
+    Compile the regex of every URL pattern and build the reverse lookup tables.
+
+    Args:
+        resolver (URLResolver, optional): Resolver to walk, defaults to the root URL conf.
+
+    Returns:
+        int: Number of compiled patterns.
+    """
+    resolver = resolver or get_resolver()
+    resolver.reverse_dict
+    count = 0
+    for pattern in resolver.url_patterns:
+        pattern.pattern.regex
+        count += 1
+        if isinstance(pattern, URLResolver):
+            count += compile_url_patterns(pattern)
+    return count
+
+
+def prime_model_meta():
+    """
+    Fill the field caches of every installed model.
+
+    Returns:
+        int: Number of models.
+    """
+    models = apps.get_models()
+    for model in models:
+        model._meta.get_fields()
+        model._meta.concrete_fields
+        model._meta._forward_fields_map
+    return len(models)
+
+
+def project_serializers():
+    """
+    Collect the serializer classes defined in the project's apps.
+
+    Returns:
+        list[type]: Serializer classes whose module belongs to an app under BASE_DIR.
+    """
+    from rest_framework.serializers import BaseSerializer
+
+    packages = tuple(
+        config.name + '.' for config in apps.get_app_configs()
+        if str(config.path).startswith(str(settings.BASE_DIR))
+    )
+    found, pending = [], [BaseSerializer]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            pending.append(subclass)
+            if subclass.__module__.startswith(packages):
+                found.append(subclass)
+    return found
+
+
+def prime_serializer_fields():
+    """
+    Build the fields of every project serializer once.
+
+    Field construction for model serializers resolves model metadata,
+    validators and field mappings; building each serializer once imports and
+    caches everything involved.
+
+    Returns:
+        int: Number of serializers primed.
+    """
+    primed = 0
+    for serializer_class in project_serializers():
+        try:
+            serializer_class().fields
+        except Exception:
+            # Serializers that need context or arguments are simply skipped;
+            # warming up must never prevent a worker from starting.
+            continue
+        primed += 1
+    return primed
+
+
+def load_translations():
+    """
+    Load the translation catalogs of the default language.
+
+    Returns:
+        int: 1 if catalogs were loaded, 0 with USE_I18N off.
+    """
+    if not settings.USE_I18N:
+        return 0
+    with translation.override(settings.LANGUAGE_CODE):
+        translation.gettext('This field is required.')
+    return 1
+
+
+def prime_renderer():
+    """
+    Encode a small payload with the default renderer.
+
+    Returns:
+        int: Size of the encoded payload.
+    """
+    from core.renderers import FastJSONRenderer
+
+    return len(FastJSONRenderer().render({'warm': [1, 'up', None]}))
+
+
+WARMUP_STEPS = [
+    ('urls', compile_url_patterns),
+    ('models', prime_model_meta),
+    ('serializers', prime_serializer_fields),
+    ('translations', load_translations),
+    ('renderer', prime_renderer),
+]
+
+
+def warm_up():
+    """
+    Run all warm-up steps.
+
+    Returns:
+        dict[str, float]: Milliseconds spent per step.
+    """
+    timings = {}
+    for name, step in WARMUP_STEPS:
+        started = time.perf_counter()
+        step()
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    return timings
@@ -0,0 +1,21 @@
+"""
+WSGI config for API-only workers.
+
+Like core/wsgi.py, but defaults to the lean core.settings_api profile.
+Route /api/ to this application and everything else (e.g. /admin/) to
+core.wsgi.application.
+"""
+
+import os
+
+from django.conf import settings
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings_api')
+
+application = get_wsgi_application()
+
+from core.warmup import warm_up  # noqa: E402
+
+if settings.WARMUP_ON_STARTUP:
+    warm_up()
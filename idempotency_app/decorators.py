@@ -0,0 +1,60 @@
+from functools import wraps
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from core.renderers import PreEncoded, pre_encode
+from .store import KeyConflict, claim, complete, fingerprint, release
+
+MAX_KEY_LENGTH = 255
+
+
+def idempotent(scope: str):
+    """
+    Decorator factory making a create view method honour the Idempotency-Key header.
+
+    Without the header the view runs unchanged. With it, the first request
+    runs the view and stores a successful (2xx) response; retries with the
+    same key and payload receive the stored response, marked with an
+    `Idempotent-Replayed: true` header, without running validation or inserts
+    again. Failed requests are not stored and can be retried with the same key.
+    Reusing a key for a different payload returns HTTP 422; a retry arriving
+    while the first request still runs returns HTTP 409 until the claim's
+    lease (settings.IDEMPOTENCY_PENDING_LEASE) runs out.
+
+    Must be applied above @handle_exceptions so that it sees the final response.
+
+    Args:
+        scope (str): Name of the endpoint (e.g. 'tasks.create'); a key can
+                     only be replayed on the endpoint it was first used on.
+
+    Returns:
+        function: A decorator that wraps a view method.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            key = request.headers.get('Idempotency-Key')
+            if key is None:
+                return func(self, request, *args, **kwargs)
+            if not key or len(key) > MAX_KEY_LENGTH:
+                raise ValidationError({'Idempotency-Key': f'Must be 1 to {MAX_KEY_LENGTH} characters long.'})
+            try:
+                record, claimed = claim(request.user, key, scope, fingerprint(scope, request.path, request.data))
+            except KeyConflict as e:
+                return Response({'detail': e.detail}, status=e.status)
+            if not claimed:
+                return Response(PreEncoded(record.body), status=record.status_code,
+                                headers={'Idempotent-Replayed': 'true'})
+            try:
+                response = func(self, request, *args, **kwargs)
+            except BaseException:
+                release(record)
+                raise
+            if 200 <= response.status_code < 300:
+                complete(record, response.status_code, pre_encode(response.data).json)
+            else:
+                release(record)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,16 @@
+from idempotency_app.store import purge_expired
+from jobs_app.registry import register
+
+
+@register('idempotency.purge')
+def purge(payload):
+    """
+    Delete expired Idempotency-Key records.
+
+    Args:
+        payload (dict): {'batch_size': int | None}
+
+    Returns:
+        dict: Number of deleted records.
+    """
+    return {'deleted': purge_expired(payload.get('batch_size') or 1000)}
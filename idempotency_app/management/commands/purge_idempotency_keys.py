@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from idempotency_app.store import purge_expired
+
+
+class Command(BaseCommand):
+    help = 'Delete Idempotency-Key records older than settings.IDEMPOTENCY_KEY_TTL.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Records deleted per statement.')
+
+    def handle(self, *args, **options):
+        deleted = purge_expired(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired idempotency records.'))
@@ -0,0 +1,48 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+# Create your models here.
+
+class IdempotencyRecord(models.Model):
+    """
+    Stored outcome of a create request sent with an Idempotency-Key header.
+
+    A record is inserted before the request runs (status_code is None while
+    it is in progress) and completed with the encoded response afterwards,
+    so retries with the same key are answered from this table.
+
+    Fields:
+        user (User): User who sent the request; keys are scoped per user.
+        key (str): Client-supplied Idempotency-Key.
+        scope (str): Endpoint the key was used on, e.g. 'tasks.create'.
+        fingerprint (str): SHA-256 of the request payload, to detect key reuse.
+        status_code (int): Response status, None while in progress.
+        body (bytes): Encoded JSON response body.
+        created_at (datetime): When the key was first used; records expire
+            settings.IDEMPOTENCY_KEY_TTL seconds later.
+    """
+    user = models.ForeignKey(User, related_name='+', on_delete=models.CASCADE)
+    key = models.CharField(max_length=255)
+    scope = models.CharField(max_length=50)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    body = models.BinaryField(default=b'')
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='idempotency_user_key_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['created_at'], name='idempotency_created_idx'),
+        ]
+
+    def __str__(self):
+        """
+        Return a human-readable representation of the record.
+
+        Returns:
+            str: String in the format "<scope> <key> (<status>)".
+        """
+        return f"{self.scope} {self.key} ({self.status_code or 'in progress'})"
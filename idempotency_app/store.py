@@ -0,0 +1,165 @@
+"""
+Storage of Idempotency-Key records.
+
+A request with a key is first looked up on the unique (user, key) index. A
+new key is claimed by inserting a pending record; the unique constraint
+makes the claim atomic across processes. Successful responses are then
+stored on the record and replayed for retries. Failed requests release
+their claim so that the client can retry. A pending claim is only held for
+settings.IDEMPOTENCY_PENDING_LEASE seconds, so a key whose request died
+with its worker becomes usable again.
+"""
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import IdempotencyRecord
+
+
+class KeyConflict(Exception):
+    """
+    The key cannot be used for this request.
+
+    Attributes:
+        status (int): HTTP status to answer with (409 or 422).
+        detail (str): Error message.
+    """
+    def __init__(self, status, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def fingerprint(scope, path, data):
+    """
+    Hash what identifies a request, to recognise a key reused for a different one.
+
+    Args:
+        scope (str): Endpoint scope.
+        path (str): Request path.
+        data: Parsed request payload.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    payload = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(f'{scope}\n{path}\n{payload}'.encode()).hexdigest()
+
+
+def expiry_cutoff():
+    """
+    Return the creation time before which records are expired.
+
+    Returns:
+        datetime: now - settings.IDEMPOTENCY_KEY_TTL.
+    """
+    return timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+
+
+def lease_cutoff():
+    """
+    Return the creation time before which pending claims are abandoned.
+
+    Returns:
+        datetime: now - settings.IDEMPOTENCY_PENDING_LEASE.
+    """
+    return timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_PENDING_LEASE)
+
+
+def claim(user, key, scope, digest):
+    """
+    Claim a key for a new request, or find the stored outcome of an earlier one.
+
+    Args:
+        user (User): Requesting user.
+        key (str): Idempotency-Key header value.
+        scope (str): Endpoint scope.
+        digest (str): Request fingerprint.
+
+    A pending record older than the lease belongs to a request that never
+    completed (e.g. its worker was killed) and is claimed anew.
+
+    Raises:
+        KeyConflict: 409 if a request with the key is still running, 422 if
+            the key was used for a different request.
+
+    Returns:
+        tuple[IdempotencyRecord, bool]: The record, and True if it was just
+            claimed (the request must run) or False if it holds a stored
+            response to replay.
+    """
+    for _ in range(2):
+        record = IdempotencyRecord.objects.filter(user=user, key=key).first()
+        if record is not None and (
+            record.created_at < expiry_cutoff()
+            or (record.status_code is None and record.created_at < lease_cutoff())
+        ):
+            IdempotencyRecord.objects.filter(
+                pk=record.pk, created_at=record.created_at, status_code=record.status_code,
+            ).delete()
+            record = None
+        if record is None:
+            try:
+                with transaction.atomic():
+                    record = IdempotencyRecord.objects.create(user=user, key=key, scope=scope, fingerprint=digest)
+                return record, True
+            except IntegrityError:
+                continue
+        if record.scope != scope or record.fingerprint != digest:
+            raise KeyConflict(422, 'Idempotency-Key was already used for a different request.')
+        if record.status_code is None:
+            raise KeyConflict(409, 'A request with this Idempotency-Key is still in progress.')
+        return record, False
+    raise KeyConflict(409, 'A request with this Idempotency-Key is still in progress.')
+
+
+def complete(record, status_code, body):
+    """
+    Store the response of a claimed request.
+
+    Nothing is stored if the claim outlived its lease and was taken over by
+    a retry.
+
+    Args:
+        record (IdempotencyRecord): Claimed record.
+        status_code (int): Response status.
+        body (bytes): Encoded JSON body.
+    """
+    record.status_code = status_code
+    record.body = body
+    IdempotencyRecord.objects.filter(pk=record.pk, status_code__isnull=True).update(
+        status_code=status_code, body=body,
+    )
+
+
+def release(record):
+    """
+    Drop the claim of a request that failed, so the key can be retried.
+
+    Args:
+        record (IdempotencyRecord): Claimed record.
+    """
+    IdempotencyRecord.objects.filter(pk=record.pk).delete()
+
+
+def purge_expired(batch_size=1000):
+    """
+    Delete expired records in batches.
+
+    Args:
+        batch_size (int): Records deleted per statement.
+
+    Returns:
+        int: Number of deleted records.
+    """
+    cutoff = expiry_cutoff()
+    deleted = 0
+    while True:
+        ids = list(IdempotencyRecord.objects.filter(created_at__lt=cutoff).values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += IdempotencyRecord.objects.filter(id__in=ids).delete()[0]
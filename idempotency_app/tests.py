@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board
+from idempotency_app.models import IdempotencyRecord
+from idempotency_app.store import claim, complete, fingerprint
+from ticket_app.models import Ticket
+
+
+class IdempotencyKeyTests(APITestCase):
+    """
+    Tests for Idempotency-Key support on create endpoints.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.client.force_authenticate(self.user)
+        self.payload = {'board': self.board.id, 'title': 't', 'status': 'to-do', 'priority': 'low'}
+
+    def create(self, key, payload=None):
+        return self.client.post('/api/tasks/', payload or self.payload, format='json', HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_the_original_response_without_inserting(self):
+        first = self.create('abc')
+        self.assertEqual(first.status_code, 201)
+        with self.assertNumQueries(1):
+            retry = self.create('abc')
+        self.assertEqual((retry.status_code, retry.json()), (201, first.json()))
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(Ticket.objects.count(), 1)
+        self.assertEqual(self.create('other').status_code, 201)
+        self.assertEqual(Ticket.objects.count(), 2)
+
+    def test_key_reused_for_a_different_payload_is_rejected(self):
+        self.create('abc')
+        response = self.create('abc', {**self.payload, 'title': 'changed'})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Ticket.objects.count(), 1)
+
+    def test_failed_request_can_be_retried_with_the_same_key(self):
+        self.assertEqual(self.create('abc', {**self.payload, 'priority': 'bogus'}).status_code, 400)
+        self.assertEqual(self.create('abc').status_code, 201)
+
+    def test_expired_keys_run_again_and_are_purged(self):
+        self.create('abc')
+        IdempotencyRecord.objects.update(created_at=IdempotencyRecord.objects.get().created_at - timedelta(days=2))
+        self.assertNotIn('Idempotent-Replayed', self.create('abc'))
+        self.assertEqual(Ticket.objects.count(), 2)
+        IdempotencyRecord.objects.update(created_at=IdempotencyRecord.objects.get().created_at - timedelta(days=2))
+        call_command('purge_idempotency_keys', stdout=open('/dev/null', 'w'))
+        self.assertFalse(IdempotencyRecord.objects.exists())
+
+    def test_abandoned_claim_is_taken_over_after_its_lease(self):
+        digest = fingerprint('tasks.create', '/api/tasks/', self.payload)
+        record, claimed = claim(self.user, 'abc', 'tasks.create', digest)
+        self.assertTrue(claimed)
+        self.assertEqual(self.create('abc').status_code, 409)
+        lease = timedelta(seconds=settings.IDEMPOTENCY_PENDING_LEASE + 1)
+        IdempotencyRecord.objects.update(created_at=record.created_at - lease)
+        response = self.create('abc')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.create('abc')['Idempotent-Replayed'], 'true')
+        complete(record, 201, b'{}')
+        self.assertEqual(self.create('abc').json(), response.json())
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from jobs_app.models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """
+    Serializer for polling the state of a background job.
+
+    Fields:
+        id (int): Job primary key.
+        name (str): Handler name.
+        status (str): 'queued', 'running', 'succeeded' or 'failed'.
+        attempts (int): Attempts started so far.
+        result (dict): Handler result once succeeded.
+        error (str): Last error message, if any.
+        created_at (datetime): Timestamp when the job was enqueued.
+        updated_at (datetime): Timestamp of the last status change.
+    """
+    class Meta:
+        model = Job
+        fields = ['id', 'name', 'status', 'attempts', 'result', 'error', 'created_at', 'updated_at']
+        read_only_fields = fields
@@ -0,0 +1,68 @@
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
+from django.urls import reverse
+
+from jobs_app.models import Job
+from core.decorators import handle_exceptions
+from .serializers import JobSerializer
+
+
+def job_accepted_response(request, job):
+    """
+    Build the HTTP 202 response for an operation handed to the job queue.
+
+    Args:
+        request (Request): The request that enqueued the job.
+        job (Job): The queued job.
+
+    Returns:
+        Response: HTTP 202 with the job state and a Location header to poll.
+    """
+    url = request.build_absolute_uri(reverse('job-detail', kwargs={'pk': job.pk}))
+    data = JobSerializer(job, context={'request': request}).data
+    return Response(
+        {**data, 'status_url': url},
+        status=status.HTTP_202_ACCEPTED,
+        headers={'Location': url, 'Preference-Applied': 'respond-async'},
+    )
+
+
+class JobDetailView(generics.RetrieveAPIView):
+    """
+    API endpoint to poll the status of a background job.
+
+    GET returns the job if it was enqueued by the requesting user.
+
+    Attributes:
+        permission_classes (list): Requires authentication.
+        serializer_class (Serializer): Serializer for job output.
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = JobSerializer
+
+    def get_object(self):
+        """
+        Fetch the Job instance owned by the requesting user.
+
+        Raises:
+            NotFound: If no such job exists for the user.
+
+        Returns:
+            Job: The requested job.
+        """
+        try:
+            return Job.objects.get(pk=self.kwargs.get('pk'), created_by=self.request.user)
+        except Job.DoesNotExist:
+            raise NotFound('Job not found.')
+
+    @handle_exceptions(action='retrieving job')
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Handle GET request to retrieve job status.
+
+        Returns:
+            Response: HTTP 200 with serialized job state.
+        """
+        return Response(self.get_serializer(self.get_object()).data, status=status.HTTP_200_OK)
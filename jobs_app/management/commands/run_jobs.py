@@ -0,0 +1,32 @@
+import socket
+import os
+
+from django.core.management.base import BaseCommand
+
+from jobs_app.worker import work
+
+
+class Command(BaseCommand):
+    help = 'Run the background job worker with a thread pool.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=4, help='Number of jobs run concurrently.')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds to wait when the queue is empty.')
+        parser.add_argument('--stale-after', type=int, default=600, help='Seconds without heartbeat after which running jobs are requeued.')
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is drained.')
+
+    def handle(self, *args, **options):
+        worker_name = f'{socket.gethostname()}:{os.getpid()}'
+        self.stdout.write(f'Worker {worker_name} started with {options["threads"]} threads.')
+        try:
+            processed = work(
+                worker_name,
+                threads=options['threads'],
+                poll_interval=options['poll_interval'],
+                stale_after=options['stale_after'],
+                once=options['once'],
+            )
+        except KeyboardInterrupt:
+            self.stdout.write('Worker stopped.')
+            return
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} jobs.'))
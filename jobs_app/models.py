@@ -0,0 +1,68 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+# Create your models here.
+
+class Job(models.Model):
+    """
+    Represents a unit of background work executed by the run_jobs worker.
+
+    Fields:
+        name (str): Registered handler name (see jobs_app.registry).
+        payload (dict): JSON arguments passed to the handler.
+        status (str): One of 'queued', 'running', 'succeeded', 'failed'.
+        result (dict): JSON value returned by the handler, if any.
+        error (str): Last error message, if an attempt failed.
+        attempts (int): Number of attempts started so far.
+        max_attempts (int): Attempts allowed before the job is marked failed.
+        idempotency_key (str): Optional unique key; enqueueing twice returns the same job.
+        dedupe_key (str): Optional key unique among jobs not yet started;
+            enqueueing while such a job waits returns it instead.
+        created_by (User): User who caused the job to be enqueued (optional).
+        run_after (datetime): Earliest time the job may be picked up.
+        locked_by (str): Identifier of the worker running the job.
+        created_at (datetime): Timestamp when the job was enqueued.
+        updated_at (datetime): Timestamp of the last status change.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    idempotency_key = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    dedupe_key = models.CharField(max_length=255, null=True, blank=True)
+    created_by = models.ForeignKey(User, related_name='jobs', on_delete=models.SET_NULL, null=True, blank=True)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='job_pending_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dedupe_key'], condition=models.Q(status='queued', attempts=0),
+                name='job_unique_waiting_dedupe_key',
+            ),
+        ]
+
+    def __str__(self):
+        """
+        Return a human-readable representation of the Job.
+
+        Returns:
+            str: String in the format "Job <id>: <name> (<status>)".
+        """
+        return f"Job {self.id}: {self.name} ({self.status})"
@@ -0,0 +1,138 @@
+"""
+Registry of background job handlers and helpers to enqueue jobs.
+
+Apps register handlers in a `jobs.py` module, which JobsAppConfig imports on
+startup:
+
+    @register('boards.delete')
+    def delete_board(payload):
+        ...
+"""
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Job
+
+_handlers = {}
+
+
+def register(name):
+    """
+    Decorator registering a function as the handler for a job name.
+
+    Args:
+        name (str): Job name used when enqueueing.
+
+    Returns:
+        function: Decorator returning the handler unchanged.
+    """
+    def decorator(func):
+        _handlers[name] = func
+        return func
+    return decorator
+
+
+def get_handler(name):
+    """
+    Look up the handler registered for a job name.
+
+    Args:
+        name (str): Job name.
+
+    Raises:
+        KeyError: If no handler is registered under that name.
+
+    Returns:
+        function: The handler, called with the job payload.
+    """
+    return _handlers[name]
+
+
+def enqueue(name, payload=None, user=None, idempotency_key=None, max_attempts=3, dedupe_key=None):
+    """
+    Add a job to the queue.
+
+    If a job with the same idempotency key exists, it is returned instead of
+    creating a new one; a failed job is requeued with fresh attempts first, so
+    the work can be retried. A dedupe key only deduplicates against jobs that have
+    not started yet, so work requested while a job runs is queued again.
+
+    Args:
+        name (str): Registered handler name.
+        payload (dict): JSON-serializable handler arguments.
+        user (User): User on whose behalf the job runs (optional).
+        idempotency_key (str): Optional unique key for deduplication.
+        max_attempts (int): Attempts allowed before the job fails.
+        dedupe_key (str): Optional key deduplicating against waiting jobs.
+
+    Raises:
+        KeyError: If no handler is registered under `name`.
+
+    Returns:
+        Job: The queued (or previously queued) job.
+    """
+    get_handler(name)
+    if idempotency_key:
+        existing = Job.objects.filter(idempotency_key=idempotency_key).first()
+        if existing:
+            return _retry_failed(existing)
+    waiting = Job.objects.filter(dedupe_key=dedupe_key, status='queued', attempts=0) if dedupe_key else None
+    if waiting is not None:
+        existing = waiting.first()
+        if existing:
+            return existing
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name, payload=payload or {}, created_by=user,
+                idempotency_key=idempotency_key, max_attempts=max_attempts, dedupe_key=dedupe_key,
+            )
+    except IntegrityError:
+        if idempotency_key:
+            existing = Job.objects.filter(idempotency_key=idempotency_key).first()
+            if existing:
+                return _retry_failed(existing)
+        if waiting is not None:
+            existing = waiting.first()
+            if existing:
+                return existing
+        raise
+
+
+def _retry_failed(job):
+    """
+    Put a failed job back into the queue with fresh attempts.
+
+    The reset is conditional on the failed status, so concurrent callers
+    requeue the job only once.
+
+    Args:
+        job (Job): A job found by its idempotency key.
+
+    Returns:
+        Job: The job, requeued if it had failed.
+    """
+    if job.status != 'failed':
+        return job
+    Job.objects.filter(pk=job.pk, status='failed').update(
+        status='queued', attempts=0, error='', result=None, locked_by='',
+        run_after=timezone.now(), updated_at=timezone.now(),
+    )
+    job.refresh_from_db()
+    return job
+
+
+def wants_async(request):
+    """
+    Check whether the client asked for asynchronous processing.
+
+    Clients opt in with the standard `Prefer: respond-async` header.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        bool: True if the request prefers an asynchronous response.
+    """
+    prefer = request.headers.get('Prefer', '')
+    return 'respond-async' in [part.strip().lower() for part in prefer.split(',')]
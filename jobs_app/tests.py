@@ -0,0 +1,152 @@
+import time
+from datetime import timedelta
+
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from jobs_app.models import Job
+from jobs_app.registry import enqueue, register
+from jobs_app.worker import claim_next_job, heartbeat, requeue_stale_jobs, run_job, work
+
+calls = []
+
+
+@register('tests.record')
+def record(payload):
+    calls.append(payload)
+    return {'seen': payload.get('value')}
+
+
+@register('tests.fail')
+def fail(payload):
+    raise RuntimeError('boom')
+
+
+@register('tests.slow')
+def slow(payload):
+    time.sleep(payload['seconds'])
+    return {'requeued': requeue_stale_jobs(payload['stale_after'])}
+
+
+class JobQueueTests(TestCase):
+    """
+    Tests for enqueueing, claiming, retrying and requeueing jobs.
+    """
+    def setUp(self):
+        calls.clear()
+
+    def test_claim_takes_oldest_due_job_once(self):
+        later = enqueue('tests.record', {'value': 2})
+        first = enqueue('tests.record', {'value': 1})
+        Job.objects.filter(pk=later.pk).update(run_after=timezone.now() + timedelta(hours=1))
+        claimed = claim_next_job('w-1')
+        self.assertEqual((claimed.pk, claimed.status, claimed.locked_by, claimed.attempts), (first.pk, 'running', 'w-1', 1))
+        self.assertIsNone(claim_next_job('w-2'))
+
+    def test_run_job_records_result(self):
+        enqueue('tests.record', {'value': 7})
+        job = run_job(claim_next_job('w-1'))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result, job.locked_by), ('succeeded', {'seen': 7}, ''))
+        self.assertEqual(calls, [{'value': 7}])
+
+    def test_failed_job_is_retried_with_backoff_then_failed(self):
+        enqueue('tests.fail', max_attempts=2)
+        with self.assertLogs('jobs_app.worker', 'ERROR'):
+            job = run_job(claim_next_job('w-1'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'queued')
+        self.assertIn('RuntimeError: boom', job.error)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIsNone(claim_next_job('w-1'))
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        with self.assertLogs('jobs_app.worker', 'ERROR'):
+            job = run_job(claim_next_job('w-1'))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+
+    def test_requeue_only_stale_running_jobs(self):
+        stale = enqueue('tests.record')
+        fresh = enqueue('tests.record')
+        claim_next_job('w-1'), claim_next_job('w-2')
+        Job.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timedelta(seconds=700))
+        self.assertEqual(requeue_stale_jobs(600), 1)
+        stale.refresh_from_db(), fresh.refresh_from_db()
+        self.assertEqual((stale.status, stale.locked_by), ('queued', ''))
+        self.assertEqual(fresh.status, 'running')
+
+    def test_outcome_of_requeued_job_is_discarded(self):
+        enqueue('tests.record', {'value': 1})
+        job = claim_next_job('w-1')
+        Job.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(seconds=700))
+        requeue_stale_jobs(600)
+        taken = claim_next_job('w-2')
+        with self.assertLogs('jobs_app.worker', 'WARNING'):
+            run_job(job)
+        taken.refresh_from_db()
+        self.assertEqual((taken.status, taken.locked_by), ('running', 'w-2'))
+
+    def test_idempotency_key_returns_same_job(self):
+        first = enqueue('tests.record', idempotency_key='k')
+        run_job(claim_next_job('w-1'))
+        self.assertEqual(enqueue('tests.record', idempotency_key='k').pk, first.pk)
+
+    def test_failed_job_is_requeued_by_its_idempotency_key(self):
+        first = enqueue('tests.fail', idempotency_key='k', max_attempts=1)
+        with self.assertLogs('jobs_app.worker', 'ERROR'):
+            run_job(claim_next_job('w-1'))
+        again = enqueue('tests.fail', idempotency_key='k', max_attempts=1)
+        self.assertEqual((again.pk, again.status, again.attempts, again.error), (first.pk, 'queued', 0, ''))
+        self.assertEqual(claim_next_job('w-1').pk, first.pk)
+
+    def test_stale_job_out_of_attempts_is_failed(self):
+        job = enqueue('tests.record', max_attempts=2)
+        for _ in range(2):
+            claim_next_job('w-1')
+            Job.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(seconds=700))
+            requeue_stale_jobs(600)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.locked_by), ('failed', 2, ''))
+        self.assertIn('heartbeat', job.error)
+        self.assertIsNone(claim_next_job('w-1'))
+
+    def test_dedupe_key_only_matches_waiting_jobs(self):
+        first = enqueue('tests.record', dedupe_key='column')
+        self.assertEqual(enqueue('tests.record', dedupe_key='column').pk, first.pk)
+        claim_next_job('w-1')
+        second = enqueue('tests.record', dedupe_key='column')
+        self.assertNotEqual(second.pk, first.pk)
+        self.assertEqual(enqueue('tests.record', dedupe_key='column').pk, second.pk)
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_unknown_handler_is_rejected(self):
+        with self.assertRaises(KeyError):
+            enqueue('tests.missing')
+
+
+class JobHeartbeatTests(TransactionTestCase):
+    """
+    Tests for heartbeats of long-running jobs, which need committed rows.
+    """
+    def test_long_running_job_is_not_requeued(self):
+        enqueue('tests.slow', {'seconds': 0.6, 'stale_after': 0.3})
+        job = run_job(claim_next_job('w-1'), heartbeat_interval=0.05)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result), ('succeeded', {'requeued': 0}))
+
+    def test_heartbeat_refreshes_updated_at(self):
+        enqueue('tests.record')
+        job = claim_next_job('w-1')
+        Job.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(seconds=5))
+        with heartbeat(job, 0.05):
+            time.sleep(0.3)
+            self.assertEqual(requeue_stale_jobs(2), 0)
+        self.assertEqual(Job.objects.get(pk=job.pk).status, 'running')
+
+    def test_work_drains_queue(self):
+        for value in range(5):
+            enqueue('tests.record', {'value': value})
+        # One thread: the in-memory test database is shared-cache SQLite, which
+        # fails concurrent writers with "table is locked" instead of waiting.
+        self.assertEqual(work('w', threads=1, once=True), 5)
+        self.assertEqual(Job.objects.filter(status='succeeded').count(), 5)
@@ -0,0 +1,217 @@
+"""
+Job execution: claiming queued jobs, running handlers and recording results.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import close_old_connections, connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+
+def claim_next_job(worker_id):
+    """
+    Atomically claim the oldest due job.
+
+    A job is claimed with a conditional UPDATE on its status, so concurrent
+    workers never run the same job twice.
+
+    Args:
+        worker_id (str): Identifier stored in Job.locked_by.
+
+    Returns:
+        Job | None: The claimed job, or None if no job is due.
+    """
+    now = timezone.now()
+    candidates = (
+        Job.objects.filter(status='queued', run_after__lte=now)
+        .order_by('run_after', 'id').values_list('id', flat=True)[:10]
+    )
+    for job_id in candidates:
+        claimed = Job.objects.filter(pk=job_id, status='queued').update(
+            status='running', locked_by=worker_id, attempts=F('attempts') + 1, updated_at=now,
+        )
+        if claimed:
+            return Job.objects.get(pk=job_id)
+    return None
+
+
+def touch_job(job):
+    """
+    Refresh the heartbeat (updated_at) of a job this worker still owns.
+
+    Args:
+        job (Job): A job in 'running' state.
+
+    Returns:
+        bool: False if the job was requeued or taken over meanwhile.
+    """
+    return bool(Job.objects.filter(pk=job.pk, status='running', locked_by=job.locked_by).update(
+        updated_at=timezone.now(),
+    ))
+
+
+@contextmanager
+def heartbeat(job, interval):
+    """
+    Keep a running job's updated_at fresh from a background thread.
+
+    requeue_stale_jobs() only requeues jobs whose heartbeat stopped, so jobs
+    that legitimately run longer than `stale_after` are not started twice.
+
+    Args:
+        job (Job): A job in 'running' state.
+        interval (float): Seconds between heartbeats.
+    """
+    stop = threading.Event()
+
+    def beat():
+        try:
+            while not stop.wait(interval):
+                touch_job(job)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f'job-{job.pk}-heartbeat', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_job(job, heartbeat_interval=None):
+    """
+    Execute a claimed job and record its outcome.
+
+    Failed attempts are retried with exponential backoff until
+    `max_attempts` is reached. The outcome is only written while the worker
+    still owns the job; if it was requeued meanwhile, the new owner decides.
+
+    Args:
+        job (Job): A job in 'running' state.
+        heartbeat_interval (float): Seconds between heartbeats while the
+            handler runs, None for no heartbeat.
+
+    Returns:
+        Job: The job with its final or rescheduled status.
+    """
+    owner = job.locked_by
+    try:
+        if heartbeat_interval:
+            with heartbeat(job, heartbeat_interval):
+                job.result = get_handler(job.name)(job.payload)
+        else:
+            job.result = get_handler(job.name)(job.payload)
+        job.status = 'succeeded'
+        job.error = ''
+    except Exception as exc:
+        logger.exception('Job %s (%s) failed on attempt %s', job.id, job.name, job.attempts)
+        job.error = f'{type(exc).__name__}: {exc}'
+        if job.attempts < job.max_attempts:
+            job.status = 'queued'
+            job.run_after = timezone.now() + timedelta(seconds=2 ** job.attempts)
+        else:
+            job.status = 'failed'
+    job.locked_by = ''
+    job.updated_at = timezone.now()
+    written = Job.objects.filter(pk=job.pk, status='running', locked_by=owner).update(
+        result=job.result, status=job.status, error=job.error, run_after=job.run_after,
+        locked_by='', updated_at=job.updated_at,
+    )
+    if not written:
+        logger.warning('Job %s (%s) was requeued while running; outcome discarded', job.id, job.name)
+    return job
+
+
+def requeue_stale_jobs(stale_after):
+    """
+    Return jobs stuck in 'running' (e.g. after a worker crash) to the queue.
+
+    Running jobs refresh updated_at with a heartbeat, so only jobs whose
+    worker stopped beating are requeued, however long they run. Jobs that
+    already used all their attempts are marked failed instead, so a job that
+    keeps killing its worker is not retried forever.
+
+    Args:
+        stale_after (int): Seconds without heartbeat after which a running job counts as stale.
+
+    Returns:
+        int: Number of requeued jobs.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(status='running', updated_at__lt=now - timedelta(seconds=stale_after))
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status='failed', locked_by='', error='Worker stopped sending heartbeats.', updated_at=now,
+    )
+    return stale.update(status='queued', locked_by='', run_after=now)
+
+
+def _worker_loop(worker_id, stop_event, poll_interval, stale_after, once):
+    """
+    Claim and run jobs in one pool thread until stopped.
+
+    Args:
+        worker_id (str): Identifier stored in Job.locked_by.
+        stop_event (threading.Event): Set to stop the loop.
+        poll_interval (float): Seconds to wait when the queue is empty.
+        stale_after (int): Seconds without heartbeat after which running jobs are requeued.
+        once (bool): Stop as soon as the queue is empty.
+
+    Returns:
+        int: Number of jobs processed by this thread.
+    """
+    processed = 0
+    try:
+        while not stop_event.is_set():
+            close_old_connections()
+            job = claim_next_job(worker_id)
+            if job is None:
+                if once:
+                    break
+                requeue_stale_jobs(stale_after)
+                stop_event.wait(poll_interval)
+                continue
+            run_job(job, heartbeat_interval=stale_after / 3)
+            processed += 1
+    finally:
+        connection.close()
+    return processed
+
+
+def work(worker_name, threads=4, poll_interval=1.0, stale_after=600, once=False, stop_event=None):
+    """
+    Process jobs with a pool of worker threads.
+
+    Args:
+        worker_name (str): Prefix for Job.locked_by identifiers.
+        threads (int): Number of jobs run concurrently.
+        poll_interval (float): Seconds to wait when the queue is empty.
+        stale_after (int): Seconds without heartbeat after which running jobs are requeued.
+        once (bool): Stop as soon as the queue is drained.
+        stop_event (threading.Event): Optional event to stop the workers.
+
+    Returns:
+        int: Number of jobs processed.
+    """
+    stop_event = stop_event or threading.Event()
+    requeue_stale_jobs(stale_after)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [
+            pool.submit(_worker_loop, f'{worker_name}-{slot}', stop_event, poll_interval, stale_after, once)
+            for slot in range(threads)
+        ]
+        try:
+            return sum(future.result() for future in futures)
+        except KeyboardInterrupt:
+            stop_event.set()
+            raise
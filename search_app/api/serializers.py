@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for search query parameters.
+
+    Fields:
+        q (str): Free-text query; every word must match (prefix match).
+        page (int): 1-based page number, default 1.
+        page_size (int): Results per page (1-100), default 20.
+    """
+    q = serializers.CharField(required=True, max_length=200)
+    page = serializers.IntegerField(required=False, default=1, min_value=1)
+    page_size = serializers.IntegerField(required=False, default=20, min_value=1, max_value=100)
@@ -0,0 +1,72 @@
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+
+from boards_app.models import Board
+from core.decorators import handle_exceptions
+from .serializers import SearchQuerySerializer
+
+
+class SearchView(generics.GenericAPIView):
+    """
+    API endpoint for full-text search over tickets and comments.
+
+    GET:
+      - Answers 503 when the database lacks FTS5 support.
+      - Searches ticket titles, descriptions and comment contents on boards
+        the requesting user owns or is a member of.
+      - Returns ranked matches with highlighted snippets, paginated.
+
+    Attributes:
+        permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+        serializer_class (Serializer): Serializer for query parameter validation.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'search'
+    serializer_class = SearchQuerySerializer
+
+    @handle_exceptions(action='searching')
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request to search.
+
+        Returns:
+            Response: HTTP 200 with {page, page_size, next_page, results};
+                HTTP 400 if the query contains no searchable words;
+                HTTP 503 if the database does not support the search index.
+        """
+        from search_app import index
+
+        if not index.is_supported():
+            return Response({'detail': 'Full-text search is not available.'},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        expression = index.build_match_expression(params['q'])
+        if not expression:
+            raise ValidationError({'q': 'Query must contain at least one word.'})
+
+        page, page_size = params['page'], params['page_size']
+        results = index.search(
+            expression, self.accessible_board_ids(),
+            limit=page_size + 1, offset=(page - 1) * page_size,
+        )
+        has_next = len(results) > page_size
+        return Response({
+            'page': page,
+            'page_size': page_size,
+            'next_page': page + 1 if has_next else None,
+            'results': results[:page_size],
+        }, status=status.HTTP_200_OK)
+
+    def accessible_board_ids(self):
+        """
+        Build the queryset of board ids the user may search.
+
+        Returns:
+            QuerySet: Ids of boards owned by or shared with the user.
+        """
+        return Board.objects.accessible_to(self.request.user).values('id')
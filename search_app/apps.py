@@ -0,0 +1,23 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def ensure_search_schema(using, **kwargs):
+    """
+    Recreate the search index triggers after migrations.
+
+    SQLite migrations that rebuild the ticket or comment table drop their
+    triggers, so they are restored after every migrate run.
+    """
+    from django.db import connections
+    from .index import ensure_schema
+
+    ensure_schema(connections[using])
+
+
+class SearchAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search_app'
+
+    def ready(self):
+        post_migrate.connect(ensure_search_schema, sender=self)
@@ -0,0 +1,239 @@
+"""
+SQLite FTS5 full-text index over ticket titles, descriptions and comments.
+
+Rows are keyed by rowid so that triggers can update them without scanning:
+tickets use `id * 2`, comments use `id * 2 + 1`. Triggers only reference their
+own table and the index, because SQLite refuses to rebuild a table during
+migrations while another table's trigger refers to it. Board access is
+therefore resolved by joining the ticket at query time.
+"""
+import re
+
+from django.db import connection
+
+TABLE = 'search_index'
+
+CREATE_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5(
+    title, body,
+    kind UNINDEXED, object_id UNINDEXED, ticket_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_ticket_ai AFTER INSERT ON ticket_app_ticket BEGIN
+        INSERT INTO {TABLE}(rowid, title, body, kind, object_id, ticket_id)
+        VALUES (new.id * 2, new.title, new.description, 'ticket', new.id, new.id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_ticket_au AFTER UPDATE OF title, description ON ticket_app_ticket BEGIN
+        UPDATE {TABLE} SET title = new.title, body = new.description WHERE rowid = new.id * 2;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_ticket_ad AFTER DELETE ON ticket_app_ticket BEGIN
+        DELETE FROM {TABLE} WHERE rowid = old.id * 2;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_comment_ai AFTER INSERT ON comments_app_comment BEGIN
+        INSERT INTO {TABLE}(rowid, title, body, kind, object_id, ticket_id)
+        VALUES (new.id * 2 + 1, '', new.content, 'comment', new.id, new.task_id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_comment_au AFTER UPDATE OF content ON comments_app_comment BEGIN
+        UPDATE {TABLE} SET body = new.content WHERE rowid = new.id * 2 + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS search_comment_ad AFTER DELETE ON comments_app_comment BEGIN
+        DELETE FROM {TABLE} WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+]
+
+DROP_STATEMENTS = [
+    'DROP TRIGGER IF EXISTS search_ticket_ai',
+    'DROP TRIGGER IF EXISTS search_ticket_au',
+    'DROP TRIGGER IF EXISTS search_ticket_ad',
+    'DROP TRIGGER IF EXISTS search_comment_ai',
+    'DROP TRIGGER IF EXISTS search_comment_au',
+    'DROP TRIGGER IF EXISTS search_comment_ad',
+    f'DROP TABLE IF EXISTS {TABLE}',
+]
+
+INSERT_TICKETS = f"""
+INSERT INTO {TABLE}(rowid, title, body, kind, object_id, ticket_id)
+SELECT id * 2, title, description, 'ticket', id, id
+FROM ticket_app_ticket WHERE id > %s ORDER BY id LIMIT %s
+"""
+
+INSERT_COMMENTS = f"""
+INSERT INTO {TABLE}(rowid, title, body, kind, object_id, ticket_id)
+SELECT id * 2 + 1, '', content, 'comment', id, task_id
+FROM comments_app_comment WHERE id > %s ORDER BY id LIMIT %s
+"""
+
+SEARCH = f"""
+SELECT s.kind, s.object_id, s.ticket_id, t.board_id, t.title,
+       snippet({TABLE}, -1, '[', ']', '…', 16), bm25({TABLE}, 2.0, 1.0)
+FROM {TABLE} s JOIN ticket_app_ticket t ON t.id = s.ticket_id
+WHERE {TABLE} MATCH %s AND t.board_id IN ({{boards}})
+ORDER BY bm25({TABLE}, 2.0, 1.0), s.rowid
+LIMIT %s OFFSET %s
+"""
+
+_fts5_available = None
+
+
+def is_supported(conn=connection):
+    """
+    Check whether the database backend supports the FTS5 index.
+
+    The SQLite library is shared by all connections of a process, so the
+    compile option is only queried once.
+
+    Args:
+        conn: Database connection to check.
+
+    Returns:
+        bool: True for SQLite connections built with FTS5.
+    """
+    global _fts5_available
+    if conn.vendor != 'sqlite':
+        return False
+    if _fts5_available is None:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            _fts5_available = bool(cursor.fetchone()[0])
+    return _fts5_available
+
+
+def ensure_schema(conn=connection):
+    """
+    Create the FTS5 table and its sync triggers if they are missing.
+
+    SQLite drops triggers whenever a migration rebuilds the ticket or comment
+    table, so this is re-run after every migrate.
+
+    Args:
+        conn: Database connection to create the schema on.
+    """
+    if not is_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(CREATE_TABLE)
+        for statement in TRIGGERS:
+            cursor.execute(statement)
+
+
+def drop_schema(conn=connection):
+    """
+    Drop the FTS5 table and its sync triggers.
+
+    Args:
+        conn: Database connection to drop the schema from.
+    """
+    if not is_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        for statement in DROP_STATEMENTS:
+            cursor.execute(statement)
+
+
+def _copy_in_batches(cursor, insert_sql, source_table, batch_size):
+    """
+    Copy rows from a source table into the index in primary-key batches.
+
+    Args:
+        cursor: Open database cursor.
+        insert_sql (str): INSERT ... SELECT statement taking (last_id, limit).
+        source_table (str): Table to read the batch upper bound from.
+        batch_size (int): Rows per batch.
+
+    Returns:
+        int: Number of rows copied.
+    """
+    last_id, total = 0, 0
+    while True:
+        cursor.execute(insert_sql, [last_id, batch_size])
+        copied = cursor.rowcount
+        if copied <= 0:
+            return total
+        total += copied
+        cursor.execute(
+            f'SELECT MAX(id) FROM (SELECT id FROM {source_table} WHERE id > %s ORDER BY id LIMIT %s)',
+            [last_id, batch_size],
+        )
+        last_id = cursor.fetchone()[0]
+
+
+def rebuild(batch_size=1000, conn=connection):
+    """
+    Clear and repopulate the index from tickets and comments.
+
+    Args:
+        batch_size (int): Rows inserted per statement.
+        conn: Database connection to rebuild on.
+
+    Returns:
+        tuple[int, int]: Numbers of indexed tickets and comments.
+    """
+    ensure_schema(conn)
+    with conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE}')
+        tickets = _copy_in_batches(cursor, INSERT_TICKETS, 'ticket_app_ticket', batch_size)
+        comments = _copy_in_batches(cursor, INSERT_COMMENTS, 'comments_app_comment', batch_size)
+    return tickets, comments
+
+
+def build_match_expression(query):
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term; all terms must match.
+
+    Args:
+        query (str): Raw user input.
+
+    Returns:
+        str: FTS5 expression, empty if the input contains no words.
+    """
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', query))
+
+
+def search(expression, board_queryset, limit, offset, conn=connection):
+    """
+    Run a ranked search restricted to a set of boards.
+
+    Args:
+        expression (str): FTS5 MATCH expression from build_match_expression().
+        board_queryset (QuerySet): Queryset of board ids the results may come from.
+        limit (int): Maximum number of results.
+        offset (int): Number of results to skip.
+        conn: Database connection to search on.
+
+    Returns:
+        list[dict]: Matches ordered by relevance.
+    """
+    boards_sql, boards_params = board_queryset.query.sql_with_params()
+    sql = SEARCH.format(boards=boards_sql)
+    with conn.cursor() as cursor:
+        cursor.execute(sql, [expression, *boards_params, limit, offset])
+        rows = cursor.fetchall()
+    return [
+        {
+            'type': kind,
+            'id': object_id,
+            'task_id': ticket_id,
+            'board_id': board_id,
+            'task_title': title,
+            'snippet': snippet,
+            'score': round(-score, 4),
+        }
+        for kind, object_id, ticket_id, board_id, title, snippet, score in rows
+    ]
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from search_app import index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index over tickets and comments in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows inserted per statement.')
+
+    def handle(self, *args, **options):
+        if not index.is_supported():
+            raise CommandError('Full-text search requires the SQLite database backend with FTS5.')
+        tickets, comments = index.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {tickets} tickets and {comments} comments.'))
@@ -0,0 +1,101 @@
+from django.db import migrations
+
+# The schema is frozen here as it was when this migration was written;
+# search_app.index holds the current one and may change in later migrations.
+CREATE_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        title, body,
+        kind UNINDEXED, object_id UNINDEXED, ticket_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_ticket_ai AFTER INSERT ON ticket_app_ticket BEGIN
+        INSERT INTO search_index(rowid, title, body, kind, object_id, ticket_id)
+        VALUES (new.id * 2, new.title, new.description, 'ticket', new.id, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_ticket_au AFTER UPDATE OF title, description ON ticket_app_ticket BEGIN
+        UPDATE search_index SET title = new.title, body = new.description WHERE rowid = new.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_ticket_ad AFTER DELETE ON ticket_app_ticket BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_comment_ai AFTER INSERT ON comments_app_comment BEGIN
+        INSERT INTO search_index(rowid, title, body, kind, object_id, ticket_id)
+        VALUES (new.id * 2 + 1, '', new.content, 'comment', new.id, new.task_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_comment_au AFTER UPDATE OF content ON comments_app_comment BEGIN
+        UPDATE search_index SET body = new.content WHERE rowid = new.id * 2 + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_comment_ad AFTER DELETE ON comments_app_comment BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+    """
+    INSERT INTO search_index(rowid, title, body, kind, object_id, ticket_id)
+    SELECT id * 2, title, description, 'ticket', id, id FROM ticket_app_ticket
+    """,
+    """
+    INSERT INTO search_index(rowid, title, body, kind, object_id, ticket_id)
+    SELECT id * 2 + 1, '', content, 'comment', id, task_id FROM comments_app_comment
+    """,
+]
+
+DROP_SCHEMA = [
+    'DROP TRIGGER IF EXISTS search_ticket_ai',
+    'DROP TRIGGER IF EXISTS search_ticket_au',
+    'DROP TRIGGER IF EXISTS search_ticket_ad',
+    'DROP TRIGGER IF EXISTS search_comment_ai',
+    'DROP TRIGGER IF EXISTS search_comment_au',
+    'DROP TRIGGER IF EXISTS search_comment_ad',
+    'DROP TABLE IF EXISTS search_index',
+]
+
+
+def fts5_available(connection):
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def create_index(apps, schema_editor):
+    if not fts5_available(schema_editor.connection):
+        return
+    # post_migrate may already have created the current schema (e.g. after
+    # migrating to zero), so start from a clean slate.
+    for statement in DROP_SCHEMA + CREATE_SCHEMA:
+        schema_editor.execute(statement, params=None)
+
+
+def drop_index(apps, schema_editor):
+    if not fts5_available(schema_editor.connection):
+        return
+    for statement in DROP_SCHEMA:
+        schema_editor.execute(statement, params=None)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('ticket_app', '0007_ticket_role_filter_indexes'),
+        ('comments_app', '0003_alter_comment_created_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
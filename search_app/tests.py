@@ -0,0 +1,93 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from boards_app.models import Board
+from comments_app.models import Comment
+from search_app import index
+from ticket_app.models import Ticket
+
+
+class SearchTests(APITestCase):
+    """
+    Tests for the FTS5 search index and the search endpoint.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.other = User.objects.create_user('other@example.com', 'other@example.com', 'pw')
+        self.board = Board.objects.create(title='Mine', owner=self.user)
+        self.foreign = Board.objects.create(title='Foreign', owner=self.other)
+        self.ticket = Ticket.objects.create(board=self.board, title='Deploy pipeline', description='Fix the runner',
+                                            status='to-do', priority='low', rank='a')
+        self.client.force_authenticate(self.user)
+
+    def search(self, q, **params):
+        return self.client.get('/api/search/', {'q': q, **params})
+
+    def hits(self, q):
+        return [(result['type'], result['id']) for result in self.search(q).json()['results']]
+
+    def test_ticket_create_update_delete_sync(self):
+        self.assertEqual(self.hits('pipeline'), [('ticket', self.ticket.id)])
+        self.assertEqual(self.hits('run'), [('ticket', self.ticket.id)])
+        self.ticket.title = 'Release checklist'
+        self.ticket.save()
+        self.assertEqual(self.hits('pipeline'), [])
+        self.assertEqual(self.hits('checklist'), [('ticket', self.ticket.id)])
+        self.ticket.delete()
+        self.assertEqual(self.hits('checklist'), [])
+
+    def test_comment_create_update_delete_sync(self):
+        comment = Comment.objects.create(author=self.user, task=self.ticket, content='Flaky café tests')
+        results = self.search('cafe').json()['results']
+        self.assertEqual([(r['type'], r['id'], r['task_id'], r['board_id']) for r in results],
+                         [('comment', comment.id, self.ticket.id, self.board.id)])
+        self.assertIn('[café]', results[0]['snippet'])
+        comment.content = 'Stable now'
+        comment.save()
+        self.assertEqual(self.hits('flaky'), [])
+        self.assertEqual(self.hits('stable'), [('comment', comment.id)])
+        comment.delete()
+        self.assertEqual(self.hits('stable'), [])
+
+    def test_results_are_scoped_to_accessible_boards(self):
+        hidden = Ticket.objects.create(board=self.foreign, title='Deploy secrets', status='to-do',
+                                       priority='low', rank='a')
+        self.assertEqual(self.hits('deploy'), [('ticket', self.ticket.id)])
+        self.foreign.members.add(self.user)
+        self.assertCountEqual(self.hits('deploy'), [('ticket', self.ticket.id), ('ticket', hidden.id)])
+        self.board.members.add(self.other)
+        self.client.force_authenticate(self.other)
+        self.assertCountEqual(self.hits('deploy'), [('ticket', self.ticket.id), ('ticket', hidden.id)])
+
+    def test_pagination(self):
+        for number in range(3):
+            Ticket.objects.create(board=self.board, title=f'Deploy step {number}', status='to-do',
+                                  priority='low', rank='b')
+        first = self.search('deploy', page_size=3).json()
+        second = self.search('deploy', page=2, page_size=3).json()
+        self.assertEqual((len(first['results']), first['next_page']), (3, 2))
+        self.assertEqual((len(second['results']), second['next_page']), (1, None))
+
+    def test_empty_query_is_rejected(self):
+        for q in ('', '  ', '"*()'):
+            with self.subTest(q=q):
+                response = self.search(q)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('q', response.json())
+
+    def test_match_expression_quotes_words(self):
+        self.assertEqual(index.build_match_expression('deploy OR "x" NEAR'), '"deploy"* "OR"* "x"* "NEAR"*')
+        self.assertEqual(index.build_match_expression('-*'), '')
+
+    def test_rebuild_restores_index(self):
+        Comment.objects.create(author=self.user, task=self.ticket, content='note')
+        self.assertEqual(index.rebuild(batch_size=1), (1, 1))
+        self.assertEqual(self.hits('note'), [('comment', Comment.objects.get().id)])
+
+    def test_unavailable_without_fts5(self):
+        with mock.patch.object(index, 'is_supported', return_value=False):
+            response = self.search('pipeline')
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('detail', response.json())
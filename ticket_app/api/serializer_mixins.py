@@ -40,20 +40,10 @@ class CommentCountMixin(serializers.Serializer):
     Mixin to add a comments_count field to serializers.
 
     Provides:
-        comments_count (int): Number of comments related to the object.
+        comments_count (int): Number of comments related to the object, read
+            from the denormalized Ticket.comments_count column.
     """
-    comments_count = serializers.SerializerMethodField()
-    def get_comments_count(self, obj):
-        """
-        Compute the number of comments for the given object.
-
-        Args:
-            obj: The instance being serialized, expected to have a 'comments' related name.
-
-        Returns:
-            int: Total count of related Comment instances.
-        """
-        return obj.comments.count()
+    comments_count = serializers.IntegerField(read_only=True)
 
 
 class BoardIdMixin(serializers.Serializer):
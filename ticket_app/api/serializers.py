@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from ticket_app.models import Ticket
+from ticket_app.ranking import next_rank_in_column
 from .serializer_mixins import TicketReadUsersMixin, TicketWriteUsersMixin, CommentCountMixin, BoardIdMixin
 
 
@@ -28,18 +29,6 @@ class TicketBaseSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id']
 
-    def get_comments_count(self, obj):
-        """
-        Count number of comments related to this ticket.
-
-        Args:
-            obj (Ticket): The Ticket instance being serialized.
-
-        Returns:
-            int: Number of Comment instances linked to this ticket.
-        """
-        return obj.comments.count()
-
 
 class TicketSerializer(TicketBaseSerializer, TicketReadUsersMixin, BoardIdMixin, CommentCountMixin):
     """
@@ -103,6 +92,29 @@ class TicketPatchSerializer(TicketBaseSerializer, TicketWriteUsersMixin):
         fields = TicketBaseSerializer.Meta.fields + ['assignee_id', 'reviewer_id']
         read_only_fields = TicketBaseSerializer.Meta.read_only_fields
 
+    def update(self, instance, validated_data):
+        """
+        Write only the submitted fields.
+
+        Counter and rank columns are changed concurrently by other endpoints,
+        so a full-row save would overwrite them with stale values. A ticket
+        whose status changes is appended to the end of its new column.
+
+        Args:
+            instance (Ticket): Ticket being updated.
+            validated_data (dict): Validated changes.
+
+        Returns:
+            Ticket: The updated ticket.
+        """
+        if 'status' in validated_data and validated_data['status'] != instance.status:
+            validated_data['rank'] = next_rank_in_column(instance.board_id, validated_data['status'])
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
+        return instance
+
 
 class TicketPatchSuccessSerializer(TicketBaseSerializer, TicketReadUsersMixin, BoardIdMixin):
     """
@@ -123,3 +135,129 @@ class TicketPatchSuccessSerializer(TicketBaseSerializer, TicketReadUsersMixin, B
         model = Ticket
         fields = TicketBaseSerializer.Meta.fields + ['assignee', 'reviewer', 'board']
         read_only_fields = TicketBaseSerializer.Meta.read_only_fields + ['assignee', 'reviewer']
+
+
+class TaskListQuerySerializer(serializers.Serializer):
+    """
+    Serializer for filter, ordering and projection query parameters on task listings.
+
+    Fields:
+        status (str): Comma-separated list of statuses to include, optional.
+        priority (str): Comma-separated list of priorities to include, optional.
+        board (int): Restrict results to a single board, optional.
+        due_date_from (date): Earliest due date (inclusive), optional.
+        due_date_to (date): Latest due date (inclusive), optional.
+        ordering (str): Comma-separated fields to order by, '-' prefix for descending, optional.
+        fields (str): Comma-separated subset of TicketSerializer fields to return, optional.
+    """
+    ORDERING_FIELDS = ['id', 'title', 'status', 'priority', 'due_date', 'rank']
+
+    status = serializers.CharField(required=False)
+    priority = serializers.CharField(required=False)
+    board = serializers.IntegerField(required=False)
+    due_date_from = serializers.DateField(required=False)
+    due_date_to = serializers.DateField(required=False)
+    ordering = serializers.CharField(required=False)
+    fields = serializers.CharField(required=False)
+
+    def _split(self, value):
+        """
+        Split a comma-separated query value into a list of stripped, non-empty parts.
+
+        Args:
+            value (str): Raw query parameter value.
+
+        Returns:
+            list[str]: Individual values.
+        """
+        return [part.strip() for part in value.split(',') if part.strip()]
+
+    def _validate_choices(self, value, choices, name):
+        """
+        Ensure every comma-separated value is one of the allowed model choices.
+
+        Args:
+            value (str): Raw query parameter value.
+            choices (list[tuple]): Model choices to validate against.
+            name (str): Human-readable parameter name for error messages.
+
+        Returns:
+            list[str]: The validated values.
+
+        Raises:
+            ValidationError: If any value is not a valid choice.
+        """
+        allowed = {key for key, _ in choices}
+        values = self._split(value)
+        invalid = [v for v in values if v not in allowed]
+        if invalid:
+            raise serializers.ValidationError(f'Invalid {name}: {invalid}. Allowed: {sorted(allowed)}')
+        return values
+
+    def validate_status(self, value):
+        """
+        Validate the comma-separated status filter against Ticket.STATUS_CHOICES.
+        """
+        return self._validate_choices(value, Ticket.STATUS_CHOICES, 'status')
+
+    def validate_priority(self, value):
+        """
+        Validate the comma-separated priority filter against Ticket.PRIORITY_CHOICES.
+        """
+        return self._validate_choices(value, Ticket.PRIORITY_CHOICES, 'priority')
+
+    def validate_ordering(self, value):
+        """
+        Validate that every ordering term refers to an orderable field.
+        """
+        values = self._split(value)
+        invalid = [v for v in values if v.lstrip('-') not in self.ORDERING_FIELDS]
+        if invalid:
+            raise serializers.ValidationError(f'Cannot order by {invalid}. Allowed: {self.ORDERING_FIELDS}')
+        return values
+
+    def validate_fields(self, value):
+        """
+        Validate that every requested field is part of TicketSerializer output.
+        """
+        values = self._split(value)
+        invalid = [v for v in values if v not in TicketSerializer.Meta.fields]
+        if invalid:
+            raise serializers.ValidationError(f'Unknown fields {invalid}. Allowed: {TicketSerializer.Meta.fields}')
+        return values
+
+    def validate(self, attrs):
+        """
+        Ensure the due date range is not inverted.
+        """
+        start, end = attrs.get('due_date_from'), attrs.get('due_date_to')
+        if start and end and start > end:
+            raise serializers.ValidationError({'due_date_from': 'Must not be after due_date_to.'})
+        return attrs
+
+
+class DashboardQuerySerializer(serializers.Serializer):
+    """
+    Serializer for dashboard query parameters.
+
+    Fields:
+        upcoming (int): Number of upcoming deadlines to return (1-50, default 5).
+    """
+    upcoming = serializers.IntegerField(required=False, default=5, min_value=1, max_value=50)
+
+
+class TicketMoveSerializer(serializers.Serializer):
+    """
+    Serializer for moving a ticket within or between status columns.
+
+    The ticket is placed directly after `after_id` and/or directly before
+    `before_id`; with neither, it is appended to the end of the column.
+
+    Fields:
+        status (str): Target status column, defaults to the current status.
+        after_id (int): Ticket in the target column to place this one after, optional.
+        before_id (int): Ticket in the target column to place this one before, optional.
+    """
+    status = serializers.ChoiceField(choices=Ticket.STATUS_CHOICES, required=False)
+    after_id = serializers.IntegerField(required=False, allow_null=True)
+    before_id = serializers.IntegerField(required=False, allow_null=True)
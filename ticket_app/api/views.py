@@ -2,12 +2,23 @@ from rest_framework import generics, status, mixins
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied, NotFound, ValidationError
 from rest_framework.response import Response
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
 
 from boards_app.models import Board
+from boards_app.versioning import bump_board_version
 from ticket_app.models import Ticket
-from .serializers import TicketSerializer, TicketCreateSerializer, TicketPatchSerializer, TicketPatchSuccessSerializer
+from ticket_app.ranking import rank_between, needs_rebalance, next_rank_in_column, rebalance_column
+from .rows import ticket_rows
+from .serializers import TicketSerializer, TicketCreateSerializer, TicketPatchSerializer, TicketPatchSuccessSerializer, TaskListQuerySerializer, DashboardQuerySerializer, TicketMoveSerializer
+from core import metrics
 from core.decorators import handle_exceptions
+from idempotency_app.decorators import idempotent
+from jobs_app.registry import enqueue
 
 class TicketPostView(generics.CreateAPIView):
     """
@@ -18,13 +29,16 @@ class TicketPostView(generics.CreateAPIView):
       - Optionally validates 'assignee_id' and 'reviewer_id'.
       - Ensures the requesting user has permission to add tickets to the board.
       - Returns the created ticket with full details.
+      - Retries with the same Idempotency-Key replay the stored response.
 
     Attributes:
         serializer_class (Serializer): Serializer for ticket creation.
         permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
     """
     serializer_class = TicketCreateSerializer
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'tasks'
 
     def get_board(self):
         """
@@ -65,7 +79,7 @@ class TicketPostView(generics.CreateAPIView):
 
     def perform_create(self, serializer, board):
         """
-        Save the new Ticket, ensuring permission on the board.
+        Save the new Ticket at the end of its status column, ensuring permission on the board.
 
         Args:
             serializer (Serializer): Validated serializer instance.
@@ -77,8 +91,9 @@ class TicketPostView(generics.CreateAPIView):
         user = self.request.user
         if not (board.owner_id == user.id or board.members.filter(id=user.id).exists()):
             raise PermissionDenied(detail="You are not authorized to create tickets on this board.")
-        serializer.save(board=board)
+        serializer.save(board=board, rank=next_rank_in_column(board.id, serializer.validated_data['status']))
 
+    @idempotent(scope='tasks.create')
     @handle_exceptions(action='creating ticket')
     def create(self, request, *args, **kwargs):
         """
@@ -113,44 +128,113 @@ class TaskRoleListView(generics.ListAPIView):
     GET:
       - Returns tickets where the requesting user is either assignee or reviewer,
         depending on the `role` attribute.
+      - Supports the query parameters `status`, `priority`, `board`,
+        `due_date_from`, `due_date_to`, `ordering` and `fields`
+        (see TaskListQuerySerializer).
+      - Rows are rendered by the read-only fast path in ticket_app.api.rows,
+        which matches TicketSerializer output.
 
     Attributes:
         serializer_class (Serializer): Serializer for ticket read operations.
         permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
         role (str): Must be set to 'assignee' or 'reviewer' in subclasses.
     """
     serializer_class = TicketSerializer
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'tasks'
     role: str
 
+    def get_query_params(self):
+        """
+        Validate and cache the filter, ordering and projection query parameters.
+
+        Raises:
+            ValidationError: If any query parameter is invalid.
+
+        Returns:
+            dict: Validated query parameters.
+        """
+        if not hasattr(self, '_query_params'):
+            serializer = TaskListQuerySerializer(data=self.request.query_params)
+            serializer.is_valid(raise_exception=True)
+            self._query_params = serializer.validated_data
+        return self._query_params
+
+    def get_requested_fields(self):
+        """
+        Return the output fields requested via `fields=`, or all serializer fields.
+
+        Returns:
+            list[str]: Field names to serialize.
+        """
+        return self.get_query_params().get('fields') or TicketSerializer.Meta.fields
+
     def get_queryset(self):
         """
         Retrieve tickets filtered by role and requesting user.
 
+        Filters and ordering are applied in SQL; the projection to the
+        requested columns happens in list(). The ordering always ends with
+        `id`, so pages over non-unique fields such as priority are stable.
+
         Raises:
             NotFound: If `role` is not 'assignee' or 'reviewer'.
+            ValidationError: If the query parameters are invalid.
 
         Returns:
             QuerySet: Tickets matching the user's role.
         """
         user = self.request.user
         if self.role == 'assignee':
-            return Ticket.objects.filter(assignee=user)
-        if self.role == 'reviewer':
-            return Ticket.objects.filter(reviewer=user)
-        raise NotFound('Invalid role specification.')
+            qs = Ticket.objects.filter(assignee=user)
+        elif self.role == 'reviewer':
+            qs = Ticket.objects.filter(reviewer=user)
+        else:
+            raise NotFound('Invalid role specification.')
+        params = self.get_query_params()
+        qs = self.filter_queryset_by_params(qs, params)
+        ordering = list(params.get('ordering') or [])
+        if not any(term.lstrip('-') == 'id' for term in ordering):
+            ordering.append('id')
+        return qs.order_by(*ordering)
 
     @handle_exceptions(action='retrieving tasks')
     def list(self, request, *args, **kwargs):
         """
-        Handle GET request to list tickets for the role.
+        Handle GET request to list tickets.
+
+        Only the columns of the requested fields are selected, and users are
+        joined only when requested.
+
+        Returns:
+            Response: HTTP 200 with the list of serialized tickets.
+        """
+        rows = ticket_rows(self.get_queryset(), self.get_requested_fields())
+        return Response(rows, status=status.HTTP_200_OK)
+
+    def filter_queryset_by_params(self, qs, params):
+        """
+        Apply status, priority, board and due-date filters.
+
+        Args:
+            qs (QuerySet): Base Ticket queryset.
+            params (dict): Validated query parameters.
 
         Returns:
-            Response: HTTP 200 with serialized list of tickets.
+            QuerySet: Filtered queryset.
         """
-        qs = self.get_queryset()
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if params.get('status'):
+            qs = qs.filter(status__in=params['status'])
+        if params.get('priority'):
+            qs = qs.filter(priority__in=params['priority'])
+        if 'board' in params:
+            qs = qs.filter(board_id=params['board'])
+        if 'due_date_from' in params:
+            qs = qs.filter(due_date__gte=params['due_date_from'])
+        if 'due_date_to' in params:
+            qs = qs.filter(due_date__lte=params['due_date_to'])
+        return qs
 
 
 class TaskAssigneeView(TaskRoleListView):
@@ -186,10 +270,12 @@ class TicketPatchDeleteView(
 
     Attributes:
         permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
         serializer_class (Serializer): Serializer for ticket patch.
         queryset (QuerySet): Base queryset of all tickets.
     """
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'tasks'
     serializer_class = TicketPatchSerializer
     queryset = Ticket.objects.all()
 
@@ -270,4 +356,275 @@ class TicketPatchDeleteView(
         """
         ticket = self.get_object()
         ticket.delete()
+        bump_board_version(ticket.board_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TicketMoveView(generics.GenericAPIView):
+    """
+    API endpoint to move a ticket to a position within a status column.
+
+    PATCH:
+      - Validates that the user can modify the ticket (board membership).
+      - Computes a rank key between the requested neighbours and writes the new
+        status and rank with a single-row UPDATE.
+      - Enqueues a rebalance of the column when keys grow too long, at most
+        one waiting rebalance per column.
+
+    Attributes:
+        permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+        serializer_class (Serializer): Serializer for move input.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'tasks'
+    serializer_class = TicketMoveSerializer
+
+    def get_object(self):
+        """
+        Retrieve the Ticket instance and enforce board access.
+
+        Raises:
+            NotFound: If the ticket does not exist.
+            PermissionDenied: If the user is not owner or member of the board.
+
+        Returns:
+            Ticket: The requested ticket instance.
+        """
+        try:
+            ticket = Ticket.objects.select_related('board').only(
+                'id', 'status', 'rank', 'board__id', 'board__owner_id'
+            ).get(pk=self.kwargs.get('pk'))
+        except Ticket.DoesNotExist:
+            raise NotFound('Ticket not found.')
+        board = ticket.board
+        user = self.request.user
+        if not (board.owner_id == user.id or board.members.filter(id=user.id).exists()):
+            raise PermissionDenied("You must be a member of the board to move this task.")
+        return ticket
+
+    @handle_exceptions(action='moving ticket')
+    def patch(self, request, *args, **kwargs):
+        """
+        Handle PATCH request to move a ticket.
+
+        Returns:
+            Response: HTTP 200 with {id, status, rank} of the moved ticket.
+        """
+        ticket = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        new_status = data.get('status', ticket.status)
+        column = Ticket.objects.filter(board_id=ticket.board_id, status=new_status).exclude(pk=ticket.pk)
+
+        with transaction.atomic():
+            rank = self.compute_rank(column, data.get('after_id'), data.get('before_id'))
+            if rank is None:
+                rebalance_column(ticket.board_id, new_status)
+                rank = self.compute_rank(column, data.get('after_id'), data.get('before_id'))
+                if rank is None:
+                    raise ValidationError({'before_id': 'Must come after after_id in the column.'})
+            Ticket.objects.filter(pk=ticket.pk).update(status=new_status, rank=rank)
+            bump_board_version(ticket.board_id)
+            if needs_rebalance(rank):
+                enqueue(
+                    'tickets.rebalance_column', {'board_id': ticket.board_id, 'status': new_status},
+                    dedupe_key=f'tickets.rebalance_column:{ticket.board_id}:{new_status}',
+                )
+        return Response({'id': ticket.id, 'status': new_status, 'rank': rank}, status=status.HTTP_200_OK)
+
+    def get_neighbour_rank(self, column, ticket_id, field):
+        """
+        Look up the rank of a neighbour ticket in the target column.
+
+        Args:
+            column (QuerySet): Tickets of the target column, excluding the moved one.
+            ticket_id (int): Neighbour ticket ID.
+            field (str): Request field name for error messages.
+
+        Raises:
+            ValidationError: If the neighbour is not in the target column.
+
+        Returns:
+            str: The neighbour's rank.
+        """
+        rank = column.filter(pk=ticket_id).values_list('rank', flat=True).first()
+        if rank is None:
+            raise ValidationError({field: 'Ticket is not in the target column.'})
+        return rank
+
+    def compute_rank(self, column, after_id, before_id):
+        """
+        Compute a rank between the requested neighbours.
+
+        A missing neighbour is resolved to the adjacent ticket in the column,
+        so the result always sits between two consecutive keys.
+
+        Args:
+            column (QuerySet): Tickets of the target column, excluding the moved one.
+            after_id (int | None): Ticket to place after.
+            before_id (int | None): Ticket to place before.
+
+        Returns:
+            str | None: The new rank, or None if the neighbours leave no room
+                (or only for an over-long key) and the column must be rebalanced first.
+        """
+        after = self.get_neighbour_rank(column, after_id, 'after_id') if after_id else None
+        before = self.get_neighbour_rank(column, before_id, 'before_id') if before_id else None
+        if after is not None and before is None:
+            before = column.filter(rank__gt=after).order_by('rank').values_list('rank', flat=True).first()
+        elif before is not None and after is None:
+            after = column.filter(rank__lt=before).order_by('-rank').values_list('rank', flat=True).first()
+        elif after is None and before is None:
+            after = column.order_by('-rank').values_list('rank', flat=True).first()
+        try:
+            rank = rank_between(after, before)
+        except ValueError:
+            return None
+        return rank if len(rank) <= Ticket._meta.get_field('rank').max_length else None
+
+
+class DashboardView(generics.GenericAPIView):
+    """
+    API endpoint returning the "my work" dashboard of the requesting user.
+
+    GET:
+      - Returns per-board and overall ticket counts by status and priority,
+        overdue counts and counts of tickets assigned to / reviewed by the user,
+        computed with a single grouped aggregate query over accessible boards.
+      - Returns the next `upcoming` due tickets assigned to or reviewed by the user.
+      - Results are cached per user for DASHBOARD_CACHE_TTL seconds.
+
+    Attributes:
+        permission_classes (list): Requires authentication.
+        throttle_scope (str): Rate limit group (see core.throttling).
+        serializer_class (Serializer): Serializer for query parameter validation.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'tasks'
+    serializer_class = DashboardQuerySerializer
+
+    @handle_exceptions(action='retrieving dashboard')
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET request for the dashboard.
+
+        Returns:
+            Response: HTTP 200 with overall counts, per-board counts and upcoming deadlines.
+        """
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        limit = serializer.validated_data['upcoming']
+        key = f'dashboard:{request.user.id}:{limit}'
+        data = cache.get(key)
+        metrics.cache_requests.inc(cache='dashboard', result='miss' if data is None else 'hit')
+        if data is None:
+            data = self.build_dashboard(request.user, limit)
+            cache.set(key, data, getattr(settings, 'DASHBOARD_CACHE_TTL', 30))
+        return Response(data, status=status.HTTP_200_OK)
+
+    def build_dashboard(self, user, limit):
+        """
+        Compute the dashboard payload for a user.
+
+        Args:
+            user (User): The requesting user.
+            limit (int): Number of upcoming deadlines to include.
+
+        Returns:
+            dict: Payload with 'overall', 'boards' and 'upcoming_deadlines'.
+        """
+        today = timezone.localdate()
+        overall = self.empty_counts()
+        boards = {}
+        for row in self.aggregate_rows(user, today):
+            board = boards.setdefault(row['board_id'], {
+                'id': row['board_id'], 'title': row['board__title'], **self.empty_counts(),
+            })
+            for counts in (overall, board):
+                self.add_row(counts, row)
+        return {
+            'overall': overall,
+            'boards': sorted(boards.values(), key=lambda b: b['id']),
+            'upcoming_deadlines': self.upcoming_deadlines(user, today, limit),
+        }
+
+    def aggregate_rows(self, user, today):
+        """
+        Run the grouped aggregate over all tickets on boards the user can access.
+
+        Args:
+            user (User): The requesting user.
+            today (date): Reference date for overdue tickets.
+
+        Returns:
+            QuerySet: Rows grouped by board, status and priority with counts.
+        """
+        accessible = Board.objects.accessible_to(user).values('id')
+        open_overdue = Q(due_date__lt=today) & ~Q(status='done')
+        return (
+            Ticket.objects.filter(board_id__in=accessible)
+            .values('board_id', 'board__title', 'status', 'priority')
+            .annotate(
+                total=Count('id'),
+                overdue=Count('id', filter=open_overdue),
+                assigned_to_me=Count('id', filter=Q(assignee=user)),
+                reviewing=Count('id', filter=Q(reviewer=user)),
+            )
+            .order_by()
+        )
+
+    def upcoming_deadlines(self, user, today, limit):
+        """
+        Fetch the next open tickets by due date that the user works on or reviews,
+        on boards the user can still access.
+
+        Args:
+            user (User): The requesting user.
+            today (date): Reference date; earlier due dates are excluded.
+            limit (int): Maximum number of tickets.
+
+        Returns:
+            list[dict]: Ticket summaries ordered by due date.
+        """
+        rows = (
+            Ticket.objects.filter(
+                Q(assignee=user) | Q(reviewer=user),
+                board_id__in=Board.objects.accessible_to(user).values('id'),
+                due_date__gte=today,
+            )
+            .exclude(status='done')
+            .order_by('due_date', 'id')
+            .values('id', 'title', 'board_id', 'status', 'priority', 'due_date')[:limit]
+        )
+        return [{**row, 'due_date': row['due_date'].isoformat()} for row in rows]
+
+    def empty_counts(self):
+        """
+        Build a zeroed counter structure covering all statuses and priorities.
+
+        Returns:
+            dict: Counters for totals, overdue, role counts and histograms.
+        """
+        return {
+            'total': 0,
+            'overdue': 0,
+            'assigned_to_me': 0,
+            'reviewing': 0,
+            'by_status': {key: 0 for key, _ in Ticket.STATUS_CHOICES},
+            'by_priority': {key: 0 for key, _ in Ticket.PRIORITY_CHOICES},
+        }
+
+    def add_row(self, counts, row):
+        """
+        Add one aggregate row to a counter structure.
+
+        Args:
+            counts (dict): Counter structure from empty_counts().
+            row (dict): Aggregate row from aggregate_rows().
+        """
+        for name in ('total', 'overdue', 'assigned_to_me', 'reviewing'):
+            counts[name] += row[name]
+        counts['by_status'][row['status']] = counts['by_status'].get(row['status'], 0) + row['total']
+        counts['by_priority'][row['priority']] = counts['by_priority'].get(row['priority'], 0) + row['total']
@@ -0,0 +1,16 @@
+from jobs_app.registry import register
+from ticket_app.ranking import rebalance_column
+
+
+@register('tickets.rebalance_column')
+def rebalance(payload):
+    """
+    Rewrite the rank keys of one status column.
+
+    Args:
+        payload (dict): {'board_id': int, 'status': str}
+
+    Returns:
+        dict: Number of re-ranked tickets.
+    """
+    return {'ranked': rebalance_column(payload['board_id'], payload['status'])}
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_rename_owner_id_board_owner_board_created_at_and_more'),
+        ('ticket_app', '0006_delete_comment'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['assignee', 'status', 'due_date'], name='ticket_assignee_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['reviewer', 'status', 'due_date'], name='ticket_reviewer_status_idx'),
+        ),
+    ]
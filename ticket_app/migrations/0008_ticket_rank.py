@@ -0,0 +1,56 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Copied from ticket_app.ranking so that later changes to the live module do
+# not change what this migration writes.
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+
+
+def spread_ranks(count):
+    width = 1
+    while BASE ** width <= count * 4:
+        width += 1
+    step = BASE ** width // (count + 1)
+    keys = []
+    for position in range(1, count + 1):
+        value, digits = position * step, []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        keys.append(''.join(reversed(digits)))
+    return keys
+
+
+def rank_existing_tickets(apps, schema_editor):
+    Ticket = apps.get_model('ticket_app', 'Ticket')
+    columns = Ticket.objects.values_list('board_id', 'status').distinct()
+    for board_id, status in columns:
+        tickets = list(Ticket.objects.filter(board_id=board_id, status=status).order_by('id').only('id'))
+        for ticket, rank in zip(tickets, spread_ranks(len(tickets))):
+            ticket.rank = rank
+        Ticket.objects.bulk_update(tickets, ['rank'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_rename_owner_id_board_owner_board_created_at_and_more'),
+        ('ticket_app', '0007_ticket_role_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='rank',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['board', 'status', 'rank'], name='ticket_column_rank_idx'),
+        ),
+        migrations.RunPython(rank_existing_tickets, migrations.RunPython.noop),
+    ]
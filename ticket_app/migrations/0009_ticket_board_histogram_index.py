@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_members_user_board_index'),
+        ('ticket_app', '0008_ticket_rank'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['board', 'status', 'priority'], name='ticket_board_histogram_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:57
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_existing_comments(apps, schema_editor):
+    Ticket = apps.get_model('ticket_app', 'Ticket')
+    Comment = apps.get_model('comments_app', 'Comment')
+    counted = (Comment.objects.filter(task_id=OuterRef('pk')).order_by()
+               .values('task_id').annotate(count=Count('*')).values('count'))
+    Ticket.objects.update(comments_count=Coalesce(Subquery(counted), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments_app', '0003_alter_comment_created_at'),
+        ('ticket_app', '0009_ticket_board_histogram_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_existing_comments, migrations.RunPython.noop),
+    ]
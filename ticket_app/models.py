@@ -25,6 +25,10 @@ class Ticket(models.Model):
         assignee (User): User assigned to work on the ticket (optional).
         reviewer (User): User responsible for reviewing the completed ticket (optional).
         due_date (date): Deadline for the ticket (optional).
+        rank (str): Lexicographic position of the ticket within its status column
+            (see ticket_app.ranking).
+        comments_count (int): Number of comments on the ticket, maintained by the
+            comment endpoints (see comments_app.counters).
     """
     STATUS_CHOICES = [
         ('to-do', 'To Do'),
@@ -46,6 +50,16 @@ class Ticket(models.Model):
     assignee = models.ForeignKey(User, related_name='assigned_tickets', on_delete=models.SET_NULL, null=True, blank=True)
     reviewer = models.ForeignKey(User, related_name='review_tickets', on_delete=models.SET_NULL, null=True, blank=True)
     due_date = models.DateField(null=True, blank=True)
+    rank = models.CharField(max_length=64, blank=True, default='')
+    comments_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'status', 'rank'], name='ticket_column_rank_idx'),
+            models.Index(fields=['board', 'status', 'priority'], name='ticket_board_histogram_idx'),
+            models.Index(fields=['assignee', 'status', 'due_date'], name='ticket_assignee_status_idx'),
+            models.Index(fields=['reviewer', 'status', 'due_date'], name='ticket_reviewer_status_idx'),
+        ]
 
     def __str__(self):
         """
@@ -0,0 +1,137 @@
+"""
+Lexicographic rank keys for ordering tickets within a status column.
+
+Keys are strings over an ASCII-ordered base-62 alphabet, so they sort the same
+way in Python and in the database's binary collation. A key strictly between
+any two existing keys can always be generated without touching other rows;
+keys only grow longer when the same gap is split repeatedly, which is what
+rebalance_column() resets.
+"""
+from django.db import transaction
+
+from boards_app.versioning import bump_board_version
+
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+
+# Keys longer than this trigger a rebalance of their column.
+REBALANCE_LENGTH = 12
+
+
+def rank_between(low=None, high=None):
+    """
+    Generate a rank key strictly between two keys.
+
+    Args:
+        low (str | None): Lower neighbour key, or None for the column start.
+        high (str | None): Upper neighbour key, or None for the column end.
+
+    Returns:
+        str: A key with low < key < high, never ending in the lowest digit.
+
+    Raises:
+        ValueError: If low >= high, or no key fits between them.
+    """
+    low = low or ''
+    if high is not None and low >= high:
+        raise ValueError(f'Cannot rank between {low!r} and {high!r}.')
+    result = []
+    bounded = high is not None
+    i = 0
+    while True:
+        lo = DIGITS.index(low[i]) if i < len(low) else 0
+        if bounded:
+            if i >= len(high):
+                raise ValueError(f'No rank available between {low!r} and {high!r}.')
+            hi = DIGITS.index(high[i])
+        else:
+            hi = BASE
+        if hi - lo > 1:
+            result.append(DIGITS[(lo + hi) // 2])
+            return ''.join(result)
+        result.append(DIGITS[lo])
+        if hi - lo == 1:
+            bounded = False
+        i += 1
+
+
+def spread_ranks(count):
+    """
+    Generate evenly spaced, equally long keys for a column of `count` tickets.
+
+    Args:
+        count (int): Number of keys to generate.
+
+    Returns:
+        list[str]: Ascending keys.
+    """
+    width = 1
+    while BASE ** width <= count * 4:
+        width += 1
+    step = BASE ** width // (count + 1)
+    keys = []
+    for position in range(1, count + 1):
+        value, digits = position * step, []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        keys.append(''.join(reversed(digits)))
+    return keys
+
+
+def needs_rebalance(rank):
+    """
+    Check whether a key has grown long enough to rebalance its column.
+
+    Args:
+        rank (str): Rank key.
+
+    Returns:
+        bool: True if the column should be rebalanced.
+    """
+    return len(rank) > REBALANCE_LENGTH
+
+
+def next_rank_in_column(board_id, status):
+    """
+    Generate a key placing a ticket at the end of a column.
+
+    Args:
+        board_id (int): Board of the column.
+        status (str): Status of the column.
+
+    Returns:
+        str: A key greater than every key in the column.
+    """
+    from .models import Ticket
+
+    last = (
+        Ticket.objects.filter(board_id=board_id, status=status)
+        .order_by('-rank').values_list('rank', flat=True).first()
+    )
+    return rank_between(last, None)
+
+
+def rebalance_column(board_id, status):
+    """
+    Rewrite all keys of a column to short, evenly spaced ones, keeping order.
+
+    Args:
+        board_id (int): Board of the column.
+        status (str): Status of the column.
+
+    Returns:
+        int: Number of tickets re-ranked.
+    """
+    from .models import Ticket
+
+    with transaction.atomic():
+        tickets = list(
+            Ticket.objects.select_for_update().filter(board_id=board_id, status=status)
+            .order_by('rank', 'id').only('id', 'rank')
+        )
+        for ticket, rank in zip(tickets, spread_ranks(len(tickets))):
+            ticket.rank = rank
+        Ticket.objects.bulk_update(tickets, ['rank'], batch_size=500)
+        bump_board_version(board_id)
+    return len(tickets)
@@ -1,3 +1,243 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from boards_app.api.serializers import TicketNestedSerializer
+from boards_app.models import Board
+from ticket_app.api.rows import NESTED_TICKET_FIELDS, TICKET_FIELDS, ticket_rows
+from ticket_app.api.serializers import TicketSerializer
+from ticket_app.models import Ticket
+from ticket_app.ranking import needs_rebalance, next_rank_in_column, rank_between, rebalance_column, spread_ranks
+from jobs_app.models import Job
+
+
+class TicketRowsParityTests(APITestCase):
+    """
+    The values() fast path must render exactly like the DRF serializers.
+    """
+    def setUp(self):
+        self.named = User.objects.create_user('named@example.com', 'named@example.com', 'pw',
+                                              first_name='Ada', last_name='Lovelace')
+        self.first_only = User.objects.create_user('first@example.com', 'first@example.com', 'pw', first_name='Grace')
+        self.unnamed = User.objects.create_user('unnamed@example.com', 'unnamed@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.named)
+        Ticket.objects.create(board=self.board, title='Full', description='Ünïcode „text“', status='to-do',
+                              priority='high', assignee=self.named, reviewer=self.unnamed,
+                              due_date=datetime.date(2024, 2, 29), rank='a', comments_count=3)
+        Ticket.objects.create(board=self.board, title='Empty', status='done', priority='low', rank='b')
+        Ticket.objects.create(board=self.board, title='Partial', status='review', priority='medium',
+                              reviewer=self.first_only, rank='c')
+        self.tickets = Ticket.objects.order_by('rank', 'id')
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_ticket_serializer_parity(self):
+        expected = TicketSerializer(self.tickets.select_related('assignee', 'reviewer'), many=True).data
+        self.assertEqual(self.render(ticket_rows(self.tickets)), self.render(expected))
+
+    def test_sparse_fields_parity(self):
+        for fields in (['id'], ['title', 'assignee'], ['comments_count', 'due_date', 'board'], ['reviewer', 'id']):
+            with self.subTest(fields=fields):
+                full = TicketSerializer(self.tickets.select_related('assignee', 'reviewer'), many=True).data
+                expected = [{name: row[name] for name in TICKET_FIELDS if name in fields} for row in full]
+                self.assertEqual(self.render(ticket_rows(self.tickets, fields)), self.render(expected))
+
+    def test_nested_serializer_parity(self):
+        self.assertEqual(NESTED_TICKET_FIELDS, TicketNestedSerializer.Meta.fields)
+        expected = TicketNestedSerializer(self.tickets, many=True).data
+        self.assertEqual(self.render(ticket_rows(self.tickets, NESTED_TICKET_FIELDS)), self.render(expected))
+
+    def test_fields_match_serializer(self):
+        self.assertEqual(TICKET_FIELDS, TicketSerializer.Meta.fields)
+
+    def test_task_list_endpoint_parity(self):
+        self.client.force_authenticate(self.named)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/tasks/assigned-to-me/')
+        expected = TicketSerializer(Ticket.objects.filter(assignee=self.named).order_by('id'), many=True).data
+        self.assertEqual(response.content, self.render(expected))
+
+    def test_ordering_ends_with_id(self):
+        for ticket in Ticket.objects.all():
+            ticket.assignee, ticket.priority = self.named, 'high'
+            ticket.save()
+        self.client.force_authenticate(self.named)
+        ids = list(Ticket.objects.order_by('id').values_list('id', flat=True))
+        for ordering in ('priority', '-priority'):
+            with self.subTest(ordering=ordering):
+                response = self.client.get('/api/tasks/assigned-to-me/', {'ordering': ordering, 'fields': 'id'})
+                self.assertEqual([row['id'] for row in response.json()], ids)
+        response = self.client.get('/api/tasks/assigned-to-me/', {'ordering': 'priority,-id', 'fields': 'id'})
+        self.assertEqual([row['id'] for row in response.json()], ids[::-1])
+
+
+class DashboardTests(APITestCase):
+    """
+    Tests for the cross-board dashboard.
+    """
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.other = User.objects.create_user('other@example.com', 'other@example.com', 'pw')
+        self.board = Board.objects.create(title='Mine', owner=self.user)
+        self.shared = Board.objects.create(title='Shared', owner=self.other)
+        self.shared.members.add(self.user)
+        self.foreign = Board.objects.create(title='Foreign', owner=self.other)
+        today = datetime.date.today()
+        self.soon = Ticket.objects.create(board=self.board, title='soon', status='to-do', priority='high',
+                                          assignee=self.user, due_date=today + datetime.timedelta(days=1), rank='a')
+        Ticket.objects.create(board=self.board, title='late', status='review', priority='low',
+                              reviewer=self.user, due_date=today - datetime.timedelta(days=1), rank='b')
+        Ticket.objects.create(board=self.board, title='finished', status='done', priority='low',
+                              assignee=self.user, due_date=today - datetime.timedelta(days=1), rank='c')
+        self.later = Ticket.objects.create(board=self.shared, title='later', status='in-progress', priority='medium',
+                                           reviewer=self.user, due_date=today + datetime.timedelta(days=3), rank='a')
+        Ticket.objects.create(board=self.foreign, title='hidden', status='to-do', priority='high',
+                              assignee=self.user, due_date=today + datetime.timedelta(days=2), rank='a')
+        self.client.force_authenticate(self.user)
+
+    def test_counts_cover_accessible_boards_only(self):
+        data = self.client.get('/api/dashboard/').json()
+        overall = data['overall']
+        self.assertEqual((overall['total'], overall['overdue'], overall['assigned_to_me'], overall['reviewing']),
+                         (4, 1, 2, 2))
+        self.assertEqual(overall['by_status'], {'to-do': 1, 'in-progress': 1, 'review': 1, 'done': 1})
+        self.assertEqual(overall['by_priority'], {'low': 2, 'medium': 1, 'high': 1})
+        self.assertEqual([board['title'] for board in data['boards']], ['Mine', 'Shared'])
+        self.assertEqual(data['boards'][1]['total'], 1)
+
+    def test_upcoming_deadlines_exclude_inaccessible_boards(self):
+        data = self.client.get('/api/dashboard/', {'upcoming': 5}).json()
+        self.assertEqual([row['id'] for row in data['upcoming_deadlines']], [self.soon.id, self.later.id])
+        self.assertEqual(data['upcoming_deadlines'][0]['due_date'], self.soon.due_date.isoformat())
+
+    def test_removed_member_no_longer_sees_board_tickets(self):
+        self.shared.members.remove(self.user)
+        data = self.client.get('/api/dashboard/').json()
+        self.assertEqual([board['title'] for board in data['boards']], ['Mine'])
+        self.assertEqual([row['id'] for row in data['upcoming_deadlines']], [self.soon.id])
+
+    def test_cached_per_user(self):
+        self.client.get('/api/dashboard/')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/api/dashboard/').status_code, 200)
+
+
+class TicketRankTests(APITestCase):
+    """
+    Tests for rank keys, column rebalancing and the move endpoint.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pw')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.tickets = [
+            Ticket.objects.create(board=self.board, title=name, status='to-do', priority='low', rank=rank)
+            for name, rank in (('a', 'G'), ('b', 'V'), ('c', 'k'))
+        ]
+        self.client.force_authenticate(self.user)
+
+    def column(self, status='to-do'):
+        return list(Ticket.objects.filter(board=self.board, status=status).order_by('rank').values_list('title', flat=True))
+
+    def move(self, ticket, **data):
+        return self.client.patch(f'/api/tasks/{ticket.id}/move/', data, format='json')
+
+    def test_rank_between_orders_keys(self):
+        self.assertEqual(rank_between(None, None), 'V')
+        self.assertEqual(rank_between('a', 'b'), 'aV')
+        self.assertEqual(rank_between('az', 'b'), 'azV')
+        self.assertEqual(rank_between(None, '1'), '0V')
+        self.assertGreater(rank_between('zz', None), 'zz')
+        with self.assertRaises(ValueError):
+            rank_between('b', 'a')
+        with self.assertRaises(ValueError):
+            rank_between('a', 'a0')
+
+    def test_repeated_splits_stay_ordered(self):
+        low, high, keys = 'a', 'b', []
+        for _ in range(100):
+            key = rank_between(low, high)
+            self.assertTrue(low < key < high)
+            keys.append(key)
+            high = key
+        self.assertTrue(needs_rebalance(keys[-1]))
+        self.assertFalse(needs_rebalance(keys[0]))
+
+    def test_spread_ranks_are_even_and_sorted(self):
+        for count in (1, 5, 200):
+            keys = spread_ranks(count)
+            self.assertEqual(keys, sorted(set(keys)))
+            self.assertEqual(len({len(key) for key in keys}), 1)
+
+    def test_rebalance_keeps_order(self):
+        Ticket.objects.filter(pk=self.tickets[1].pk).update(rank='V' + 'V' * 20)
+        self.assertEqual(rebalance_column(self.board.id, 'to-do'), 3)
+        ranks = list(Ticket.objects.filter(board=self.board).order_by('rank').values_list('rank', flat=True))
+        self.assertEqual(self.column(), ['a', 'b', 'c'])
+        self.assertTrue(all(not needs_rebalance(rank) for rank in ranks))
+
+    def test_next_rank_appends(self):
+        self.assertGreater(next_rank_in_column(self.board.id, 'to-do'), 'k')
+        self.assertEqual(next_rank_in_column(self.board.id, 'done'), 'V')
+
+    def test_move_within_column(self):
+        a, b, c = self.tickets
+        response = self.move(c, after_id=a.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column(), ['a', 'c', 'b'])
+        self.move(a, before_id=b.id)
+        self.assertEqual(self.column(), ['c', 'a', 'b'])
+        self.move(c)
+        self.assertEqual(self.column(), ['a', 'b', 'c'])
+
+    def test_move_to_other_column(self):
+        a, b, c = self.tickets
+        self.move(b, status='done')
+        self.move(c, status='done', before_id=b.id)
+        self.assertEqual(self.column(), ['a'])
+        self.assertEqual(self.column('done'), ['c', 'b'])
+
+    def test_move_rejects_neighbours_outside_column(self):
+        a, b, c = self.tickets
+        response = self.move(a, status='done', after_id=b.id)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('after_id', response.json())
+        response = self.move(a, after_id=c.id, before_id=b.id)
+        self.assertEqual(response.status_code, 400)
+
+    def test_move_without_room_rebalances_inline(self):
+        a, b, c = self.tickets
+        Ticket.objects.filter(pk=a.pk).update(rank='a')
+        Ticket.objects.filter(pk=b.pk).update(rank='a0')
+        Ticket.objects.filter(pk=c.pk).update(rank='b')
+        response = self.move(c, after_id=a.id, before_id=b.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column(), ['a', 'c', 'b'])
+
+    def test_long_key_enqueues_rebalance(self):
+        a, b, c = self.tickets
+        Ticket.objects.filter(pk=b.pk).update(rank='G' + '0' * 11 + '1')
+        self.move(c, after_id=a.id, before_id=b.id)
+        job = Job.objects.get(name='tickets.rebalance_column')
+        self.assertEqual(job.payload, {'board_id': self.board.id, 'status': 'to-do'})
+        self.move(a, after_id=c.id, before_id=b.id)
+        self.assertEqual(Job.objects.filter(name='tickets.rebalance_column').count(), 1)
+
+    def test_move_requires_membership(self):
+        stranger = User.objects.create_user('stranger@example.com', 'stranger@example.com', 'pw')
+        self.client.force_authenticate(stranger)
+        self.assertEqual(self.move(self.tickets[0]).status_code, 403)
+
+    def test_patch_status_appends_to_new_column(self):
+        a, b, c = self.tickets
+        Ticket.objects.create(board=self.board, title='d', status='done', priority='low', rank='z')
+        response = self.client.patch(f'/api/tasks/{a.id}/', {'status': 'done'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column('done'), ['d', 'a'])
+        self.client.patch(f'/api/tasks/{b.id}/', {'status': 'to-do', 'title': 'b2'}, format='json')
+        b.refresh_from_db()
+        self.assertEqual(b.rank, 'V')